@@ -1,15 +1,25 @@
 # External
 import logging
 from datetime import datetime
-from dateutil.parser import parse
 from interactions.ext.paginators import Paginator
-from interactions import (OptionType, slash_command, slash_option, SlashContext, Embed)
+from interactions import (OptionType, ChannelType, Permissions, GuildText, SlashCommandChoice, slash_command, slash_option, SlashContext, AutocompleteContext, ComponentContext, Embed, is_owner)
 # Internal
 from astrobot.bot.options import Options
-from astrobot.modules.chart import ChartUser
+from astrobot.bot.pages import LazyPaginator
+from astrobot.core.admission import Admission
+from astrobot.core.logs import Logs
+from astrobot.core.profiling import Profiler
+from astrobot.modules.chart import ChartPages, ChartError, BirthInput, Table, BigThree
+from astrobot.modules.gazetteer import PlaceIndex
+from astrobot.modules.search import HoroSearch, SearchHit
+from astrobot.modules.demand import Demand
+from astrobot.modules.synastry import Synastry
+from astrobot.modules.transits import Transits
+from astrobot.modules.ephemeris import Calendar, Event
 from astrobot.core.astrology import ZodiacSign
-from astrobot.modules.horoscope import Horo, HoroItem
+from astrobot.modules.horoscope import Horo, HoroItem, HoroError
 from astrobot.modules.common import Day, Source, Style
+from astrobot.modules.subscription import Subscription, SubscriptionStore
 
 
 class Commands:
@@ -20,7 +30,8 @@ class Commands:
         geo_api (str): The Geocoder API key.
         data (Data): The Data object holding data.
         """
-        self.geo_api: str      = geo_api
+        self.geo_api: str                       = geo_api
+        self.subscriptions: SubscriptionStore   = SubscriptionStore()
 
     # Commands
     @slash_command(
@@ -55,7 +66,14 @@ class Commands:
             required=False,
             choices=Options.choice_source()
             )
-    async def horoscope(self, ctx: SlashContext, sign: str, day: str = "today", style: str = "daily", source: str = "astrology_com"):
+    @slash_option(
+            name="date",
+            description="Past date from the archive, instead of day (e.g. 07/04/2024) [MM/DD/YYYY]",
+            opt_type=OptionType.STRING,
+            required=False
+            )
+    @Profiler.profiled("horoscope")
+    async def horoscope(self, ctx: SlashContext, sign: str, day: str = "today", style: str = "daily", source: str = "astrology_com", date: str = ""):
         # Prepare data for horoscope fetch
         _sign: ZodiacSign       = ZodiacSign[sign]
         _day: Day               = Day[day]
@@ -63,16 +81,37 @@ class Commands:
         _source: Source         = Source[source]
 
         # Log request
-        logging.info(f"Received 'horoscope' request from '{ctx.user.username}' [{ctx.author_id}] with parameters: sign: {_sign.name}, day: {_day.name}, style: {_style.name}, source: {_source.name}")
+        Logs.requests.info("Received 'horoscope' request from '%s' [%s] with parameters: sign: %s, day: %s, style: %s, source: %s, date: %s", ctx.user.username, ctx.author_id, _sign.name, _day.name, _style.name, _source.name, date)
 
         # Gather data
         item: HoroItem          = HoroItem(day=_day, source=_source, style=_style, sign=_sign)
-        hor: Horo               = await item.fetch()
+
+        # Past dates come from the archive only
+        if date:
+            try:
+                archived: Horo  = await item.fetch_archived(date=datetime.strptime(date.strip(), "%m/%d/%Y"))
+            except ValueError:
+                await ctx.send(f"Sorry, I couldn't read the date '{date}', use MM/DD/YYYY (e.g. 07/04/2024).", ephemeral=True)
+                return
+            except HoroError as e:
+                await ctx.send(f"Sorry, {str(e)}.", ephemeral=True)
+                return
+            Logs.requests.info("Response retrieved from archive")
+            await ctx.send(archived.get_formatted_string())
+            return
+
+        Demand.record(day=_day, source=_source, style=_style, sign=_sign)
+        try:
+            hor: Horo           = await item.fetch()
+        except HoroError as e:
+            logging.warning("Horoscope unavailable: %s", e)
+            await ctx.send(f"Sorry, that horoscope isn't available right now: {str(e)}. Try again later or pick another source.", ephemeral=True)
+            return
 
         if hor.cache.is_cached:
-                logging.info(f"Response retrieved from cache, expires at {hor.cache.expires.strftime('%Y-%m-%d %H:%M:%S')}")
+                Logs.requests.info("Response retrieved from cache, expires at %s", hor.cache.expires)
         else:
-                logging.info(f"Response retrieved from source")
+                Logs.requests.info("Response retrieved from source")
 
         await ctx.send(hor.get_formatted_string())
 
@@ -88,7 +127,7 @@ class Commands:
             )
     @slash_option(
             name="birthday",
-            description="Birth date, with leading zero (e.g. 07/04/1776) [MM/DD/YYYY]",
+            description="Birth date, with leading zero (e.g. 07/04/1976) [MM/DD/YYYY]",
             opt_type=OptionType.STRING,
             required=True
             )
@@ -98,34 +137,422 @@ class Commands:
             opt_type=OptionType.STRING,
             required=False
             )
+    @Admission.limited("chart")
+    @Profiler.profiled("chart")
     async def chart(self, ctx: SlashContext, location: str, birthday: str, birthtime: str = "00:00"):
         # Log request
-        logging.info(f"Received 'chart' request from '{ctx.user.username}' [{ctx.author_id}] with parameters: location: {location}, birthday: {birthday}, birthtime: {birthtime}")
+        Logs.requests.info("Received 'chart' request from '%s' [%s] with parameters: location: %s, birthday: %s, birthtime: %s", ctx.user.username, ctx.author_id, location, birthday, birthtime)
         
-        # Combine birthday and birthtime, parse and try to get good data.
-        dt_str: str             = birthtime + " " + birthday
-        date: datetime          = parse(timestr=dt_str, fuzzy=True)
-        good_date: str          = date.strftime("%m/%d/%Y")
-        good_time: str          = date.strftime("%H:%M")
+        # Parse and validate before any lookups, bad input gets an answer right away
+        try:
+            place, good_date, good_time = BirthInput.parse(location=location, birthday=birthday, birthtime=birthtime)
 
-        # Gather data
-        user: ChartUser         = ChartUser(
-                                      geo_api=self.geo_api,
-                                      name=ctx.user.display_name,
-                                      location=location,
-                                      birthday=good_date,
-                                      time=good_time
-                                      )
-        charts: dict[str, str]  = user.get_charts_as_str()
+            # Gather data, tables are computed when their page is first shown
+            chart: ChartPages       = await ChartPages.fetch(
+                                          geo_api=self.geo_api,
+                                          name=ctx.user.display_name,
+                                          location=place,
+                                          birthday=good_date,
+                                          time=good_time
+                                          )
+        except ChartError as e:
+            await Admission.send_private(ctx=ctx, content=f"Sorry, I can't make that chart: {str(e)}.")
+            return
+
+        # Format a table into an embed, tables built on a page flip wait for a slot like the chart did
+        tables: list[Table]     = list(Table)
+        async def page(index: int) -> Embed:
+            content: list[str]  = ["```"]
+            async with Admission.slot():
+                content.append(await chart.get(table=tables[index]))
+            content.append("```")
+            return Embed(title=tables[index].name.capitalize(), description="\n".join(content))
+
+        # Building a page on a page flip is charged to the rate limits
+        async def gate(button: ComponentContext) -> bool:
+            return await Admission.allow(ctx=button, command="chart", cost=Admission.page_cost)
+
+        # Create paginator and send
+        paginator: LazyPaginator = LazyPaginator.create_lazy(ctx.client, titles=[t.name.capitalize() for t in tables], loader=page, gate=gate)
+        await paginator.send(ctx=ctx)
+
+    @slash_command(
+        name="bigthree",
+        description="Get your sun, moon and rising signs"
+    )
+    @slash_option(
+            name="location",
+            description="Birth city",
+            opt_type=OptionType.STRING,
+            required=True
+            )
+    @slash_option(
+            name="birthday",
+            description="Birth date, with leading zero (e.g. 07/04/1976) [MM/DD/YYYY]",
+            opt_type=OptionType.STRING,
+            required=True
+            )
+    @slash_option(
+            name="birthtime",
+            description="Birth time, 24-hour format (e.g. 14:30) [HH:MM] -- Optional, will assume 00:00",
+            opt_type=OptionType.STRING,
+            required=False
+            )
+    @Admission.rate_limited("bigthree")
+    @Profiler.profiled("bigthree")
+    async def bigthree(self, ctx: SlashContext, location: str, birthday: str, birthtime: str = "00:00"):
+        # Log request
+        Logs.requests.info("Received 'bigthree' request from '%s' [%s] with parameters: location: %s, birthday: %s, birthtime: %s", ctx.user.username, ctx.author_id, location, birthday, birthtime)
+
+        # Only the three placements, no full chart
+        try:
+            place, good_date, good_time = BirthInput.parse(location=location, birthday=birthday, birthtime=birthtime)
+            three: BigThree         = await BigThree.fetch(
+                                          geo_api=self.geo_api,
+                                          name=ctx.user.display_name,
+                                          location=place,
+                                          birthday=good_date,
+                                          time=good_time
+                                          )
+        except ChartError as e:
+            await ctx.send(f"Sorry, I can't find your big three: {str(e)}.", ephemeral=True)
+            return
+
+        await ctx.send(embed=Embed(title=f"Big three for {three.name}", description=three.get_formatted_string()))
+
+    @slash_command(
+        name="synastry",
+        description="Compare your natal chart with someone else's"
+    )
+    @slash_option(
+            name="location",
+            description="Your birth city",
+            opt_type=OptionType.STRING,
+            required=True
+            )
+    @slash_option(
+            name="birthday",
+            description="Your birth date, with leading zero (e.g. 07/04/1976) [MM/DD/YYYY]",
+            opt_type=OptionType.STRING,
+            required=True
+            )
+    @slash_option(
+            name="partner_location",
+            description="Their birth city",
+            opt_type=OptionType.STRING,
+            required=True
+            )
+    @slash_option(
+            name="partner_birthday",
+            description="Their birth date, with leading zero (e.g. 07/04/1976) [MM/DD/YYYY]",
+            opt_type=OptionType.STRING,
+            required=True
+            )
+    @slash_option(
+            name="birthtime",
+            description="Your birth time, 24-hour format (e.g. 14:30) [HH:MM] -- Optional, will assume 00:00",
+            opt_type=OptionType.STRING,
+            required=False
+            )
+    @slash_option(
+            name="partner_birthtime",
+            description="Their birth time, 24-hour format (e.g. 14:30) [HH:MM] -- Optional, will assume 00:00",
+            opt_type=OptionType.STRING,
+            required=False
+            )
+    @slash_option(
+            name="partner_name",
+            description="Their name -- Optional, will assume \"Partner\"",
+            opt_type=OptionType.STRING,
+            required=False
+            )
+    @Admission.limited("synastry")
+    @Profiler.profiled("synastry")
+    async def synastry(self, ctx: SlashContext, location: str, birthday: str, partner_location: str, partner_birthday: str,
+                       birthtime: str = "00:00", partner_birthtime: str = "00:00", partner_name: str = "Partner"):
+        # Log request
+        Logs.requests.info("Received 'synastry' request from '%s' [%s] with parameters: location: %s, birthday: %s, birthtime: %s, partner_location: %s, partner_birthday: %s, partner_birthtime: %s", ctx.user.username, ctx.author_id, location, birthday, birthtime, partner_location, partner_birthday, partner_birthtime)
+
+        # Parse and validate both people before any lookups, bad input gets an answer right away
+        try:
+            first: tuple[str, str, str]     = BirthInput.parse(location=location, birthday=birthday, birthtime=birthtime)
+            second: tuple[str, str, str]    = BirthInput.parse(location=partner_location, birthday=partner_birthday, birthtime=partner_birthtime)
+
+            # Gather data
+            tables: dict[str, str]  = await Synastry.get_cached_tables(
+                                          geo_api=self.geo_api,
+                                          first=dict(zip(("location", "birthday", "time"), first), name=ctx.user.display_name),
+                                          second=dict(zip(("location", "birthday", "time"), second), name=partner_name)
+                                          )
+        except ChartError as e:
+            await Admission.send_private(ctx=ctx, content=f"Sorry, I can't compare those charts: {str(e)}.")
+            return
+
+        # Format data into a list of embeds
+        embed: list[Embed] = []
+        for name, table in tables.items():
+            pages: list[str]        = Synastry.paginate(table=table)
+            for i, page in enumerate(pages, start=1):
+                content: list[str]  = [f"Planet 1: {ctx.user.display_name}, Planet 2: {partner_name}", "```"]
+                content.append(page)
+                content.append("```")
+                title: str          = f"Synastry {name}" + (f" ({i}/{len(pages)})" if len(pages) > 1 else "")
+                embed.append( Embed(title=title, description="\n".join(content)) )
+
+        # Create paginator and send
+        paginator: Paginator    = Paginator.create_from_embeds(ctx.client, *embed)
+        await paginator.send(ctx=ctx)
+
+    @chart.autocomplete("location")
+    @bigthree.autocomplete("location")
+    @synastry.autocomplete("location")
+    @synastry.autocomplete("partner_location")
+    async def location_autocomplete(self, ctx: AutocompleteContext):
+        # Suggestions come from memory only, never the Geocoder, to answer within Discord's deadline
+        await ctx.send(choices=PlaceIndex.suggest(text=ctx.input_text))
+
+    @slash_command(
+        name="transits",
+        description="Show where the planets are today"
+    )
+    @Profiler.profiled("transits")
+    async def transits(self, ctx: SlashContext):
+        # Log request
+        Logs.requests.info("Received 'transits' request from '%s' [%s]", ctx.user.username, ctx.author_id)
+
+        # Gather data, built once per day
+        snapshot: Transits      = await Transits.today()
+        date: str               = snapshot.date.strftime("%B %d, %Y")
 
         # Format data into a list of embeds
         embed: list[Embed] = []
-        for name, chart in charts.items():
+        for name, table in snapshot.tables.items():
             content: list[str]  = ["```"]
-            content.append(chart)
+            content.append(table)
             content.append("```")
-            embed.append( Embed(title=name, description="\n".join(content)) )
+            embed.append( Embed(title=f"{name} for {date}", description="\n".join(content)) )
+
+        # Create paginator and send
+        paginator: Paginator    = Paginator.create_from_embeds(ctx.client, *embed)
+        await paginator.send(ctx=ctx)
+
+    @slash_command(
+        name="calendar",
+        description="Show sign ingresses and retrograde stations for a month"
+    )
+    @slash_option(
+            name="month",
+            description="Month, 1-12 -- Optional, will assume this month",
+            opt_type=OptionType.INTEGER,
+            required=False,
+            min_value=1,
+            max_value=12
+            )
+    @slash_option(
+            name="year",
+            description="Year (e.g. 2026) -- Optional, will assume this year",
+            opt_type=OptionType.INTEGER,
+            required=False,
+            min_value=1900,
+            max_value=2100
+            )
+    @Profiler.profiled("calendar")
+    async def calendar(self, ctx: SlashContext, month: int = 0, year: int = 0):
+        # Log request
+        Logs.requests.info("Received 'calendar' request from '%s' [%s] with parameters: month: %s, year: %s", ctx.user.username, ctx.author_id, month, year)
+
+        # Default to this month
+        today: datetime         = datetime.today()
+        _month: int             = month or today.month
+        _year: int              = year or today.year
+
+        # Gather data, computed once per month
+        events: list[Event]     = await Calendar.month(year=_year, month=_month)
+        title: str              = datetime(_year, _month, 1).strftime("%B %Y")
+        lines: list[str]        = [f"{e.time.strftime('%b %d %H:%M')} UTC  {e.get_formatted_string()}" for e in events]
+        if not lines:
+            lines = ["No ingresses or stations this month."]
+
+        # Format data into a list of embeds, a page per 20 events
+        embed: list[Embed] = []
+        for i in range(0, len(lines), 20):
+            embed.append( Embed(title=f"Ingresses and stations for {title}", description="\n".join(lines[i:i + 20])) )
+
+        # Create paginator and send
+        paginator: Paginator    = Paginator.create_from_embeds(ctx.client, *embed)
+        await paginator.send(ctx=ctx)
+
+    @slash_command(
+        name="search",
+        description="Find horoscopes that mention some words"
+    )
+    @slash_option(
+            name="words",
+            description="Words to look for, all must appear (e.g. travel, money)",
+            opt_type=OptionType.STRING,
+            required=True
+            )
+    @slash_option(
+            name="days",
+            description="How many days back to look -- Optional, will assume 7",
+            opt_type=OptionType.INTEGER,
+            required=False,
+            min_value=1,
+            max_value=365
+            )
+    @slash_option(
+            name="sign",
+            description="zodiac sign -- Optional, will search all",
+            opt_type=OptionType.STRING,
+            required=False,
+            choices=Options.choice_zodiac()
+            )
+    @slash_option(
+            name="source",
+            description="horoscope source -- Optional, will search all",
+            opt_type=OptionType.STRING,
+            required=False,
+            choices=Options.choice_source()
+            )
+    async def search(self, ctx: SlashContext, words: str, days: int = 7, sign: str = "", source: str = ""):
+        # Log request
+        Logs.requests.info("Received 'search' request from '%s' [%s] with parameters: words: %s, days: %s, sign: %s, source: %s", ctx.user.username, ctx.author_id, words, days, sign, source)
+
+        if HoroSearch.active is None:
+            await ctx.send("Sorry, search isn't turned on for this bot.", ephemeral=True)
+            return
+
+        # Gather data, answered from the index alone
+        hits: list[SearchHit]   = await HoroSearch.active.search(text=words,
+                                                                 days=days,
+                                                                 sign=ZodiacSign[sign] if sign else None,
+                                                                 source=Source[source] if source else None)
+        if not hits:
+            await ctx.send(f"No horoscopes from the last {days} days mention '{words}'.", ephemeral=True)
+            return
+
+        # Format data into a list of embeds, a page per 20 horoscopes
+        lines: list[str]        = [f"{h.sign.symbol} {h.sign.full} -- {h.style.symbol} {h.source.full}, {h.date.strftime('%a %b %d')} ({h.date.strftime('%m/%d/%Y')})" for h in hits]
+        embed: list[Embed] = []
+        for i in range(0, len(lines), 20):
+            embed.append( Embed(title=f"Horoscopes mentioning '{words}' in the last {days} days", description="\n".join(lines[i:i + 20])) )
 
         # Create paginator and send
         paginator: Paginator    = Paginator.create_from_embeds(ctx.client, *embed)
-        await paginator.send(ctx=ctx)
\ No newline at end of file
+        await paginator.send(ctx=ctx)
+
+    @slash_command(
+            name="subscribe",
+            description="Post a daily horoscope to a channel",
+            default_member_permissions=Permissions.MANAGE_CHANNELS,
+            dm_permission=False
+        )
+    @slash_option(
+            name="channel",
+            description="channel to post in",
+            opt_type=OptionType.CHANNEL,
+            required=True,
+            channel_types=[ChannelType.GUILD_TEXT]
+            )
+    @slash_option(
+            name="sign",
+            description="zodiac sign",
+            opt_type=OptionType.STRING,
+            required=True,
+            choices=Options.choice_zodiac()
+            )
+    @slash_option(
+            name="style",
+            description="horoscope style",
+            opt_type=OptionType.STRING,
+            required=False,
+            choices=Options.choice_style()
+            )
+    @slash_option(
+            name="source",
+            description="horoscope source",
+            opt_type=OptionType.STRING,
+            required=False,
+            choices=Options.choice_source()
+            )
+    async def subscribe(self, ctx: SlashContext, channel: GuildText, sign: str, style: str = "daily", source: str = "astrology_com"):
+        # Log request
+        Logs.requests.info("Received 'subscribe' request from '%s' [%s] with parameters: channel: %s, sign: %s, style: %s, source: %s", ctx.user.username, ctx.author_id, channel.id, sign, style, source)
+
+        sub: Subscription       = Subscription(guild_id=int(ctx.guild_id), # type: ignore
+                                               channel_id=int(channel.id),
+                                               sign=ZodiacSign[sign],
+                                               source=Source[source],
+                                               style=Style[style])
+        added: bool             = await self.subscriptions.add(sub=sub)
+
+        name: str               = f"{sub.sign.symbol} {sub.sign.full} {sub.style.symbol} {sub.style.full} from {sub.source.full}"
+        if added:
+            await ctx.send(f"Subscribed {channel.mention} to {name}.", ephemeral=True)
+        else:
+            await ctx.send(f"{channel.mention} is already subscribed to {name}.", ephemeral=True)
+
+    @slash_command(
+            name="unsubscribe",
+            description="Stop posting daily horoscopes to a channel",
+            default_member_permissions=Permissions.MANAGE_CHANNELS,
+            dm_permission=False
+        )
+    @slash_option(
+            name="channel",
+            description="channel to stop posting in",
+            opt_type=OptionType.CHANNEL,
+            required=True,
+            channel_types=[ChannelType.GUILD_TEXT]
+            )
+    @slash_option(
+            name="sign",
+            description="zodiac sign -- Optional, will remove all signs",
+            opt_type=OptionType.STRING,
+            required=False,
+            choices=Options.choice_zodiac()
+            )
+    async def unsubscribe(self, ctx: SlashContext, channel: GuildText, sign: str = ""):
+        # Log request
+        Logs.requests.info("Received 'unsubscribe' request from '%s' [%s] with parameters: channel: %s, sign: %s", ctx.user.username, ctx.author_id, channel.id, sign)
+
+        _sign: ZodiacSign | None    = ZodiacSign[sign] if sign else None
+        removed: int                = await self.subscriptions.remove(channel_id=int(channel.id), sign=_sign)
+
+        await ctx.send(f"Removed {removed} subscription(s) from {channel.mention}.", ephemeral=True)
+
+    @slash_command(
+            name="profile",
+            description="Profile the next runs of a command or job, reports are written on the bot host -- bot owner only",
+            default_member_permissions=Permissions.ADMINISTRATOR,
+            dm_permission=False
+        )
+    @slash_option(
+            name="target",
+            description="command or job to profile",
+            opt_type=OptionType.STRING,
+            required=True,
+            choices=[SlashCommandChoice(name=target, value=target) for target in Profiler.targets]
+            )
+    @slash_option(
+            name="count",
+            description="runs to profile, 0 to stop -- Optional, will assume 1",
+            opt_type=OptionType.INTEGER,
+            required=False,
+            min_value=0,
+            max_value=20
+            )
+    async def profile(self, ctx: SlashContext, target: str, count: int = 1):
+        # Log request
+        Logs.requests.info("Received 'profile' request from '%s' [%s] with parameters: target: %s, count: %s", ctx.user.username, ctx.author_id, target, count)
+
+        # Profiling slows the whole process and writes files on the host, so server admins alone aren't enough
+        if not await is_owner()(ctx):
+            await ctx.send("Only the bot owner can profile the bot.", ephemeral=True)
+            return
+
+        Profiler.arm(target=target, count=count)
+        if count:
+            await ctx.send(f"Profiling the next {count} run(s) of {target}. Reports go to `{Profiler.directory}` on the bot host.", ephemeral=True)
+        else:
+            await ctx.send(f"Stopped profiling {target}.", ephemeral=True)
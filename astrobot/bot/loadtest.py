@@ -0,0 +1,264 @@
+# External
+import logging, asyncio, random
+import time as timer
+import numpy as np
+from datetime import datetime
+from aiohttp import web
+# Internal
+from astrobot.bot.commands import Commands
+from astrobot.core.astrology import ZodiacSign
+from astrobot.core.cache import Backend, Cache
+from astrobot.core.common import Misc
+from astrobot.core.watchdog import Watchdog
+from astrobot.modules.common import Day, Source
+from astrobot.modules.horoscope import UrlBuilder
+
+
+class FakeUser:
+    """Stands in for a Discord user.
+    """
+    def __init__(self, id: int) -> None:
+        self.id: int            = id
+        self.username: str      = f"loadtest{id}"
+        self.display_name: str  = f"Load Test {id}"
+
+class FakeClient:
+    """Stands in for the bot client, enough for paginators.
+    """
+    def add_component_callback(self, command) -> None:
+        pass
+
+class FakeContext:
+    """Stands in for SlashContext, recording what the handler sends.
+    """
+    def __init__(self, user: FakeUser, client: FakeClient) -> None:
+        """Stands in for SlashContext, recording what the handler sends.
+
+        Args:
+            user (FakeUser): User making the request.
+            client (FakeClient): Bot client.
+        """
+        self.user: FakeUser         = user
+        self.author: FakeUser       = user
+        self.author_id: int         = user.id
+        self.client: FakeClient     = client
+        self.deferred: bool         = False
+        self.responded: bool        = False
+        self.sent: list[dict]       = []
+
+    async def defer(self, ephemeral: bool = False) -> None:
+        self.deferred = True
+
+    async def send(self, content: str | None = None, **kwargs) -> None:
+        self.sent.append({"content": content} | kwargs)
+        self.responded = True
+
+    async def delete(self, message: str = "@original") -> None:
+        self.sent.append({"deleted": message})
+
+    @property
+    def rejected(self) -> bool:
+        """Whether the handler answered with an ephemeral error instead of a result.
+
+        Returns:
+            bool: True if the last message sent was ephemeral.
+        """
+        return bool(self.sent) and bool([m for m in self.sent if "deleted" not in m][-1].get("ephemeral"))
+
+class Fixtures:
+    """Local origin server with synthetic pages for every horoscope source, in the layout UrlBuilder.override_base expects.
+    """
+    text: str = " ".join(["The stars line up for a quiet, steady day of small wins."] * 10)
+
+    def __init__(self, delay: float = 0.0) -> None:
+        """Local origin server with synthetic pages for every horoscope source.
+
+        Args:
+            delay (float, optional): Seconds to wait before each response, to stand in for origin latency. Defaults to 0.0.
+        """
+        self.delay: float                   = delay
+        self.runner: web.AppRunner | None   = None
+        self.base: str                      = ""
+
+    def page(self, path: str) -> str:
+        """Build a page that the source's parser accepts.
+
+        Args:
+            path (str): Request path, starting with the source name.
+
+        Returns:
+            str: HTML page.
+        """
+        date: str = Misc.get_date_string(date=datetime.today())
+        if path.startswith(f"/{Source.astrology_com.name}/"):
+            return f'<div id="content-date">{date}</div><div id="content"><span>{Fixtures.text}</span></div>'
+        elif path.startswith(f"/{Source.horoscope_com.name}/"):
+            short: str = datetime.today().strftime("%b %d, %Y")
+            return f'<div class="main-horoscope"><p><strong>{short}</strong> - {Fixtures.text}</p></div>'
+        else:
+            heading: str = f"{date} - {date}" if "/weekend/" in path else date
+            return f'<div class="horoscope-content"><h2>Daily Horoscope for {heading}</h2><p>{Fixtures.text}</p></div>'
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return web.Response(text=self.page(path=request.path), content_type="text/html")
+
+    async def start(self) -> None:
+        """Start the server on a free local port and point every source at it.
+        """
+        app: web.Application    = web.Application()
+        app.router.add_get("/{path:.*}", self.handle)
+        self.runner             = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site: web.TCPSite       = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port: int               = site._server.sockets[0].getsockname()[1] # type: ignore
+        self.base               = f"http://127.0.0.1:{port}"
+        UrlBuilder.override_base(base=self.base)
+
+    async def stop(self) -> None:
+        if self.runner is not None:
+            await self.runner.cleanup()
+
+class LoadTest:
+    """Drives command handlers directly with fake contexts, against local fixtures and a stub geocoder, and reports
+    latency percentiles and throughput.
+    """
+    # Stub geocoder, lookups are put in the cache up front so the Geocoder is never called
+    locations: dict[str, dict] = {"New York":   {"latitude": 40.7128, "longitude": -74.0060, "city": "New York", "country": "US", "timezone": "America/New_York"},
+                                  "Paris":      {"latitude": 48.8566, "longitude": 2.3522, "city": "Paris", "country": "FR", "timezone": "Europe/Paris"},
+                                  "Tokyo":      {"latitude": 35.6762, "longitude": 139.6503, "city": "Tokyo", "country": "JP", "timezone": "Asia/Tokyo"},
+                                  "Sydney":     {"latitude": -33.8688, "longitude": 151.2093, "city": "Sydney", "country": "AU", "timezone": "Australia/Sydney"},
+                                  "São Paulo":  {"latitude": -23.5505, "longitude": -46.6333, "city": "São Paulo", "country": "BR", "timezone": "America/Sao_Paulo"}}
+
+    def __init__(self, requests: int = 200, concurrency: int = 10, mix: dict[str, float] | None = None, origin_delay: float = 0.0, seed: int = 0) -> None:
+        """Drives command handlers directly with fake contexts, against local fixtures and a stub geocoder.
+
+        Args:
+            requests (int, optional): Total requests. Defaults to 200.
+            concurrency (int, optional): Requests in flight at once. Defaults to 10.
+            mix (dict[str, float] | None, optional): Command name to weight. Defaults to None, 80% horoscope and 20% chart.
+            origin_delay (float, optional): Seconds of latency for each fixture response. Defaults to 0.0.
+            seed (int, optional): Random seed, so runs are repeatable. Defaults to 0.
+        """
+        self.requests: int          = requests
+        self.concurrency: int       = concurrency
+        self.mix: dict[str, float]  = mix or {"horoscope": 0.8, "chart": 0.2}
+        self.fixtures: Fixtures     = Fixtures(delay=origin_delay)
+        self.random: random.Random  = random.Random(seed)
+
+    @staticmethod
+    def parse_mix(spec: str) -> dict[str, float]:
+        """Parse a command mix, e.g. "horoscope=0.8,chart=0.2".
+
+        Args:
+            spec (str): Comma separated command=weight pairs.
+
+        Returns:
+            dict[str, float]: Command name to weight.
+        """
+        mix: dict[str, float] = {}
+        for part in spec.split(","):
+            name, _, weight = part.strip().partition("=")
+            if name not in ("horoscope", "chart", "bigthree"):
+                raise ValueError(f"Unknown command in mix: {name}")
+            mix[name] = float(weight or 1)
+        return mix
+
+    def __arguments(self, command: str) -> dict:
+        """Random options for a command, as a user would pick them.
+
+        Args:
+            command (str): Command name.
+
+        Returns:
+            dict: Keyword arguments for the handler.
+        """
+        if command == "horoscope":
+            source: Source = self.random.choice(list(Source))
+            return {"sign":     self.random.choice(list(ZodiacSign)).name,
+                    "day":      self.random.choice(list(Day)).name,
+                    "style":    self.random.choice(source.styles).name,
+                    "source":   source.name}
+        return {"location":     self.random.choice(list(LoadTest.locations)),
+                "birthday":     f"{self.random.randint(1, 12):02d}/{self.random.randint(1, 28):02d}/{self.random.randint(1940, 2010)}",
+                "birthtime":    f"{self.random.randint(0, 23):02d}:{self.random.randint(0, 59):02d}"}
+
+    async def __call(self, commands: Commands, command: str, user: FakeUser) -> tuple[str, float, str]:
+        """Run one request through a handler.
+
+        Args:
+            commands (Commands): Handler object.
+            command (str): Command name.
+            user (FakeUser): User making the request.
+
+        Returns:
+            tuple[str, float, str]: Command name, seconds, and outcome: "ok", "rejected" or "error".
+        """
+        ctx: FakeContext    = FakeContext(user=user, client=FakeClient())
+        handler             = getattr(Commands, command).callback
+        kwargs: dict        = self.__arguments(command=command)
+
+        tic = timer.perf_counter()
+        try:
+            await handler(commands, ctx, **kwargs)
+            outcome: str = "rejected" if ctx.rejected else "ok"
+        except Exception as e:
+            logging.error("*** Load test %s failed: %s", command, str(e))
+            outcome = "error"
+        return command, timer.perf_counter() - tic, outcome
+
+    async def run(self) -> dict[str, dict[str, float]]:
+        """Run the load test.
+
+        Returns:
+            dict[str, dict[str, float]]: Per command and "all": count, rejected, errors, p50/p95/p99 in ms, and rps.
+            Event loop lag over the run is kept in lag.
+        """
+        Cache.configure(backend=Backend.memory)
+        for name, found in LoadTest.locations.items():
+            await Cache.backend.set(key="geo:" + " ".join(name.lower().split()), value=found | {"raw": {}})
+        await self.fixtures.start()
+
+        watchdog: Watchdog          = Watchdog(threshold=1.0)
+        watchdog.start()
+
+        commands: Commands          = Commands(geo_api="stub")
+        names: list[str]            = self.random.choices(list(self.mix), weights=list(self.mix.values()), k=self.requests)
+        limit: asyncio.Semaphore    = asyncio.Semaphore(self.concurrency)
+
+        async def one(i: int, command: str) -> tuple[str, float, str]:
+            async with limit:
+                return await self.__call(commands=commands, command=command, user=FakeUser(id=i))
+
+        tic = timer.perf_counter()
+        results: list[tuple[str, float, str]] = await asyncio.gather(*[one(i, name) for i, name in enumerate(names)])
+        wall: float = timer.perf_counter() - tic
+        await self.fixtures.stop()
+
+        report: dict[str, dict[str, float]] = {}
+        for command in list(self.mix) + ["all"]:
+            rows = [r for r in results if command in ("all", r[0])]
+            if not rows:
+                continue
+            seconds: np.ndarray = np.array([r[1] for r in rows]) * 1000
+            report[command] = {"count":     len(rows),
+                               "rejected":  sum(r[2] == "rejected" for r in rows),
+                               "errors":    sum(r[2] == "error" for r in rows),
+                               "p50":       float(np.percentile(seconds, 50)),
+                               "p95":       float(np.percentile(seconds, 95)),
+                               "p99":       float(np.percentile(seconds, 99)),
+                               "rps":       len(rows) / wall}
+        self.lag: dict[str, float] = watchdog.metrics()
+        return report
+
+    def start(self) -> None:
+        """Run and print the report.
+        """
+        report: dict[str, dict[str, float]] = asyncio.run(self.run())
+        print(f"{self.requests} requests, concurrency {self.concurrency}")
+        print(f"  {'command':<10} {'count':>6} {'rejected':>8} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}")
+        for command, row in report.items():
+            print(f"  {command:<10} {row['count']:>6} {row['rejected']:>8} {row['errors']:>6} {row['p50']:>9.1f} {row['p95']:>9.1f} {row['p99']:>9.1f} {row['rps']:>8.1f}")
+        print(f"  loop lag: p50 {self.lag['p50_ms']:0.1f}ms, p99 {self.lag['p99_ms']:0.1f}ms, max {self.lag['max_ms']:0.1f}ms")
@@ -0,0 +1,68 @@
+# External
+import attrs
+from typing import Awaitable, Callable
+from interactions import ComponentContext, Embed, BaseContext, Message
+from interactions.ext.paginators import Paginator
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=False)
+class LazyPaginator(Paginator):
+    """Paginator whose pages are built the first time they're shown, so pages nobody opens cost nothing.
+
+    An optional gate is asked before a page is built on a button press, and can turn the press away, answering it
+    itself, e.g. when the user is over a rate limit. Presses that build a page are deferred while it's built.
+    """
+    loader: Callable[[int], Awaitable[Embed]] | None                = attrs.field(repr=False, default=None, kw_only=True)
+    gate: Callable[[ComponentContext], Awaitable[bool]] | None      = attrs.field(repr=False, default=None, kw_only=True)
+    loaded: set[int]                                                = attrs.field(repr=False, factory=set, kw_only=True)
+
+    @classmethod
+    def create_lazy(cls, client, titles: list[str], loader: Callable[[int], Awaitable[Embed]], timeout: int = 0,
+                    gate: Callable[[ComponentContext], Awaitable[bool]] | None = None) -> "LazyPaginator":
+        """Create a paginator from page titles and a loader for each page.
+
+        Args:
+            client (Client): A reference to the client.
+            titles (list[str]): Title of each page, shown until it's loaded.
+            loader (Callable[[int], Awaitable[Embed]]): Builds the page at an index.
+            timeout (int, optional): Seconds to wait before closing the paginator. Defaults to 0, never.
+            gate (Callable[[ComponentContext], Awaitable[bool]] | None, optional): Asked before building a page on a
+                button press, False turns the press away. Defaults to None, always build.
+
+        Returns:
+            LazyPaginator: The paginator.
+        """
+        return cls(client, pages=[Embed(title=title) for title in titles], loader=loader, gate=gate, timeout_interval=timeout)
+
+    async def load(self, index: int) -> None:
+        """Build a page, once.
+
+        Args:
+            index (int): Page index.
+        """
+        if index in self.loaded or self.loader is None:
+            return
+        self.pages[index] = await self.loader(index) # type: ignore
+        self.loaded.add(index)
+
+    async def send(self, ctx: BaseContext, **kwargs) -> Message:
+        await self.load(index=self.page_index)
+        return await super().send(ctx, **kwargs)
+
+    async def _on_button(self, ctx: ComponentContext, *args, **kwargs) -> Message | None:
+        # Build the page the button leads to, then let the base class move there
+        if ctx.author.id == self.author_id:
+            last: int   = len(self.pages) - 1
+            target: int = {"first":     0,
+                           "last":      last,
+                           "next":      min(self.page_index + 1, last),
+                           "back":      max(self.page_index - 1, 0),
+                           "select":    int(ctx.values[0]) if ctx.values else self.page_index
+                           }.get(ctx.custom_id.split("|")[1], self.page_index)
+            if target not in self.loaded:
+                if self.gate is not None and not await self.gate(ctx):
+                    return None
+                # Building can take a while, answer the press now and edit the message when it's done
+                await ctx.defer(edit_origin=True)
+            await self.load(index=target)
+        return await super()._on_button(ctx, *args, **kwargs)
@@ -0,0 +1,317 @@
+# External
+import logging, asyncio, functools, math
+import time as timer
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+
+class TokenBucket:
+    """Rate limit allowing a burst of requests, refilled evenly over a period.
+    """
+    def __init__(self, capacity: int, period: float) -> None:
+        """Rate limit allowing a burst of requests, refilled evenly over a period.
+
+        Args:
+            capacity (int): Requests allowed at once, and per period.
+            period (float): Seconds to refill from empty.
+        """
+        self.capacity: int      = capacity
+        self.rate: float        = capacity / period
+        self.tokens: float      = float(capacity)
+        self.updated: float     = timer.monotonic()
+
+    def refill(self) -> None:
+        now: float      = timer.monotonic()
+        self.tokens     = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated    = now
+
+    def wait(self, cost: float = 1.0) -> float:
+        """Time until a request is allowed.
+
+        Args:
+            cost (float, optional): Share of a request to charge. Defaults to 1.0.
+
+        Returns:
+            float: Seconds, 0.0 if one is allowed now.
+        """
+        self.refill()
+        return 0.0 if self.tokens >= cost else (cost - self.tokens) / self.rate
+
+    def take(self, cost: float = 1.0) -> None:
+        self.tokens -= cost
+
+    def give(self, cost: float = 1.0) -> None:
+        self.tokens = min(self.capacity, self.tokens + cost)
+
+    @property
+    def full(self) -> bool:
+        """Whether the bucket has refilled, so dropping it changes nothing.
+
+        Returns:
+            bool: True if full.
+        """
+        self.refill()
+        return self.tokens >= self.capacity
+
+class Admission:
+    """Admission control for expensive commands, so a burst or one busy user can't hold up everyone else.
+
+    Each user and each server has a token bucket, shared by every command behind it, and a request over either limit
+    is turned away with the wait time. Admitted requests are deferred at once and share a fixed number of slots. When
+    they're all taken, a request is told its place in a first-come, first-served queue, and once the queue is full new
+    requests are turned away right away. Cheaper work is charged less: /bigthree only to the buckets, and building a
+    chart page on a page flip to the buckets and, quietly, a slot.
+    """
+    concurrency: int                    = 4             # Requests running at once
+    queue_size: int                     = 32            # Requests waiting for a slot
+    user_limit: tuple[int, float]       = (3, 60.0)     # Requests per seconds, for each user
+    guild_limit: tuple[int, float]      = (30, 60.0)    # Requests per seconds, for each server
+    max_buckets: int                    = 10000         # Buckets kept before full ones are dropped
+    page_cost: float                    = 0.25          # Share of a request charged for a chart page built on a page flip
+    users: dict[int, TokenBucket]       = {}
+    guilds: dict[int, TokenBucket]      = {}
+    running: int                        = 0
+    waiting: deque[asyncio.Future]      = deque()
+    admitted: ContextVar[bool]          = ContextVar("admitted", default=False)   # Set while an admitted request holds a slot
+
+    @staticmethod
+    def parse_limit(spec: str) -> tuple[int, float]:
+        """Parse a rate limit, e.g. "3/60" for 3 requests per 60 seconds.
+
+        Args:
+            spec (str): Requests and seconds.
+
+        Raises:
+            ValueError: If the limit isn't two positive numbers.
+
+        Returns:
+            tuple[int, float]: Requests and seconds.
+        """
+        count, _, seconds = spec.partition("/")
+        limit: tuple[int, float] = (int(count), float(seconds))
+        if limit[0] < 1 or limit[1] <= 0:
+            raise ValueError(f"Bad rate limit: {spec}")
+        return limit
+
+    @staticmethod
+    def configure(concurrency: int, queue_size: int, user_limit: str, guild_limit: str) -> None:
+        """Set the limits.
+
+        Args:
+            concurrency (int): Requests running at once.
+            queue_size (int): Requests waiting for a slot.
+            user_limit (str): Requests per seconds for each user, e.g. "3/60".
+            guild_limit (str): Requests per seconds for each server, e.g. "30/60".
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        if concurrency < 1 or queue_size < 0:
+            raise ValueError("Concurrency must be at least 1, and the queue can't be negative")
+        Admission.concurrency   = concurrency
+        Admission.queue_size    = queue_size
+        Admission.user_limit    = Admission.parse_limit(spec=user_limit)
+        Admission.guild_limit   = Admission.parse_limit(spec=guild_limit)
+        Admission.users         = {}
+        Admission.guilds        = {}
+
+    @staticmethod
+    def __bucket(buckets: dict[int, TokenBucket], key: int, limit: tuple[int, float]) -> TokenBucket:
+        """Get the bucket for a user or server, dropping full buckets when there are too many.
+
+        Args:
+            buckets (dict[int, TokenBucket]): Users' or servers' buckets.
+            key (int): User or server ID.
+            limit (tuple[int, float]): Requests per seconds.
+
+        Returns:
+            TokenBucket: The bucket.
+        """
+        if key not in buckets:
+            if len(buckets) >= Admission.max_buckets:
+                for idle in [k for k, bucket in buckets.items() if bucket.full]:
+                    del buckets[idle]
+            buckets[key] = TokenBucket(capacity=limit[0], period=limit[1])
+        return buckets[key]
+
+    @staticmethod
+    async def throttle(ctx, command: str, cost: float = 1.0) -> list[TokenBucket] | None:
+        """Charge a request to its user's and server's rate limits, or turn it away with the wait time if it's over either.
+
+        Args:
+            ctx (BaseContext): Context of the request, a slash command or a component.
+            command (str): Command name, for replies.
+            cost (float, optional): Share of a request to charge. Defaults to 1.0.
+
+        Returns:
+            list[TokenBucket] | None: The buckets charged, to refund, or None if it was turned away.
+        """
+        buckets: list[TokenBucket]  = [Admission.__bucket(buckets=Admission.users, key=int(ctx.author_id), limit=Admission.user_limit)]
+        if getattr(ctx, "guild_id", None):
+            buckets.append(Admission.__bucket(buckets=Admission.guilds, key=int(ctx.guild_id), limit=Admission.guild_limit))
+
+        wait: float                 = max(bucket.wait(cost=cost) for bucket in buckets)
+        if wait > 0:
+            logging.info("Rate limited '%s' request from [%s] for %0.0fs", command, ctx.author_id, wait)
+            await ctx.send(f"Slow down a little, you can use /{command} again in {math.ceil(wait)} seconds.", ephemeral=True)
+            return None
+        for bucket in buckets:
+            bucket.take(cost=cost)
+        return buckets
+
+    @staticmethod
+    async def allow(ctx, command: str, cost: float = 1.0) -> bool:
+        """Charge a request to the rate limits, see throttle.
+
+        Args:
+            ctx (BaseContext): Context of the request, a slash command or a component.
+            command (str): Command name, for replies.
+            cost (float, optional): Share of a request to charge. Defaults to 1.0.
+
+        Returns:
+            bool: True if it's allowed, False if it was turned away.
+        """
+        return await Admission.throttle(ctx=ctx, command=command, cost=cost) is not None
+
+    @staticmethod
+    def rate_limited(command: str, cost: float = 1.0) -> Callable:
+        """Decorator for a cheap command handler taking (self, ctx, ...), putting it behind the rate limits only.
+
+        Args:
+            command (str): Command name, for replies.
+            cost (float, optional): Share of a request to charge. Defaults to 1.0.
+
+        Returns:
+            Callable: The decorator.
+        """
+        def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> Any:
+                if await Admission.throttle(ctx=args[1], command=command, cost=cost) is None:
+                    return
+                return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @staticmethod
+    async def send_private(ctx, content: str) -> None:
+        """Send a reply only the user sees. Admitted requests are deferred publicly, so that reply is removed first and
+        this one follows up privately.
+
+        Args:
+            ctx (BaseContext): Context of the request.
+            content (str): Message content.
+        """
+        if ctx.deferred and not ctx.responded:
+            await ctx.delete()
+            ctx.responded = True
+        await ctx.send(content, ephemeral=True)
+
+    @staticmethod
+    async def __take(announce: Callable[[int], Awaitable[Any]] | None = None) -> bool:
+        """Take a slot, waiting in line for one when they're all taken.
+
+        Args:
+            announce (Callable[[int], Awaitable[Any]] | None, optional): Called with the place in line after joining
+                it, e.g. to tell the user. Defaults to None.
+
+        Returns:
+            bool: True if it waited in line.
+        """
+        if Admission.running < Admission.concurrency and not Admission.waiting:
+            Admission.running += 1
+            return False
+
+        slot: asyncio.Future = asyncio.get_running_loop().create_future()
+        Admission.waiting.append(slot)
+        try:
+            if announce is not None:
+                await announce(len(Admission.waiting))
+            await slot
+        except BaseException:
+            # Give up the place in line, or pass on a slot handed over just now
+            if slot.done() and not slot.cancelled():
+                Admission.__release()
+            else:
+                slot.cancel()
+                Admission.waiting.remove(slot)
+            raise
+        return True
+
+    @staticmethod
+    def __release() -> None:
+        """Give a finished request's slot to the next one waiting, or free it.
+        """
+        while Admission.waiting:
+            slot: asyncio.Future = Admission.waiting.popleft()
+            if not slot.done():
+                slot.set_result(None)
+                return
+        Admission.running -= 1
+
+    @staticmethod
+    @asynccontextmanager
+    async def slot() -> AsyncIterator[None]:
+        """Hold a slot for follow-up work of an admitted request, like building a chart page on a page flip. Waits in
+        line without a message and isn't turned away, the request was already admitted. Inside the admitted request
+        itself, its own slot is used.
+        """
+        if Admission.admitted.get():
+            yield
+            return
+        await Admission.__take()
+        try:
+            yield
+        finally:
+            Admission.__release()
+
+    @staticmethod
+    def limited(command: str) -> Callable:
+        """Decorator for a command handler taking (self, ctx, ...), putting it behind the rate limits and queue.
+
+        Args:
+            command (str): Command name, for replies.
+
+        Returns:
+            Callable: The decorator.
+        """
+        def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> Any:
+                ctx                                 = args[1]
+                buckets: list[TokenBucket] | None   = await Admission.throttle(ctx=ctx, command=command)
+                if buckets is None:
+                    return
+
+                # Turn away when every slot is taken and the line is full
+                if (Admission.running >= Admission.concurrency or Admission.waiting) and len(Admission.waiting) >= Admission.queue_size:
+                    for bucket in buckets:
+                        bucket.give()
+                    logging.warning("Turned away '%s' request from [%s], %d waiting", command, ctx.author_id, len(Admission.waiting))
+                    await ctx.send(f"Sorry, I'm busy with a lot of /{command} requests right now, please try again in a minute.", ephemeral=True)
+                    return
+
+                # Run now, or wait in line
+                async def announce(place: int) -> None:
+                    await ctx.defer()
+                    await ctx.send(f"⏳ Busy right now, you're number {place} in line. Your /{command} will be here shortly.")
+                queued: bool = await Admission.__take(announce=announce)
+
+                admitted = Admission.admitted.set(True)
+                try:
+                    # Answer within Discord's deadline however long the work takes, queued requests already have
+                    if not queued:
+                        await ctx.defer()
+                    return await func(*args, **kwargs)
+                finally:
+                    Admission.admitted.reset(admitted)
+                    Admission.__release()
+                    if queued:
+                        try:
+                            await ctx.delete()
+                        except Exception as e:
+                            logging.debug("Couldn't remove queue message: %s", e)
+            return wrapper
+        return decorator
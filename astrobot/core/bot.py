@@ -1,34 +1,129 @@
 # External
 import logging
-from interactions import (AutoShardedClient, listen)
+from interactions import (AutoShardedClient, Task, TimeTrigger, IntervalTrigger, listen)
 from interactions.api.events import (Startup, Ready, Login, Disconnect)
 # Internal
 from astrobot.bot.commands import Commands
+from astrobot.core.profiling import Profiler
+from astrobot.core.snapshot import Snapshot
+from astrobot.core.watchdog import Watchdog
+from astrobot.modules.demand import Demand
 from astrobot.modules.horoscope import HoroItem
+from astrobot.modules.subscription import Broadcast
+from astrobot.modules.transits import Transits
 
 
 class Bot(AutoShardedClient, Commands):
     """Wrapped class for interactions.py client.
     """
-    def __init__(self, token: str, geo_api: str):
+    def __init__(self, 
+                 token: str, 
+                 geo_api: str, 
+                 broadcast_time: str            = "08:00",
+                 shard_ids: list[int] | None    = None,
+                 total_shards: int | None       = None,
+                 leader: bool                   = True,
+                 lag_threshold: float           = 0.25
+                 ):
         """Wrapped class for interactions.py client.
 
         Args:
             token (str): Token for bot authentication.
             geo_api (str): Pass-through for Geocoder API key, used for charts.
+            broadcast_time (str, optional): Local time to post subscribed horoscopes, 24-hour format [HH:MM]. Defaults to "08:00".
+            shard_ids (list[int] | None, optional): Shards to run in this process. Defaults to None, all shards.
+            total_shards (int | None, optional): Total number of shards across all processes. Defaults to None, automatic.
+            leader (bool, optional): Whether this process warms the cache, syncs commands and runs the broadcast. Defaults to True.
+            lag_threshold (float, optional): Seconds of event loop lag logged as a stall, with the blocking stack. Defaults to 0.25.
         """
+        # Only pass sharding options when set, otherwise interactions.py decides
+        shard_opts: dict            = {}
+        if total_shards is not None:
+            shard_opts              = {"total_shards": total_shards, "shard_ids": shard_ids}
+        self.leader: bool           = leader
+        self.watchdog: Watchdog     = Watchdog(threshold=lag_threshold)
+
         # Call parent class initialization
-        AutoShardedClient.__init__(self, token=token)
+        AutoShardedClient.__init__(self, token=token, sync_interactions=leader, **shard_opts)
         Commands.__init__(self, geo_api=geo_api)
 
+        # Daily subscription broadcast
+        hour, minute                = broadcast_time.split(":")
+        self.broadcast: Broadcast   = Broadcast(store=self.subscriptions)
+        self.broadcast_task: Task   = Task(self.run_broadcast, TimeTrigger(hour=int(hour), minute=int(minute), utc=False))
+
+        # Re-warm the cache just after horoscopes expire at 03:05
+        self.refresh_task: Task     = Task(HoroItem.precache, TimeTrigger(hour=3, minute=6, utc=False))
+
+        # Build the day's transits as soon as the UTC day starts
+        self.transits_task: Task    = Task(Transits.today, TimeTrigger(hour=0, minute=0, seconds=5, utc=True))
+
+        # Add this process's horoscope requests to the shared demand counts, which order the warm-up
+        self.demand_task: Task      = Task(Demand.save, IntervalTrigger(minutes=10))
+
+        # Keep a snapshot of in-memory state for a warm restart
+        self.snapshot_task: Task    = Task(self.save_state, IntervalTrigger(minutes=15))
+
+    @Profiler.profiled("broadcast")
+    async def run_broadcast(self) -> None:
+        """Post today's horoscope to all subscribed channels.
+        """
+        await self.broadcast.run(send=self.send_to_channel)
+
+    async def save_state(self) -> None:
+        """Save demand counts and a snapshot of in-memory state.
+        """
+        await Demand.save()
+        await Snapshot.save()
+
+    async def send_to_channel(self, channel_id: int, content: str) -> bool:
+        """Send a message to a channel by ID.
+
+        Args:
+            channel_id (int): Discord ID of the channel.
+            content (str): Message content.
+
+        Returns:
+            bool: True if sent, False if the channel couldn't be found or the send failed.
+        """
+        try:
+            channel = await self.fetch_channel(channel_id)
+            if channel is None:
+                logging.warning("Broadcast channel not found: %s", channel_id)
+                return False
+            await channel.send(content) # type: ignore
+            return True
+        except Exception as e:
+            logging.error("*** Broadcast send error for channel %s: %s", channel_id, str(e))
+            return False
+
     # Event Listeners
     @listen(Startup)
     async def event_startup(self):
+        # Pick up where the last run left off, then only what's missing or stale is fetched
+        await Snapshot.load()
+        self.snapshot_task.start()
+
+        # Every process watches its own loop
+        self.watchdog.start()
+
+        # Transits live in memory, every process builds its own
+        self.transits_task.start()
+        await Transits.today()
+
+        # Every process counts the requests it serves
+        self.demand_task.start()
+
+        # Followers read the cache the leader warms
+        if not self.leader:
+            return
+        self.broadcast_task.start()
+        self.refresh_task.start()
         await HoroItem.precache()
 
     @listen(Login)
     async def event_login(self):
-        logging.info(f"LOGIN: Logged on as: {self.app.name}")
+        logging.info("LOGIN: Logged on as: %s", self.app.name)
 
     @listen(Ready)
     async def event_ready(self):
@@ -36,4 +131,5 @@ class Bot(AutoShardedClient, Commands):
 
     @listen(Disconnect)
     async def event_disconnect(self):
-        logging.info("DISCONNECT: Stopping bot.")
\ No newline at end of file
+        logging.info("DISCONNECT: Stopping bot.")
+        await self.save_state()
\ No newline at end of file
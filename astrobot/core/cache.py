@@ -0,0 +1,273 @@
+# External
+import logging, pickle, sqlite3
+import time as timer
+import aiosqlite
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from aiohttp_client_cache import CacheBackend as ResponseBackend, SQLiteBackend # type: ignore
+
+
+class Backend(Enum):
+    """Enum describing the available cache backends.
+    """
+    memory  = "In-memory, per process"
+    sqlite  = "SQLite file, shared by processes on one host"
+    redis   = "Redis server, shared by processes on any host"
+
+    @property
+    def full(self) -> str:
+        """Friendly name for the enum value.
+
+        Returns:
+            str: The value of the enum.
+        """
+        return self.value
+
+class CacheBackend(ABC):
+    """Cache interface used by horoscope fetches, geocoding and chart memoization.
+
+    HTTP responses go through an aiohttp_client_cache backend from responses, everything else is a pickled key-value pair.
+    """
+    @property
+    @abstractmethod
+    def responses(self) -> ResponseBackend:
+        """Backend for cached HTTP responses, passed to CachedSession.
+
+        Returns:
+            ResponseBackend: An aiohttp_client_cache backend. Not closed by sessions.
+        """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """Get a value.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any | None: The stored value, or None if missing or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, expires: datetime | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Any picklable value.
+            expires (datetime | None, optional): When the value expires. Defaults to None, never.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete a value.
+
+        Args:
+            key (str): Cache key.
+        """
+
+    async def close(self) -> None:
+        """Close any open connections.
+        """
+        await self.responses.close()
+
+    async def snapshot(self) -> dict | None:
+        """Entries to carry over a restart, for backends that lose them when the process ends.
+
+        Returns:
+            dict | None: Unexpired entries, None if the backend keeps its own.
+        """
+        return None
+
+    async def restore(self, snapshot: dict) -> int:
+        """Put back entries from snapshot(), leaving out any that have expired since and any already set.
+
+        Args:
+            snapshot (dict): Entries from snapshot().
+
+        Returns:
+            int: Entries restored.
+        """
+        return 0
+
+class MemoryCache(CacheBackend):
+    """In-memory cache, lost on restart and not shared between processes.
+    """
+    def __init__(self) -> None:
+        """In-memory cache, lost on restart and not shared between processes.
+        """
+        self.__responses: ResponseBackend                   = ResponseBackend(cache_name="astrobot", autoclose=False)
+        self.__data: dict[str, tuple[Any, float | None]]    = {}
+
+    @property
+    def responses(self) -> ResponseBackend:
+        return self.__responses
+
+    async def get(self, key: str) -> Any | None:
+        entry = self.__data.get(key)
+        if entry is None:
+            return None
+
+        value, expires = entry
+        if expires is not None and expires <= timer.time():
+            del self.__data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, expires: datetime | None = None) -> None:
+        self.__data[key] = (value, expires.timestamp() if expires else None)
+
+    async def delete(self, key: str) -> None:
+        self.__data.pop(key, None)
+
+    async def snapshot(self) -> dict | None:
+        now: float                  = timer.time()
+        responses: dict[str, bytes] = {}
+        async for key in self.__responses.responses.keys():
+            response = await self.__responses.responses.read(key)
+            if response is not None and not response.is_expired:
+                responses[key]      = self.__responses.responses.serialize(response)
+        return {"kv":           {key: entry for key, entry in self.__data.items() if entry[1] is None or entry[1] > now},
+                "responses":    responses}
+
+    async def restore(self, snapshot: dict) -> int:
+        now: float      = timer.time()
+        restored: int   = 0
+        for key, (value, expires) in snapshot["kv"].items():
+            if key not in self.__data and (expires is None or expires > now):
+                self.__data[key] = (value, expires)
+                restored += 1
+        for key, data in snapshot["responses"].items():
+            response = self.__responses.responses.deserialize(data)
+            if response is not None and not response.is_expired and not await self.__responses.responses.contains(key):
+                await self.__responses.responses.write(key, response)
+                restored += 1
+        return restored
+
+class SQLiteCache(CacheBackend):
+    """SQLite cache in WAL mode, so several processes on one host can read while one writes.
+    """
+    def __init__(self, path: str = "astrobot_cache") -> None:
+        """SQLite cache in WAL mode, so several processes on one host can read while one writes.
+
+        Args:
+            path (str, optional): Database file, without the .sqlite extension. Defaults to "astrobot_cache".
+        """
+        self.path: str                          = path + ".sqlite"
+        self.__responses: ResponseBackend       = SQLiteBackend(cache_name=self.path, autoclose=False)
+        self.__db: aiosqlite.Connection | None  = None
+
+        # Journal mode is stored in the file, set it once before any async connection opens
+        with sqlite3.connect(self.path) as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB, expires REAL)")
+
+    @property
+    def responses(self) -> ResponseBackend:
+        return self.__responses
+
+    async def __connect(self) -> aiosqlite.Connection:
+        """Get the shared connection, opening it on first use.
+
+        Returns:
+            aiosqlite.Connection: An open connection.
+        """
+        if self.__db is None:
+            self.__db = await aiosqlite.connect(self.path, timeout=10)
+        return self.__db
+
+    async def get(self, key: str) -> Any | None:
+        db: aiosqlite.Connection    = await self.__connect()
+        cursor                      = await db.execute("SELECT value, expires FROM kv WHERE key = ?", (key,))
+        row                         = await cursor.fetchone()
+
+        if row is None:
+            return None
+        if row[1] is not None and row[1] <= timer.time():
+            await self.delete(key=key)
+            return None
+        return pickle.loads(row[0])
+
+    async def set(self, key: str, value: Any, expires: datetime | None = None) -> None:
+        db: aiosqlite.Connection = await self.__connect()
+        await db.execute("INSERT OR REPLACE INTO kv VALUES (?, ?, ?)",
+                         (key, pickle.dumps(value), expires.timestamp() if expires else None))
+        await db.commit()
+
+    async def delete(self, key: str) -> None:
+        db: aiosqlite.Connection = await self.__connect()
+        await db.execute("DELETE FROM kv WHERE key = ?", (key,))
+        await db.commit()
+
+    async def close(self) -> None:
+        await super().close()
+        if self.__db is not None:
+            await self.__db.close()
+            self.__db = None
+
+class RedisCache(CacheBackend):
+    """Cache on a Redis-protocol server, shared by every process that points at it.
+    """
+    def __init__(self, url: str = "redis://localhost:6379/0", namespace: str = "astrobot") -> None:
+        """Cache on a Redis-protocol server, shared by every process that points at it.
+
+        Args:
+            url (str, optional): Server URL. Defaults to "redis://localhost:6379/0".
+            namespace (str, optional): Prefix for all keys. Defaults to "astrobot".
+        """
+        # Only needed for this backend
+        from redis.asyncio import from_url
+        from aiohttp_client_cache.backends.redis import RedisBackend
+
+        self.url: str                       = url
+        self.namespace: str                 = namespace
+        self.__responses: ResponseBackend   = RedisBackend(cache_name=namespace, address=url, autoclose=False)
+        self.__redis                        = from_url(url)
+
+    @property
+    def responses(self) -> ResponseBackend:
+        return self.__responses
+
+    async def get(self, key: str) -> Any | None:
+        data = await self.__redis.get(f"{self.namespace}:kv:{key}")
+        return None if data is None else pickle.loads(data)
+
+    async def set(self, key: str, value: Any, expires: datetime | None = None) -> None:
+        exat: int | None = int(expires.timestamp()) if expires else None
+        await self.__redis.set(f"{self.namespace}:kv:{key}", pickle.dumps(value), exat=exat)
+
+    async def delete(self, key: str) -> None:
+        await self.__redis.delete(f"{self.namespace}:kv:{key}")
+
+    async def close(self) -> None:
+        await super().close()
+        await self.__redis.aclose()
+
+class Cache:
+    """Holds the process-wide cache backend.
+    """
+    backend: CacheBackend   = MemoryCache()
+
+    @staticmethod
+    def configure(backend: Backend, path: str = "astrobot_cache", url: str = "redis://localhost:6379/0") -> CacheBackend:
+        """Set the process-wide cache backend.
+
+        Args:
+            backend (Backend): Which backend to use.
+            path (str, optional): File for the SQLite backend. Defaults to "astrobot_cache".
+            url (str, optional): Server URL for the Redis backend. Defaults to "redis://localhost:6379/0".
+
+        Returns:
+            CacheBackend: The configured backend.
+        """
+        if backend == Backend.sqlite:
+            Cache.backend = SQLiteCache(path=path)
+        elif backend == Backend.redis:
+            Cache.backend = RedisCache(url=url)
+        else:
+            Cache.backend = MemoryCache()
+
+        logging.info("Using cache backend: %s (%s)", backend.name, backend.full)
+        return Cache.backend
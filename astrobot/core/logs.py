@@ -0,0 +1,91 @@
+# External
+import logging, atexit, json, queue, random, sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, for log collectors.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict = {"time":      f"{self.formatTime(record, self.datefmt)}.{int(record.msecs):03d}",
+                       "level":     record.levelname,
+                       "process":   record.processName,
+                       "logger":    record.name,
+                       "file":      record.filename,
+                       "line":      record.lineno,
+                       "message":   record.getMessage()}
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class SampleFilter(logging.Filter):
+    """Lets through a fraction of records, chosen at random. Used for high-volume request logs.
+    """
+    def __init__(self, rate: float = 1.0) -> None:
+        """Lets through a fraction of records, chosen at random. Used for high-volume request logs.
+
+        Args:
+            rate (float, optional): Fraction to keep, 0-1. Defaults to 1.0, all.
+        """
+        super().__init__()
+        self.rate: float = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.rate >= 1.0 or random.random() < self.rate
+
+class LogQueue(QueueHandler):
+    """Queue handler that hands records over untouched, so formatting happens on the listener thread.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+class Logs:
+    """Process-wide logging pipeline. Records go onto a queue and are formatted and written by a background thread,
+    so logging never blocks the event loop.
+    """
+    requests: logging.Logger        = logging.getLogger("astrobot.requests")   # Per-request logs, can be sampled
+    format: str                     = "[%(asctime)s.%(msecs)03d][%(levelname)s][%(processName)s][%(filename)s:%(lineno)s] %(message)s"
+    datefmt: str                    = "%Y-%m-%d %H:%M:%S"
+    __listener: QueueListener | None = None
+
+    @staticmethod
+    def setup(level: int = logging.INFO, as_json: bool = False, sample: float = 1.0) -> None:
+        """Replace any existing root handlers with the queued pipeline.
+
+        Args:
+            level (int, optional): Root log level. Defaults to logging.INFO.
+            as_json (bool, optional): Write JSON lines instead of text. Defaults to False.
+            sample (float, optional): Fraction of request logs to keep, 0-1. Defaults to 1.0, all.
+        """
+        Logs.stop()
+
+        # Writer, on the listener thread
+        stream: logging.StreamHandler   = logging.StreamHandler(sys.stderr)
+        stream.setFormatter(JsonFormatter(datefmt=Logs.datefmt) if as_json else logging.Formatter(fmt=Logs.format, datefmt=Logs.datefmt))
+        records: queue.SimpleQueue      = queue.SimpleQueue()
+        Logs.__listener                 = QueueListener(records, stream, respect_handler_level=True)
+
+        # Producer, on whichever thread logs
+        root: logging.Logger            = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(LogQueue(records))
+        root.setLevel(level)
+
+        # Drop sampled request logs before they're queued
+        for old in Logs.requests.filters[:]:
+            Logs.requests.removeFilter(old)
+        Logs.requests.addFilter(SampleFilter(rate=sample))
+
+        Logs.__listener.start()
+
+    @staticmethod
+    def stop() -> None:
+        """Flush queued records and stop the listener thread.
+        """
+        if Logs.__listener is not None:
+            Logs.__listener.stop()
+            Logs.__listener = None
+
+# Flush whatever is still queued on exit
+atexit.register(Logs.stop)
@@ -0,0 +1,142 @@
+# External
+import logging, cProfile, pstats, io, tracemalloc, functools
+import time as timer
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+
+class Profiler:
+    """Opt-in profiling for commands and background jobs. Arm a target to profile its next N runs.
+
+    Each profiled run is wrapped in cProfile and a tracemalloc snapshot diff. Reports go to directory, and a short
+    top-functions summary is logged. Only one run is profiled at a time; overlapping runs go through unprofiled.
+    cProfile follows the event loop thread, so other tasks running at the same time show up too, and work sent to
+    threads doesn't.
+    """
+    targets: list[str]          = ["horoscope", "chart", "bigthree", "synastry", "transits", "calendar", "precache", "broadcast"]
+    armed: dict[str, int]       = {}
+    directory: str              = "profiles"
+    top: int                    = 5     # Functions in the logged summary
+    report_lines: int           = 40    # Functions and allocation sites in the text report
+    __busy: bool                = False
+
+    @staticmethod
+    def arm(target: str, count: int = 1) -> None:
+        """Profile the next runs of a target.
+
+        Args:
+            target (str): One of targets.
+            count (int, optional): Runs to profile, 0 to disarm. Defaults to 1.
+        """
+        if target not in Profiler.targets:
+            raise ValueError(f"Unknown profile target: {target}")
+        if count > 0:
+            Profiler.armed[target] = count
+        else:
+            Profiler.armed.pop(target, None)
+        logging.info("Profiling armed for next %d run(s) of %s", count, target)
+
+    @staticmethod
+    def arm_from_string(spec: str) -> None:
+        """Arm targets from a string, e.g. "chart:3,precache:1". A target without a count is profiled once.
+
+        Args:
+            spec (str): Comma separated target[:count] pairs.
+        """
+        for part in spec.split(","):
+            if not part.strip():
+                continue
+            target, _, count = part.strip().partition(":")
+            Profiler.arm(target=target, count=int(count or 1))
+
+    @staticmethod
+    def profiled(target: str) -> Callable:
+        """Decorator for an async function, profiling it while its target is armed.
+
+        Args:
+            target (str): One of targets.
+
+        Returns:
+            Callable: The decorator.
+        """
+        def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> Any:
+                if Profiler.armed.get(target, 0) <= 0 or Profiler.__busy:
+                    return await func(*args, **kwargs)
+
+                Profiler.armed[target] -= 1
+                Profiler.__busy = True
+                try:
+                    return await Profiler.__run(target=target, func=func, args=args, kwargs=kwargs)
+                finally:
+                    Profiler.__busy = False
+            return wrapper
+        return decorator
+
+    @staticmethod
+    async def __run(target: str, func: Callable[..., Awaitable[Any]], args: tuple, kwargs: dict) -> Any:
+        """Run a function under cProfile and tracemalloc, then write and log the report.
+
+        Args:
+            target (str): Target name, for the report.
+            func (Callable[..., Awaitable[Any]]): Function to run.
+            args (tuple): Positional arguments.
+            kwargs (dict): Keyword arguments.
+
+        Returns:
+            Any: The function's result.
+        """
+        tracing: bool                   = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        before: tracemalloc.Snapshot    = tracemalloc.take_snapshot()
+        profile: cProfile.Profile       = cProfile.Profile()
+
+        tic = timer.perf_counter()
+        profile.enable()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            profile.disable()
+            elapsed: float              = timer.perf_counter() - tic
+            after: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+            if not tracing:
+                tracemalloc.stop()
+            Profiler.__report(target=target, profile=profile, before=before, after=after, elapsed=elapsed)
+
+    @staticmethod
+    def __report(target: str, profile: cProfile.Profile, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, elapsed: float) -> None:
+        """Write a .prof file for pstats/snakeviz and a text report, and log the top functions.
+
+        Args:
+            target (str): Target name.
+            profile (cProfile.Profile): Finished profile.
+            before (tracemalloc.Snapshot): Memory snapshot before the run.
+            after (tracemalloc.Snapshot): Memory snapshot after the run.
+            elapsed (float): Wall time of the run, in seconds.
+        """
+        folder: Path    = Path(Profiler.directory)
+        folder.mkdir(parents=True, exist_ok=True)
+        name: str       = f"{target}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+        profile.dump_stats(folder / f"{name}.prof")
+
+        # Text report, by cumulative time, then allocation growth by line
+        text: io.StringIO       = io.StringIO()
+        stats: pstats.Stats     = pstats.Stats(profile, stream=text).strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE)
+        text.write(f"{target}: {elapsed:0.3f}s wall\n\n")
+        stats.print_stats(Profiler.report_lines)
+        text.write("Memory growth by line:\n")
+        for diff in after.compare_to(before, "lineno")[:Profiler.report_lines]:
+            text.write(f"  {diff}\n")
+        (folder / f"{name}.txt").write_text(text.getvalue())
+
+        # Short summary for the log, leaving out the event loop and this wrapper
+        rows: list[tuple[float, str]] = []
+        for (file, line, func), (_, _, _, cumulative, _) in stats.stats.items(): # type: ignore
+            if file.startswith("<") or func.startswith("<") or file in ("base_events.py", "events.py", "profiling.py"):
+                continue
+            rows.append((cumulative, f"{func} ({file}:{line}) {cumulative:0.3f}s"))
+        summary: str = ", ".join(row for _, row in sorted(rows, reverse=True)[:Profiler.top])
+        logging.info("Profiled %s in %0.3fs, report %s.txt. Top: %s", target, elapsed, folder / name, summary)
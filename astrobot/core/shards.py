@@ -0,0 +1,216 @@
+# External
+import logging, asyncio, signal, fcntl, os, uuid, zlib
+import multiprocessing as mp
+import time as timer
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, AbstractAsyncContextManager
+from typing import AsyncIterator
+
+
+class FetchLock(ABC):
+    """Lock shared by shard worker processes, so that only one of them fetches a URL.
+    """
+    @abstractmethod
+    def hold(self, key: str) -> AbstractAsyncContextManager[None]:
+        """Hold the lock for a key.
+
+        Args:
+            key (str): Key to lock, e.g. a URL.
+
+        Returns:
+            AbstractAsyncContextManager[None]: Context holding the lock.
+        """
+
+class SharedLock(FetchLock):
+    """Cross-process lock, striped over byte ranges of a single lock file. Used so that only one process on this host
+    fetches a URL.
+    """
+    stripes: int    = 64
+
+    def __init__(self, path: str) -> None:
+        """Cross-process lock, striped over byte ranges of a single lock file. Used so that only one process on this host
+        fetches a URL.
+
+        Args:
+            path (str): Path of the lock file, shared by all processes.
+        """
+        self.path: str                          = path
+        self.__fd: int                          = -1
+        self.__locks: dict[int, asyncio.Lock]   = {}
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        stripe: int         = zlib.crc32(key.encode()) % SharedLock.stripes
+        lock: asyncio.Lock  = self.__locks.setdefault(stripe, asyncio.Lock())
+
+        # Record locks are owned by the process, so serialize within the process first
+        await lock.acquire()
+        if self.__fd < 0:
+            self.__fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        locking: asyncio.Future = asyncio.ensure_future(asyncio.to_thread(fcntl.lockf, self.__fd, fcntl.LOCK_EX, 1, stripe))
+        try:
+            await asyncio.shield(locking)
+        except BaseException:
+            # The thread takes the stripe even if the wait is cancelled, give both locks back once it has
+            locking.add_done_callback(lambda _: self.__release(lock=lock, stripe=stripe, locking=locking))
+            raise
+        try:
+            yield
+        finally:
+            self.__release(lock=lock, stripe=stripe, locking=locking)
+
+    def __release(self, lock: asyncio.Lock, stripe: int, locking: asyncio.Future) -> None:
+        """Give back a stripe of the lock file, if it was taken, and the process lock in front of it.
+
+        Args:
+            lock (asyncio.Lock): Process lock for the stripe.
+            stripe (int): Byte of the lock file.
+            locking (asyncio.Future): Thread taking the stripe, done.
+        """
+        try:
+            if not locking.cancelled() and locking.exception() is None:
+                fcntl.lockf(self.__fd, fcntl.LOCK_UN, 1, stripe)
+        finally:
+            lock.release()
+
+class RedisLock(FetchLock):
+    """Lock on a Redis-protocol server, so that only one process on any host fetches a URL. Used with the redis cache
+    backend.
+    """
+    ttl: int        = 30_000    # Milliseconds before a lock lapses, in case its holder dies, longer than any fetch
+    poll: float     = 0.05      # Seconds between tries while another process holds a lock
+    release: str    = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+    def __init__(self, url: str = "redis://localhost:6379/0", namespace: str = "astrobot") -> None:
+        """Lock on a Redis-protocol server, so that only one process on any host fetches a URL. Used with the redis cache
+        backend.
+
+        Args:
+            url (str, optional): Server URL. Defaults to "redis://localhost:6379/0".
+            namespace (str, optional): Prefix for all keys. Defaults to "astrobot".
+        """
+        # Only needed for this lock
+        from redis.asyncio import from_url
+
+        self.url: str       = url
+        self.namespace: str = namespace
+        self.__redis        = from_url(url)
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        name: str   = f"{self.namespace}:lock:{key}"
+        token: str  = uuid.uuid4().hex
+        while not await self.__redis.set(name, token, nx=True, px=RedisLock.ttl):
+            await asyncio.sleep(RedisLock.poll)
+        try:
+            yield
+        finally:
+            # Only delete the lock if it's still this one, it may have lapsed and been taken by another process
+            await self.__redis.eval(RedisLock.release, 1, name, token)
+
+class Supervisor:
+    """Runs the bot as several worker processes, each owning a range of shards.
+    """
+    identify_interval: float    = 5.0   # Seconds per shard identify, used to stagger worker starts
+    restart_delay: float        = 5.0   # Seconds to wait before restarting a dead worker
+
+    def __init__(self, workers: int, total_shards: int) -> None:
+        """Runs the bot as several worker processes, each owning a range of shards.
+
+        Args:
+            workers (int): Number of worker processes.
+            total_shards (int): Total number of shards across all workers.
+        """
+        self.workers: int                               = max(1, min(workers, total_shards))
+        self.total_shards: int                          = total_shards
+        self.ranges: list[tuple[int, int]]              = self.__split()
+        self.procs: dict[int, mp.process.BaseProcess]   = {}
+        self.__ctx                                      = mp.get_context("spawn")
+        self.__stopping: bool                           = False
+
+    def __split(self) -> list[tuple[int, int]]:
+        """Split shards evenly between workers.
+
+        Returns:
+            list[tuple[int, int]]: Inclusive (first, last) shard ID for each worker.
+        """
+        ranges: list[tuple[int, int]] = []
+        for i in range(self.workers):
+            first: int  = i * self.total_shards // self.workers
+            last: int   = (i + 1) * self.total_shards // self.workers - 1
+            ranges.append((first, last))
+        return ranges
+
+    def __argv(self, worker: int) -> list[str]:
+        """Command line for a worker.
+
+        Args:
+            worker (int): Worker index.
+
+        Returns:
+            list[str]: Arguments for Main.
+        """
+        first, last     = self.ranges[worker]
+        argv: list[str] = ["run", "--shards", f"{first}-{last}", "--total-shards", str(self.total_shards)]
+        if worker != 0:
+            argv.append("--follower")
+        return argv
+
+    @staticmethod
+    def run_worker(argv: list[str]) -> None:
+        """Entry point for worker processes.
+
+        Args:
+            argv (list[str]): Arguments for Main.
+        """
+        from astrobot.main import Main
+        Main(argv=argv).start()
+
+    def __spawn(self, worker: int) -> None:
+        """Start a worker process.
+
+        Args:
+            worker (int): Worker index.
+        """
+        argv: list[str] = self.__argv(worker=worker)
+        proc            = self.__ctx.Process(target=Supervisor.run_worker, args=(argv,), name=f"astrobot-worker-{worker}")
+        proc.start()
+        self.procs[worker] = proc
+        logging.info("Started worker %d (pid %s) for shards %d-%d", worker, proc.pid, self.ranges[worker][0], self.ranges[worker][1])
+
+    def __stop(self, *_) -> None:
+        """Signal handler, stops all workers.
+        """
+        self.__stopping = True
+        for proc in self.procs.values():
+            if proc.is_alive():
+                proc.terminate()
+
+    def start(self) -> None:
+        """Start all workers and supervise them, restarting any that exit.
+        """
+        signal.signal(signal.SIGTERM, self.__stop)
+        signal.signal(signal.SIGINT, self.__stop)
+        logging.info("Starting %d workers for %d shards...", self.workers, self.total_shards)
+
+        # Stagger starts so workers don't collide on identify
+        for worker in range(self.workers):
+            if worker > 0:
+                shards: int = self.ranges[worker - 1][1] - self.ranges[worker - 1][0] + 1
+                timer.sleep(shards * Supervisor.identify_interval)
+            if self.__stopping:
+                break
+            self.__spawn(worker=worker)
+
+        while not self.__stopping:
+            timer.sleep(1)
+            for worker, proc in list(self.procs.items()):
+                if proc.is_alive() or self.__stopping:
+                    continue
+                logging.warning("Worker %d exited with code %s, restarting in %0.0fs", worker, proc.exitcode, Supervisor.restart_delay)
+                timer.sleep(Supervisor.restart_delay)
+                self.__spawn(worker=worker)
+
+        for proc in self.procs.values():
+            proc.join()
+        logging.info("All workers stopped.")
@@ -0,0 +1,95 @@
+# External
+import logging, asyncio, os, pickle, struct
+import time as timer
+from pathlib import Path
+# Internal
+from astrobot.core.cache import Cache
+from astrobot.modules.gazetteer import PlaceIndex
+
+
+class Snapshot:
+    """Carries in-memory state over a restart, so the bot is warm again without refetching everything.
+
+    A snapshot holds the cache entries of a backend that loses them when the process ends (horoscope pages, geocodes,
+    chart tables and the rest, with their expiry) and the places suggested for autocomplete. It's one file, written
+    to a temporary name and renamed over the last one, starting with a magic string and format version. A snapshot
+    from another version is ignored.
+    """
+    path: str               = ""    # Snapshot file, set by configure, "" if turned off
+    magic: bytes            = b"ASTROBOT-SNAPSHOT"
+    version: int            = 1
+    header: struct.Struct   = struct.Struct("<17sI")
+
+    @staticmethod
+    def configure(path: str) -> None:
+        """Set the snapshot file.
+
+        Args:
+            path (str): File to save to and load from, or "" to turn snapshots off.
+        """
+        Snapshot.path = path
+
+    @staticmethod
+    async def save() -> None:
+        """Write the current state over the snapshot file. The state is gathered on the event loop, then pickled and
+        written in a thread.
+        """
+        if not Snapshot.path:
+            return
+        tic = timer.perf_counter()
+        state: dict = {"created":   timer.time(),
+                       "cache":     await Cache.backend.snapshot(),
+                       "places":    PlaceIndex.recent()}
+        size: int   = await asyncio.to_thread(Snapshot.__write, Snapshot.path, state)
+        toc = timer.perf_counter()
+        logging.info("Saved snapshot to %s: %0.1fKB in %0.3fs", Snapshot.path, size / 1024, toc - tic)
+
+    @staticmethod
+    def __write(path: str, state: dict) -> int:
+        """Pickle state and write it over a snapshot file, through a temporary file so a crash never leaves half a snapshot.
+
+        Args:
+            path (str): Snapshot file.
+            state (dict): State to save.
+
+        Returns:
+            int: Bytes written.
+        """
+        data: bytes = Snapshot.header.pack(Snapshot.magic, Snapshot.version) + pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp: Path   = Path(path + ".tmp")
+        with open(tmp, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, path)
+        return len(data)
+
+    @staticmethod
+    async def load() -> bool:
+        """Restore state from the snapshot file, leaving out expired entries. Whatever is missing or stale is fetched
+        again as usual.
+
+        Returns:
+            bool: True if a snapshot was loaded.
+        """
+        if not Snapshot.path or not os.path.exists(Snapshot.path):
+            return False
+        tic = timer.perf_counter()
+        try:
+            with open(Snapshot.path, "rb") as file:
+                magic, version  = Snapshot.header.unpack(file.read(Snapshot.header.size))
+                if magic != Snapshot.magic or version != Snapshot.version:
+                    logging.warning("Ignoring snapshot %s: format %s, expected %s", Snapshot.path, version, Snapshot.version)
+                    return False
+                state: dict     = pickle.load(file)
+        except (OSError, struct.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logging.warning("Ignoring unreadable snapshot %s: %s", Snapshot.path, str(e) or type(e).__name__)
+            return False
+
+        restored: int = await Cache.backend.restore(snapshot=state["cache"]) if state["cache"] is not None else 0
+        for query in state["places"]:
+            PlaceIndex.remember(query=query)
+
+        toc = timer.perf_counter()
+        logging.info("Loaded snapshot from %s, %0.0f minutes old: %d cache entries, %d places in %0.3fs", Snapshot.path, (timer.time() - state["created"]) / 60, restored, len(state["places"]), toc - tic)
+        return True
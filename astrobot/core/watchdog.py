@@ -0,0 +1,141 @@
+# External
+import logging, asyncio, sys, threading, traceback
+import time as timer
+from collections import deque
+from pathlib import Path
+from types import FrameType
+import numpy as np
+
+
+class Watchdog:
+    """Measures event loop lag, and logs the blocking code's stack when the loop stalls.
+
+    A task on the loop sleeps for interval and records how late it wakes up. A thread watches the task's heartbeat;
+    when it goes quiet for longer than threshold, the thread captures the loop thread's stack, which is the code
+    holding the loop, and logs it with the command or job it was called from. The thread stops with the task, or when
+    the loop stops running.
+    """
+    interval: float         = 0.1   # Seconds between heartbeats
+    report_interval: float  = 60.0  # Seconds between metric logs
+    samples: int            = 1200  # Lag samples kept for metrics, ~2 minutes at interval
+    package: Path           = Path(__file__).resolve().parent.parent    # The astrobot package, wherever it's installed
+    skipped: tuple[str, ...] = ("profiling.py", "watchdog.py", "loadtest.py")  # Wrappers that are never the origin
+
+    def __init__(self, threshold: float = 0.25) -> None:
+        """Measures event loop lag, and logs the blocking code's stack when the loop stalls.
+
+        Args:
+            threshold (float, optional): Seconds of lag that count as a stall. Defaults to 0.25.
+        """
+        self.threshold: float           = threshold
+        self.lag: float                 = 0.0
+        self.stalls: int                = 0
+        self.history: deque[float]      = deque(maxlen=Watchdog.samples)
+        self.__beat: float              = timer.monotonic()
+        self.__loop_thread: int         = 0
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__task: asyncio.Task | None = None
+        self.__stopped: threading.Event = threading.Event()
+
+    def metrics(self) -> dict[str, float]:
+        """Current lag metrics.
+
+        Returns:
+            dict[str, float]: lag_ms (latest), p50_ms, p99_ms and max_ms over recent samples, and stalls since start.
+        """
+        recent: np.ndarray = np.array(self.history or [0.0]) * 1000
+        return {"lag_ms":   self.lag * 1000,
+                "p50_ms":   float(np.percentile(recent, 50)),
+                "p99_ms":   float(np.percentile(recent, 99)),
+                "max_ms":   float(recent.max()),
+                "stalls":   self.stalls}
+
+    def start(self) -> None:
+        """Start watching the running event loop. Call from a coroutine on that loop.
+        """
+        if self.__task is not None:
+            return
+        self.__loop_thread  = threading.get_ident()
+        self.__loop         = asyncio.get_running_loop()
+        self.__beat         = timer.monotonic()
+        self.__stopped.clear()
+        self.__task         = asyncio.create_task(self.__measure())
+        threading.Thread(target=self.__watch, name="astrobot-watchdog", daemon=True).start()
+        logging.info("Loop watchdog started, stall threshold %0.0fms", self.threshold * 1000)
+
+    def stop(self) -> None:
+        """Stop watching. Also happens when the heartbeat task is cancelled, e.g. as the loop shuts down.
+        """
+        self.__stopped.set()
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    async def __measure(self) -> None:
+        """Heartbeat task, records lag as how late each sleep wakes up.
+        """
+        reported: float = timer.monotonic()
+        try:
+            while True:
+                expected: float = timer.monotonic() + Watchdog.interval
+                await asyncio.sleep(Watchdog.interval)
+                now: float      = timer.monotonic()
+                self.__beat     = now
+                self.lag        = max(0.0, now - expected)
+                self.history.append(self.lag)
+
+                if now - reported >= Watchdog.report_interval:
+                    reported    = now
+                    m           = self.metrics()
+                    logging.info("Loop lag: p50 %.1fms, p99 %.1fms, max %.1fms, %d stalls", m["p50_ms"], m["p99_ms"], m["max_ms"], m["stalls"])
+        finally:
+            self.__stopped.set()
+
+    def __watch(self) -> None:
+        """Watcher thread, reports each stall once with the loop thread's stack, until stopped or the loop stops.
+        """
+        stalled: bool = False
+        while not self.__stopped.wait(Watchdog.interval / 2):
+            # A loop that stopped or closed without cancelling the task isn't blocked, it's gone
+            if self.__loop is None or self.__loop.is_closed() or not self.__loop.is_running():
+                break
+            quiet: float = timer.monotonic() - self.__beat - Watchdog.interval
+            if quiet < self.threshold:
+                stalled = False
+                continue
+            if stalled:
+                continue
+
+            stalled     = True
+            self.stalls += 1
+            frame: FrameType | None = sys._current_frames().get(self.__loop_thread)
+            if frame is None:
+                continue
+            stack: str  = "".join(traceback.format_stack(frame))
+            logging.warning("Event loop blocked for %0.0fms+ in %s\n%s", quiet * 1000, Watchdog.origin(frame=frame), stack)
+
+    @staticmethod
+    def origin(frame: FrameType) -> str:
+        """Find the command or job that led to a frame: the outermost function from the astrobot package since the
+        event loop ran the current callback.
+
+        Args:
+            frame (FrameType): Innermost frame of the blocked thread.
+
+        Returns:
+            str: e.g. "Commands.chart (user 1234)", or "unknown" if no astrobot code is on the stack.
+        """
+        found: str              = "unknown"
+        current: FrameType | None = frame
+        while current is not None:
+            code = current.f_code
+            if code.co_filename.endswith(("asyncio/events.py", "asyncio\\events.py")):
+                break
+            path: Path = Path(code.co_filename).resolve()
+            if Watchdog.package in path.parents and path.name not in Watchdog.skipped:
+                found = code.co_qualname
+                ctx = current.f_locals.get("ctx")
+                if ctx is not None and hasattr(ctx, "author_id"):
+                    found += f" (user {ctx.author_id})"
+            current = current.f_back
+        return found
@@ -1,21 +1,66 @@
 # External
-import logging, sys
+import logging, sys, argparse, asyncio
 from os import getenv
+from datetime import datetime
+from pathlib import Path
 from dotenv import load_dotenv
 # Internal
 from astrobot.core.bot import Bot
+from astrobot.core.cache import Backend, Cache
+from astrobot.core.logs import Logs
+from astrobot.core.profiling import Profiler
+from astrobot.core.admission import Admission
+from astrobot.core.shards import SharedLock, RedisLock, Supervisor
+from astrobot.core.snapshot import Snapshot
+from astrobot.core.astrology import ZodiacSign
+from astrobot.modules.common import Day, Source, Style
+from astrobot.modules.horoscope import Get, HoroItem, UrlBuilder
+from astrobot.modules.ephemeris import Calendar
+from astrobot.modules.chart import BigThree
+from astrobot.modules.gazetteer import Gazetteer
+from astrobot.modules.archive import HoroArchive
+from astrobot.modules.search import HoroSearch
+from astrobot.modules.bulk import BulkCharts
+from astrobot.modules.export import HoroExport
+from astrobot.bot.loadtest import LoadTest
 
 
 class Main:
     """Main class to run AstroBot.
     """
-    def __init__(self) -> None:
+    def __init__(self, argv: list[str] | None = None) -> None:
         """Main class to run AstroBot.
+
+        Args:
+            argv (list[str] | None, optional): Command line arguments. Defaults to None, use sys.argv.
         """
         self.TOKEN: str     = ""
         self.GEO_API: str  = ""
         self.LOGLEVEL: str  = ""
-        
+        self.BROADCAST_TIME: str = ""
+        self.CACHE_BACKEND: str = ""
+        self.CACHE_PATH: str = ""
+        self.CACHE_URL: str = ""
+        self.FALLBACK: str = ""
+        self.STREAM_PAGES: str = ""
+        self.WARM_COLD: str = ""
+        self.SNAPSHOT_PATH: str = ""
+        self.LOG_FORMAT: str = ""
+        self.LOG_SAMPLE: str = ""
+        self.PROFILE: str = ""
+        self.PROFILE_DIR: str = ""
+        self.LAG_THRESHOLD: str = ""
+        self.GAZETTEER: str = ""
+        self.ARCHIVE_PATH: str = ""
+        self.SEARCH_PATH: str = ""
+        self.CHART_CONCURRENCY: str = ""
+        self.CHART_QUEUE: str = ""
+        self.USER_LIMIT: str = ""
+        self.GUILD_LIMIT: str = ""
+
+        # Parse command line
+        self.args: argparse.Namespace = self.__parse_args(argv=argv)
+
         # Load environment vars
         load, msg = self.__load_env()
         if not load:
@@ -25,8 +70,123 @@ class Main:
         # Setup logging
         self.__set_logging()
 
-        # Setup data and bot
-        self.bot: Bot       = Bot(token=self.TOKEN, geo_api=self.GEO_API)
+        # Benchmarks don't need the bot
+        if self.args.mode == "bench":
+            return
+
+        # Bulk charts only need the Geocoder and its cache
+        if self.args.mode == "charts":
+            Cache.configure(backend=Backend[self.CACHE_BACKEND], path=self.CACHE_PATH, url=self.CACHE_URL)
+            Gazetteer.configure(path=self.GAZETTEER)
+            self.bulk: BulkCharts = BulkCharts(geo_api=self.GEO_API,
+                                               path=self.args.input,
+                                               output=self.args.output,
+                                               format=self.args.format,
+                                               workers=self.args.workers)
+            return
+
+        # Headless horoscopes only need the cache
+        if self.args.mode == "horoscopes":
+            Cache.configure(backend=Backend[self.CACHE_BACKEND], path=self.CACHE_PATH, url=self.CACHE_URL)
+            HoroArchive.configure(path=self.ARCHIVE_PATH)
+            HoroSearch.configure(path=self.SEARCH_PATH)
+            Get.streaming   = self.STREAM_PAGES.lower() == "true"
+            if self.args.base_url:
+                UrlBuilder.override_base(base=self.args.base_url)
+            self.export: HoroExport = HoroExport(days=self.args.days,
+                                                 sources=self.args.sources,
+                                                 styles=self.args.styles,
+                                                 signs=self.args.signs,
+                                                 output=self.args.output,
+                                                 warm_only=self.args.warm_only)
+            return
+
+        # Setup the supervisor for shard workers, each worker sets up its own cache and bot
+        if self.args.mode == "shards":
+            self.supervisor: Supervisor = Supervisor(workers=self.args.workers, total_shards=self.args.total_shards)
+            return
+
+        # Setup cache backend, data and bot
+        Cache.configure(backend=Backend[self.CACHE_BACKEND], path=self.CACHE_PATH, url=self.CACHE_URL)
+        Gazetteer.configure(path=self.GAZETTEER)
+        HoroArchive.configure(path=self.ARCHIVE_PATH)
+        HoroSearch.configure(path=self.SEARCH_PATH)
+        HoroItem.fallback   = self.FALLBACK.lower() == "true"
+        Get.streaming       = self.STREAM_PAGES.lower() == "true"
+        HoroItem.warm_cold  = self.WARM_COLD.lower() == "true"
+
+        shard_ids: list[int] | None = None
+        snapshot: str       = self.SNAPSHOT_PATH
+        if self.args.shards is not None:
+            first, last     = self.args.shards
+            shard_ids       = list(range(first, last + 1))
+            Get.shared_lock = RedisLock(url=self.CACHE_URL) if self.CACHE_BACKEND == "redis" else SharedLock(path=self.CACHE_PATH + ".lock")
+            snapshot        = f"{snapshot}.{first}-{last}" if snapshot else ""
+        Snapshot.configure(path=snapshot)
+
+        self.bot: Bot       = Bot(token=self.TOKEN,
+                                  geo_api=self.GEO_API,
+                                  broadcast_time=self.BROADCAST_TIME,
+                                  shard_ids=shard_ids,
+                                  total_shards=self.args.total_shards,
+                                  leader=not self.args.follower,
+                                  lag_threshold=int(self.LAG_THRESHOLD) / 1000)
+
+    def __parse_args(self, argv: list[str] | None) -> argparse.Namespace:
+        """Parses command line arguments.
+
+        Args:
+            argv (list[str] | None): Command line arguments, None for sys.argv.
+
+        Returns:
+            argparse.Namespace: Parsed arguments. Mode defaults to "run".
+        """
+        def shard_range(value: str) -> tuple[int, int]:
+            first, _, last = value.partition("-")
+            return int(first), int(last or first)
+
+        parser: argparse.ArgumentParser = argparse.ArgumentParser(prog="astrobot", description="Discord bot for daily horoscopes and natal charts.")
+        parser.set_defaults(mode="run", shards=None, total_shards=None, follower=False)
+        modes = parser.add_subparsers(dest="mode")
+
+        run = modes.add_parser("run", help="Run the bot in this process (default).")
+        run.add_argument("--shards", type=shard_range, help="Inclusive shard ID range to run, e.g. 0-3.")
+        run.add_argument("--total-shards", type=int, help="Total number of shards across all processes.")
+        run.add_argument("--follower", action="store_true", help="Don't warm the cache, sync commands or broadcast; another process does.")
+
+        shards = modes.add_parser("shards", help="Run shard ranges in several worker processes under a supervisor.")
+        shards.add_argument("--workers", type=int, required=True, help="Number of worker processes.")
+        shards.add_argument("--total-shards", type=int, required=True, help="Total number of shards.")
+
+        bench = modes.add_parser("bench", help="Run a benchmark, no Discord token needed.")
+        bench.add_argument("target", choices=["calendar", "bigthree", "load"], help="What to benchmark. calendar: range engine against a per-day kerykeion loop. bigthree: sun, moon and rising against a full ChartUser. load: command handlers under concurrent requests.")
+        bench.add_argument("--year", type=int, default=datetime.today().year, help="Year for calendar, defaults to this year.")
+        bench.add_argument("--month", type=int, default=datetime.today().month, help="Month for calendar, defaults to this month.")
+        bench.add_argument("--runs", type=int, default=200, help="Births for bigthree, defaults to 200.")
+        bench.add_argument("--requests", type=int, default=200, help="Requests for load, defaults to 200.")
+        bench.add_argument("--concurrency", type=int, default=10, help="Requests in flight for load, defaults to 10.")
+        bench.add_argument("--mix", type=LoadTest.parse_mix, default="horoscope=0.8,chart=0.2", help="Command weights for load, from horoscope, chart and bigthree, defaults to horoscope=0.8,chart=0.2.")
+        bench.add_argument("--origin-ms", type=float, default=0.0, help="Latency added to each fixture response for load, defaults to 0.")
+
+        charts = modes.add_parser("charts", help="Compute charts for many people from a file, no Discord token needed.")
+        charts.add_argument("input", help="CSV (with a header row) or JSONL file with name, location, birthday [MM/DD/YYYY] and time [HH:MM].")
+        charts.add_argument("--output", type=argparse.FileType("w", encoding="utf-8"), default=sys.stdout, help="Output file, defaults to stdout.")
+        charts.add_argument("--format", choices=["jsonl", "table"], default="jsonl", help="jsonl: chart data per line (default). table: rendered tables.")
+        charts.add_argument("--workers", type=int, help="Worker processes, defaults to one per CPU.")
+
+        horoscopes = modes.add_parser("horoscopes", help="Fetch horoscopes without Discord and dump them as JSON, with stage timings.")
+        horoscopes.add_argument("--days", nargs="+", type=lambda v: Day[v], metavar="DAY", help=f"Days to fetch: {', '.join(Day.__members__)}. Defaults to all.")
+        horoscopes.add_argument("--sources", nargs="+", type=lambda v: Source[v], metavar="SOURCE", help=f"Sources to fetch: {', '.join(Source.__members__)}. Defaults to all.")
+        horoscopes.add_argument("--styles", nargs="+", type=lambda v: Style[v], metavar="STYLE", help=f"Styles to fetch: {', '.join(Style.__members__)}. Defaults to all.")
+        horoscopes.add_argument("--signs", nargs="+", type=lambda v: ZodiacSign[v], metavar="SIGN", help="Signs to fetch, e.g. aries leo. Defaults to all.")
+        horoscopes.add_argument("--base-url", help="Fetch from this server instead, e.g. local fixtures at http://localhost:8000/<source>/...")
+        horoscopes.add_argument("--output", type=argparse.FileType("w", encoding="utf-8"), default=sys.stdout, help="Output file, defaults to stdout.")
+        horoscopes.add_argument("--warm-only", action="store_true", help="Only fill the cache, like precache, with no output.")
+
+        args: argparse.Namespace = parser.parse_args(argv)
+        if args.mode == "run" and args.shards is not None and args.total_shards is None:
+            parser.error("--shards requires --total-shards")
+        return args
 
     def __load_env(self) -> tuple[bool, str]:
         """Loads from .env using dotenv.
@@ -38,25 +198,118 @@ class Main:
         self.TOKEN: str     = getenv("TOKEN", default="none")
         self.GEO_API: str  = getenv("GEO_API", default="none")
         self.LOGLEVEL: str  = getenv("LOGLEVEL", default="error")
+        self.BROADCAST_TIME: str = getenv("BROADCAST_TIME", default="08:00")
+        self.CACHE_BACKEND: str = getenv("CACHE_BACKEND", default="sqlite")
+        self.CACHE_PATH: str = getenv("CACHE_PATH", default="astrobot_cache")
+        self.CACHE_URL: str = getenv("CACHE_URL", default="redis://localhost:6379/0")
+        self.FALLBACK: str = getenv("FALLBACK", default="true")
+        self.STREAM_PAGES: str = getenv("STREAM_PAGES", default="true")
+        self.WARM_COLD: str = getenv("WARM_COLD", default="true")
+        self.SNAPSHOT_PATH: str = getenv("SNAPSHOT_PATH", default="astrobot_snapshot")
+        self.LOG_FORMAT: str = getenv("LOG_FORMAT", default="text")
+        self.LOG_SAMPLE: str = getenv("LOG_SAMPLE", default="1.0")
+        self.PROFILE: str = getenv("PROFILE", default="")
+        self.PROFILE_DIR: str = getenv("PROFILE_DIR", default="profiles")
+        self.LAG_THRESHOLD: str = getenv("LAG_THRESHOLD", default="250")
+        self.GAZETTEER: str = getenv("GAZETTEER", default="")
+        self.ARCHIVE_PATH: str = getenv("ARCHIVE_PATH", default="astrobot_archive")
+        self.SEARCH_PATH: str = getenv("SEARCH_PATH", default="astrobot_search")
+        self.CHART_CONCURRENCY: str = getenv("CHART_CONCURRENCY", default="4")
+        self.CHART_QUEUE: str = getenv("CHART_QUEUE", default="32")
+        self.USER_LIMIT: str = getenv("USER_LIMIT", default="3/60")
+        self.GUILD_LIMIT: str = getenv("GUILD_LIMIT", default="30/60")
+
+        if self.CACHE_BACKEND not in Backend.__members__:
+            return False, f"Unknown cache backend! Set CACHE_BACKEND in .env to one of: {', '.join(Backend.__members__)}, see .env.example"
+
+        # Shard workers only share a cache, and fetch each page once, through a file or server
+        if (self.args.mode == "shards" or self.args.shards is not None) and self.CACHE_BACKEND == "memory":
+            return False, "The memory cache backend isn't shared between shard workers! Set CACHE_BACKEND in .env to sqlite or redis, see .env.example"
+
+        if self.LOG_FORMAT not in ("text", "json"):
+            return False, "Unknown log format! Set LOG_FORMAT in .env to text or json, see .env.example"
+
+        try:
+            if not 0.0 <= float(self.LOG_SAMPLE) <= 1.0:
+                raise ValueError
+        except ValueError:
+            return False, "Bad log sample rate! Set LOG_SAMPLE in .env between 0 and 1, see .env.example"
+
+        if not self.LAG_THRESHOLD.isdigit():
+            return False, "Bad lag threshold! Set LAG_THRESHOLD in .env in milliseconds, see .env.example"
 
-        if (self.TOKEN == "none"): 
+        try:
+            Profiler.directory = self.PROFILE_DIR
+            Profiler.arm_from_string(spec=self.PROFILE)
+        except ValueError:
+            return False, f"Bad profile targets! Set PROFILE in .env as target:count pairs from: {', '.join(Profiler.targets)}, see .env.example"
+
+        try:
+            Admission.configure(concurrency=int(self.CHART_CONCURRENCY), queue_size=int(self.CHART_QUEUE),
+                                user_limit=self.USER_LIMIT, guild_limit=self.GUILD_LIMIT)
+        except ValueError:
+            return False, "Bad admission limits! Set CHART_CONCURRENCY and CHART_QUEUE in .env as whole numbers, and USER_LIMIT and GUILD_LIMIT as requests/seconds, see .env.example"
+
+        # Only the bot needs a Discord token, the bot and bulk charts need the Geocoder
+        if self.args.mode in ("run", "shards") and (self.TOKEN == "none"):
             return False, "Missing Discord bot token! Set TOKEN in .env, see .env.example"
-        
-        if (self.GEO_API == "none"):
-            return False, "Missing Geocoder API key! Set GEO_API in .env, see .env.example"
-        
+
+        if self.GAZETTEER and not Path(self.GAZETTEER).is_file():
+            return False, "Gazetteer file not found! Set GAZETTEER in .env to a GeoNames cities file, or leave it empty, see .env.example"
+
+        # With a gazetteer the Geocoder is only a fallback for places it doesn't know, and can be left out
+        if self.args.mode in ("run", "shards", "charts") and (self.GEO_API == "none") and not self.GAZETTEER:
+            return False, "Missing Geocoder API key! Set GEO_API or GAZETTEER in .env, see .env.example"
+
+        try:
+            datetime.strptime(self.BROADCAST_TIME, "%H:%M")
+        except ValueError:
+            return False, "Bad broadcast time! Set BROADCAST_TIME in .env as HH:MM, see .env.example"
+
         return True, ""
 
     def __set_logging(self) -> None:
-        """Sets logging options and format.
+        """Sets logging options and format. Records are queued and written by a background thread.
         """
         logopt: dict[str, int]  = { "debug": logging.DEBUG, "info": logging.INFO, "warning": logging.WARNING , "error": logging.ERROR, "critical": logging.CRITICAL }
-        format: str             = "[%(asctime)s.%(msecs)03d][%(levelname)s][%(filename)s:%(lineno)s] %(message)s"
-        datefmt: str            = "%Y-%m-%d %H:%M:%S"
         level: int              = logopt.get(self.LOGLEVEL, logging.INFO)
-        logging.basicConfig(format=format, datefmt=datefmt, level=level)
+        Logs.setup(level=level, as_json=self.LOG_FORMAT == "json", sample=float(self.LOG_SAMPLE))
 
     def start(self) -> None:
-        """Starts the bot.
+        """Starts the bot, or the supervisor, benchmark, bulk charts or headless horoscopes for those modes.
+        """
+        if self.args.mode == "shards":
+            self.supervisor.start()
+        elif self.args.mode == "bench":
+            self.__bench()
+        elif self.args.mode == "charts":
+            self.bulk.start()
+        elif self.args.mode == "horoscopes":
+            self.export.start()
+        else:
+            try:
+                self.bot.start()
+            finally:
+                asyncio.run(Snapshot.save())
+
+    def __bench(self) -> None:
+        """Runs the selected benchmark and prints the results.
         """
-        self.bot.start()
\ No newline at end of file
+        if self.args.target == "calendar":
+            result: dict[str, float] = Calendar.benchmark(year=self.args.year, month=self.args.month)
+            print(f"Calendar {self.args.year:04d}-{self.args.month:02d}")
+            print(f"  range engine:          {result['engine'] * 1000:8.1f} ms (events to the minute)")
+            print(f"  kerykeion daily loop:  {result['kerykeion_daily'] * 1000:8.1f} ms (positions only, to the day)")
+            print(f"  speedup:               {result['speedup']:8.1f}x")
+        elif self.args.target == "bigthree":
+            result = BigThree.benchmark(runs=self.args.runs)
+            print(f"Big three, {self.args.runs} births")
+            print(f"  big three:             {result['big_three'] * 1000:8.3f} ms per birth (sun, moon and rising)")
+            print(f"  full ChartUser:        {result['chart_user'] * 1000:8.3f} ms per birth (all points, houses, aspects and tables)")
+            print(f"  speedup:               {result['speedup']:8.1f}x")
+            print(f"  mismatches:            {result['mismatches']:8d}   (placements that differ from the full chart)")
+        elif self.args.target == "load":
+            LoadTest(requests=self.args.requests,
+                     concurrency=self.args.concurrency,
+                     mix=self.args.mix,
+                     origin_delay=self.args.origin_ms / 1000).start()
\ No newline at end of file
@@ -0,0 +1,164 @@
+# External
+import logging, asyncio, fcntl, json, os, struct, threading, zlib
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
+# Internal
+from astrobot.core.common import Misc
+from astrobot.core.astrology import ZodiacSign
+from astrobot.modules.common import Source, Style
+
+
+class HoroArchive:
+    """Append-only archive of parsed horoscopes, so past dates can be served after the cache expires.
+
+    Each horoscope is compressed on its own and appended to a segment file per month. A fixed-width index file maps
+    (date, source, style, sign) to the segment, offset and length, so a read is one seek and one decompress. The
+    index is loaded into memory at startup; appends take a file lock, so shard workers can share one archive, and
+    entries appended by other processes are picked up by reading the index from where this process left off.
+    """
+    active: "HoroArchive | None"    = None                      # Process-wide archive, set by configure
+    record: struct.Struct           = struct.Struct("<IBBBxIII") # Date ordinal, source, style, sign, segment (YYYYMM), offset, length
+    level: int                      = 9                         # zlib compression level
+
+    def __init__(self, path: str) -> None:
+        """Append-only archive of parsed horoscopes.
+
+        Args:
+            path (str): Folder for the index and segment files, created if missing.
+        """
+        self.folder: Path                                       = Path(path)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.index: Path                                        = self.folder / "index.bin"
+        self.entries: dict[tuple[int, int, int, int], tuple[int, int, int]] = {}
+        self.__read_to: int                                     = 0
+        self.__lock: threading.Lock                             = threading.Lock()  # Index reads, from the loop and writer threads
+
+        with open(self.index, "ab+") as file:
+            self.__refresh(file=file)
+        logging.info("Horoscope archive at %s: %d horoscopes", self.folder, len(self.entries))
+
+    @staticmethod
+    def configure(path: str) -> "HoroArchive | None":
+        """Set the process-wide archive.
+
+        Args:
+            path (str): Archive folder, or "" to disable archiving.
+
+        Returns:
+            HoroArchive | None: The archive, None if disabled.
+        """
+        HoroArchive.active = HoroArchive(path=path) if path else None
+        return HoroArchive.active
+
+    @staticmethod
+    def key(date: datetime, source: Source, style: Style, sign: ZodiacSign) -> tuple[int, int, int, int]:
+        """Index key for a horoscope. Enum members are stored by position, so new members must be added at the end.
+
+        Args:
+            date (datetime): Date of the horoscope.
+            source (Source): Source of the horoscope.
+            style (Style): Style of the horoscope.
+            sign (ZodiacSign): Zodiac sign.
+
+        Returns:
+            tuple[int, int, int, int]: Date ordinal and enum positions.
+        """
+        return date.toordinal(), list(Source).index(source), list(Style).index(style), list(ZodiacSign).index(sign)
+
+    def __refresh(self, file: BinaryIO) -> None:
+        """Load index records appended since the last read, by this or another process.
+
+        Args:
+            file (BinaryIO): Index file, opened for reading.
+        """
+        with self.__lock:
+            file.seek(self.__read_to)
+            data: bytes     = file.read()
+            whole: int      = len(data) - len(data) % HoroArchive.record.size
+            for date, source, style, sign, segment, offset, length in HoroArchive.record.iter_unpack(data[:whole]):
+                self.entries[(date, source, style, sign)] = (segment, offset, length)
+            self.__read_to  += whole
+
+    def __segment(self, segment: int) -> Path:
+        return self.folder / f"{segment // 100:04d}-{segment % 100:02d}.z"
+
+    def __append(self, records: list[tuple[tuple[int, int, int, int], bytes]]) -> int:
+        """Append compressed horoscopes to their segments and the index, under the index file lock.
+
+        Args:
+            records (list[tuple[tuple[int, int, int, int], bytes]]): Index key and uncompressed payload.
+
+        Returns:
+            int: Horoscopes added, leaving out any another process archived first.
+        """
+        added: int = 0
+        with open(self.index, "ab+") as index:
+            fcntl.flock(index, fcntl.LOCK_EX)
+            try:
+                self.__refresh(file=index)
+                for key, payload in records:
+                    if key in self.entries:
+                        continue
+                    day: datetime       = datetime.fromordinal(key[0])
+                    segment: int        = day.year * 100 + day.month
+                    blob: bytes         = zlib.compress(payload, HoroArchive.level)
+                    with open(self.__segment(segment=segment), "ab") as file:
+                        offset: int     = file.tell()
+                        file.write(blob)
+                    index.write(HoroArchive.record.pack(*key, segment, offset, len(blob)))
+                    self.entries[key]   = (segment, offset, len(blob))
+                    added += 1
+                index.flush()
+                os.fsync(index.fileno())
+                with self.__lock:
+                    self.__read_to      = index.tell()
+            finally:
+                fcntl.flock(index, fcntl.LOCK_UN)
+        return added
+
+    async def add(self, horos: list) -> None:
+        """Archive horoscopes that aren't archived yet. Writes happen off the event loop.
+
+        Args:
+            horos (list): Horo objects.
+        """
+        records: list[tuple[tuple[int, int, int, int], bytes]] = []
+        for hor in horos:
+            try:
+                date: datetime = Misc.get_date_from_string(string=hor.date)
+            except ValueError:
+                logging.debug("Not archiving horoscope with unreadable date: %s", hor.date)
+                continue
+            key = HoroArchive.key(date=date, source=hor.source, style=hor.style, sign=hor.sign)
+            if key not in self.entries:
+                records.append((key, json.dumps({"date": hor.date, "text": hor.text, "url": hor.url}, ensure_ascii=False).encode()))
+
+        if records:
+            added: int = await asyncio.to_thread(self.__append, records)
+            logging.debug("Archived %d horoscopes", added)
+
+    def get(self, date: datetime, source: Source, style: Style, sign: ZodiacSign) -> dict | None:
+        """Read an archived horoscope, with one seek and one decompress.
+
+        Args:
+            date (datetime): Date of the horoscope.
+            source (Source): Source of the horoscope.
+            style (Style): Style of the horoscope.
+            sign (ZodiacSign): Zodiac sign.
+
+        Returns:
+            dict | None: Date, text and URL, or None if it isn't archived.
+        """
+        key = HoroArchive.key(date=date, source=source, style=style, sign=sign)
+        if key not in self.entries and self.index.stat().st_size > self.__read_to:
+            with open(self.index, "rb") as index:
+                self.__refresh(file=index)
+        if key not in self.entries:
+            return None
+
+        segment, offset, length = self.entries[key]
+        with open(self.__segment(segment=segment), "rb") as file:
+            file.seek(offset)
+            blob: bytes = file.read(length)
+        return json.loads(zlib.decompress(blob))
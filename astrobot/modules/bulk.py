@@ -0,0 +1,189 @@
+# External
+import logging, asyncio, csv, json, sys
+import multiprocessing as mp
+import time as timer
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, TextIO
+# Internal
+from astrobot.core.cache import Cache
+from astrobot.modules.chart import BirthInput, ChartUser, GeoLookup, Table
+
+
+class BulkCharts:
+    """Charts for many people at once, from a CSV or JSONL file of birth records. No Discord needed.
+
+    Locations are geocoded once each through the cache, then charts are computed across a process pool and written
+    out in input order as they finish.
+    """
+    geo_concurrency: int    = 4     # Geocoder requests in flight at once
+    chunksize: int          = 8     # Records sent to a worker at a time
+    progress_interval: float = 0.5  # Seconds between progress updates
+
+    def __init__(self, geo_api: str, path: str, output: TextIO = sys.stdout, format: str = "jsonl", workers: int | None = None) -> None:
+        """Charts for many people at once, from a CSV or JSONL file of birth records. No Discord needed.
+
+        Args:
+            geo_api (str): API key for Geocoder, used by GeoLookup class.
+            path (str): CSV (with a header row) or JSONL file with name, location, birthday and time for each person.
+            output (TextIO, optional): Where to write results. Defaults to sys.stdout.
+            format (str, optional): "jsonl" for chart data, or "table" for rendered tables. Defaults to "jsonl".
+            workers (int | None, optional): Worker processes. Defaults to None, one per CPU.
+        """
+        self.geo_api: str           = geo_api
+        self.path: Path             = Path(path)
+        self.output: TextIO         = output
+        self.format: str            = format
+        self.workers: int | None    = workers
+
+    @staticmethod
+    def location_key(location: str) -> str:
+        """Normalized location, so spelling variants are geocoded once.
+
+        Args:
+            location (str): A lookup string, e.g. "New York City", "Paris, France"
+
+        Returns:
+            str: Lowercase with single spaces.
+        """
+        return " ".join(location.lower().split())
+
+    def read(self) -> list[dict[str, str]]:
+        """Read birth records, by file extension: .csv, otherwise JSONL.
+
+        Returns:
+            list[dict[str, str]]: Records with name, location, birthday and time. Time defaults to "00:00".
+        """
+        with self.path.open(newline="") as file:
+            if self.path.suffix.lower() == ".csv":
+                rows: list[dict] = list(csv.DictReader(file))
+            else:
+                rows = [json.loads(line) for line in file if line.strip()]
+
+        return [{"name":        str(row.get("name") or f"Record {i + 1}"),
+                 "location":    str(row.get("location", "")),
+                 "birthday":    str(row.get("birthday", "")),
+                 "time":        str(row.get("time") or "00:00")} for i, row in enumerate(rows)]
+
+    async def geocode(self, records: list[dict[str, str]]) -> dict[str, dict | None]:
+        """Geocode each unique location once, through the cache.
+
+        Args:
+            records (list[dict[str, str]]): Birth records.
+
+        Returns:
+            dict[str, dict | None]: Normalized location to GeoLookup.to_dict(), None if the lookup failed.
+        """
+        unique: dict[str, str]          = {BulkCharts.location_key(r["location"]): r["location"] for r in records}
+        limit: asyncio.Semaphore        = asyncio.Semaphore(BulkCharts.geo_concurrency)
+
+        async def lookup(query: str) -> dict | None:
+            async with limit:
+                try:
+                    return (await GeoLookup.fetch(geo_api=self.geo_api, query=query)).to_dict()
+                except Exception as e:
+                    logging.warning("Geocoder lookup failed for '%s': %s", query, e)
+                    return None
+
+        results: list[dict | None]      = await asyncio.gather(*[lookup(query) for query in unique.values()])
+        await Cache.backend.close()
+        logging.info("Geocoded %d unique locations for %d records", len(unique), len(records))
+        return dict(zip(unique.keys(), results))
+
+    @staticmethod
+    def compute(record: dict[str, str], lookup: dict | None, format: str) -> dict:
+        """Compute one chart, in a worker process.
+
+        Args:
+            record (dict[str, str]): Birth record.
+            lookup (dict | None): GeoLookup.to_dict() for the record's location, None if it couldn't be found.
+            format (str): "jsonl" or "table".
+
+        Returns:
+            dict: The record, with "charts" (table rows or rendered tables) or "error".
+        """
+        result: dict = dict(record)
+        if lookup is None:
+            result["error"] = "location not found"
+            return result
+
+        try:
+            # Same parsing as the chart command
+            place, birthday, time = BirthInput.parse(location=record["location"], birthday=record["birthday"], birthtime=record["time"])
+            user: ChartUser = ChartUser(geo_api="",
+                                        name=record["name"],
+                                        location=place,
+                                        birthday=birthday,
+                                        time=time,
+                                        lookup=GeoLookup(geo_api="", query=place, cached=lookup))
+        except Exception as e:
+            result["error"] = str(e)
+            return result
+
+        result.update({"latitude": user.latitude, "longitude": user.longitude, "timezone": user.timezone})
+        if format == "table":
+            result["charts"] = user.get_charts_as_str()
+        else:
+            result["charts"] = {table.name.capitalize(): user.get_chart_data(table_type=table).to_dict(orient="records") for table in Table}
+        return result
+
+    def __write(self, result: dict) -> None:
+        """Write one result in the output format.
+
+        Args:
+            result (dict): Result from compute.
+        """
+        if self.format != "table":
+            self.output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            return
+
+        header: str = f"{result['name']} -- {result['birthday']} {result['time']}, {result['location']}"
+        if "error" in result:
+            self.output.write(f"{header}\nError: {result['error']}\n\n")
+            return
+        self.output.write(header + "\n")
+        for name, table in result["charts"].items():
+            self.output.write(f"{name}\n{table}\n")
+        self.output.write("\n")
+
+    def __results(self, records: list[dict[str, str]], lookups: list[dict | None]) -> Iterator[dict]:
+        """Compute charts across the process pool, in input order as they finish.
+
+        Args:
+            records (list[dict[str, str]]): Birth records.
+            lookups (list[dict | None]): Lookup for each record.
+
+        Yields:
+            Iterator[dict]: Results from compute.
+        """
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=mp.get_context("spawn")) as pool:
+            yield from pool.map(BulkCharts.compute, records, lookups, [self.format] * len(records), chunksize=BulkCharts.chunksize)
+
+    def start(self) -> None:
+        """Read, geocode, compute and write all charts, reporting progress and throughput on stderr.
+        """
+        records: list[dict[str, str]]       = self.read()
+        tic = timer.perf_counter()
+        found: dict[str, dict | None]       = asyncio.run(self.geocode(records=records))
+        lookups: list[dict | None]          = [found[BulkCharts.location_key(r["location"])] for r in records]
+        geocoded: float                     = timer.perf_counter() - tic
+
+        tic = timer.perf_counter()
+        shown: float    = tic
+        done: int       = 0
+        failed: int     = 0
+        for result in self.__results(records=records, lookups=lookups):
+            self.__write(result=result)
+            done    += 1
+            failed  += "error" in result
+
+            # Progress line, rewritten in place
+            now: float = timer.perf_counter()
+            if now - shown >= BulkCharts.progress_interval or done == len(records):
+                shown = now
+                print(f"\r{done}/{len(records)} charts, {failed} failed, {done / (now - tic):0.1f}/s", end="", file=sys.stderr, flush=True)
+        self.output.flush()
+
+        elapsed: float = timer.perf_counter() - tic
+        print(file=sys.stderr)
+        logging.info("Bulk charts done: %d records, %d failed. Geocoding %0.3fs, charts %0.3fs (%0.1f/s)", done, failed, geocoded, elapsed, done / elapsed if elapsed else 0)
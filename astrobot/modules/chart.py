@@ -1,17 +1,133 @@
 # External
-import logging
+import logging, asyncio, re
+import time as timer
 from enum import Enum
-from datetime import datetime
+from pathlib import Path
+from datetime import datetime, timedelta
+import pytz
+import swisseph as swe
+import kerykeion
 from geopy.geocoders import HereV7
 from timezonefinder import TimezoneFinder
 import pycountry
 from kerykeion import AstrologicalSubject, NatalAspects, KerykeionPointModel
 from prettytable import PrettyTable
+from dateutil.parser import parse, ParserError
 import pandas as pd
 # Internal
+from astrobot.core.cache import Cache
+from astrobot.core.logs import Logs
 from astrobot.core.astrology import ZodiacSign
+from astrobot.modules.gazetteer import Gazetteer, PlaceIndex
 
     
+class ChartError(Exception):
+    """Raised when chart input is invalid or its location can't be found. The message is safe to show to users.
+    """
+
+class BirthInput:
+    """Strict parsing and validation of birth data, done before any geocoding or chart work.
+
+    The documented formats are matched with precompiled patterns; anything else falls back to a fuzzy parse.
+    """
+    date_pattern: re.Pattern    = re.compile(r"\s*(\d{1,2})/(\d{1,2})/(\d{4})\s*")
+    time_pattern: re.Pattern    = re.compile(r"\s*(\d{1,2}):(\d{2})\s*")
+    time_token: re.Pattern      = re.compile(r"\d{1,2}\s*([:h]\s*\d{2}|[ap]\.?m\b)", re.IGNORECASE)  # An hour with minutes or am/pm
+    sentinels: tuple[datetime, datetime] = (datetime(1, 1, 1, 1), datetime(2, 2, 2, 2))  # Fuzzy parse defaults, a field that differs was filled in
+    min_year: int               = 1800  # Range of the Swiss Ephemeris files shipped with kerykeion
+    max_year: int               = 2399
+    max_location: int           = 100   # Characters
+
+    @staticmethod
+    def parse(location: str, birthday: str, birthtime: str = "00:00") -> tuple[str, str, str]:
+        """Parse and validate birth data.
+
+        Args:
+            location (str): Birth city.
+            birthday (str): Birth date, MM/DD/YYYY preferred.
+            birthtime (str, optional): Birth time, HH:MM preferred. Defaults to "00:00".
+
+        Raises:
+            ChartError: If any input is missing, unreadable or out of range.
+
+        Returns:
+            tuple[str, str, str]: Location with whitespace collapsed, date as MM/DD/YYYY and time as HH:MM.
+        """
+        place: str = " ".join(location.split())
+        if not place:
+            raise ChartError("Birth city can't be empty")
+        if len(place) > BirthInput.max_location:
+            raise ChartError(f"Birth city is too long, keep it under {BirthInput.max_location} characters")
+
+        date: datetime = BirthInput.__date(birthday=birthday)
+        if not BirthInput.min_year <= date.year <= BirthInput.max_year:
+            raise ChartError(f"Birth year must be between {BirthInput.min_year} and {BirthInput.max_year}")
+
+        hour, minute = BirthInput.__time(birthtime=birthtime or "00:00")
+        return place, date.strftime("%m/%d/%Y"), f"{hour:02d}:{minute:02d}"
+
+    @staticmethod
+    def __date(birthday: str) -> datetime:
+        """Parse a birth date, MM/DD/YYYY first, then fuzzy (which also reads day-first dates like 25/12/1990).
+
+        Args:
+            birthday (str): Birth date.
+
+        Raises:
+            ChartError: If it isn't a real date.
+
+        Returns:
+            datetime: The date.
+        """
+        match = BirthInput.date_pattern.fullmatch(birthday)
+        if match:
+            month, day, year = (int(g) for g in match.groups())
+            try:
+                return datetime(year, month, day)
+            except ValueError:
+                pass
+        try:
+            parsed: list[datetime] = [parse(timestr=birthday, fuzzy=True, default=default) for default in BirthInput.sentinels]
+        except (ValueError, OverflowError, ParserError):
+            raise ChartError(f"Couldn't read birth date '{birthday}', use MM/DD/YYYY (e.g. 07/04/1976)")
+
+        # Don't let the parser make up a missing day, month or year
+        if parsed[0].date() != parsed[1].date():
+            raise ChartError(f"Birth date '{birthday}' needs a month, day and year, use MM/DD/YYYY (e.g. 07/04/1976)")
+        return datetime(parsed[0].year, parsed[0].month, parsed[0].day)
+
+    @staticmethod
+    def __time(birthtime: str) -> tuple[int, int]:
+        """Parse a birth time, HH:MM first, then fuzzy.
+
+        Args:
+            birthtime (str): Birth time.
+
+        Raises:
+            ChartError: If it isn't a real time.
+
+        Returns:
+            tuple[int, int]: Hour and minute.
+        """
+        match = BirthInput.time_pattern.fullmatch(birthtime)
+        try:
+            if match:
+                hour, minute = (int(g) for g in match.groups())
+            else:
+                # Fuzzy reads a lone number as a date, and makes up a missing hour
+                if not BirthInput.time_token.search(birthtime):
+                    raise ChartError(f"Couldn't find a time in '{birthtime}', use 24-hour HH:MM (e.g. 14:30)")
+                parsed: list[datetime] = [parse(timestr=birthtime, fuzzy=True, default=default) for default in BirthInput.sentinels]
+                if parsed[0].hour != parsed[1].hour:
+                    raise ChartError(f"Couldn't find an hour in '{birthtime}', use 24-hour HH:MM (e.g. 14:30)")
+                hour, minute = parsed[0].hour, parsed[0].minute
+        except (ValueError, OverflowError, ParserError):
+            raise ChartError(f"Couldn't read birth time '{birthtime}', use 24-hour HH:MM (e.g. 14:30)")
+
+        if not (0 <= hour <= 23 and 0 <= minute <= 59):
+            raise ChartError(f"Birth time '{birthtime}' is out of range, use 24-hour HH:MM (e.g. 14:30)")
+        return hour, minute
+
 class Table(Enum):
     """Defines table types and their columns.
     """
@@ -36,13 +152,29 @@ class GeoLookup:
     Returns:
         GeoLookup: A GeoLookup object.
     """
-    def __init__(self, geo_api: str, query: str) -> None:
+    expire_days: int    = 30    # Days to keep cached lookups
+
+    def __init__(self, geo_api: str, query: str, cached: dict | None = None) -> None:
         """Look up information about a location.
 
         Args:
             geo_api (str): API key for Geocoder.
             query (str): A lookup string, e.g. "New York City", "Paris, France"
+            cached (dict | None, optional): A previous lookup from to_dict(), skips the Geocoder. Defaults to None.
         """
+        # Try the offline gazetteer before the Geocoder
+        if cached is None and Gazetteer.index is not None:
+            cached                  = Gazetteer.index.find(query=query)
+
+        if cached is not None:
+            self.raw: dict          = cached["raw"]
+            self.latitude: float    = cached["latitude"]
+            self.longitude: float   = cached["longitude"]
+            self.city: str          = cached["city"]
+            self.country: str       = cached["country"]
+            self.timezone: str      = cached["timezone"]
+            return
+
         ## Get raw data from Here
         geo_apikey: str        = geo_api
         self.raw: dict          = self.__lookup(api_key=geo_apikey, query=query)
@@ -60,6 +192,47 @@ class GeoLookup:
         # Get timezone from coords
         self.timezone: str      = self.__get_tz(lat=self.latitude, lon=self.longitude)
 
+    def to_dict(self) -> dict:
+        """Lookup results as a dictionary, for caching.
+
+        Returns:
+            dict: Raw data and resolved location fields.
+        """
+        return {"raw":          self.raw,
+                "latitude":     self.latitude,
+                "longitude":    self.longitude,
+                "city":         self.city,
+                "country":      self.country,
+                "timezone":     self.timezone}
+
+    @staticmethod
+    async def fetch(geo_api: str, query: str) -> "GeoLookup":
+        """Look up a location in the gazetteer, then through the cache, only calling the Geocoder on a miss.
+
+        Args:
+            geo_api (str): API key for Geocoder.
+            query (str): A lookup string, e.g. "New York City", "Paris, France"
+
+        Returns:
+            GeoLookup: A GeoLookup object.
+        """
+        # Places in the gazetteer resolve in memory, faster than a cache read
+        found: dict | None      = Gazetteer.index.find(query=query) if Gazetteer.index is not None else None
+        if found is not None:
+            return GeoLookup(geo_api=geo_api, query=query, cached=found)
+
+        key: str                = "geo:" + " ".join(query.lower().split())
+        cached: dict | None     = await Cache.backend.get(key=key)
+        if cached is not None:
+            PlaceIndex.remember(query=query)
+            return GeoLookup(geo_api=geo_api, query=query, cached=cached)
+
+        # Geocoder and timezone lookups are blocking, keep them off the event loop
+        lookup: GeoLookup       = await asyncio.to_thread(GeoLookup, geo_api=geo_api, query=query)
+        await Cache.backend.set(key=key, value=lookup.to_dict(), expires=datetime.now() + timedelta(days=GeoLookup.expire_days))
+        PlaceIndex.remember(query=query)
+        return lookup
+
     def __lookup(self, api_key: str, query: str) -> dict:
         """Perform lookup on location string.
 
@@ -67,11 +240,18 @@ class GeoLookup:
             api_key (str): API key for Here.
             query (str): A lookup string, e.g. "New York City", "Paris, France"
 
+        Raises:
+            ChartError: If the place isn't found, or there's no API key to ask.
+
         Returns:
             dict: A dictionary of raw data, derived from JSON response.
         """
+        if api_key in ("", "none"):
+            raise ChartError(f"Couldn't find a place called '{query}'")
         geo: HereV7 = HereV7(apikey=api_key)
         location    = geo.geocode(query=query, exactly_one=True)
+        if location is None:
+            raise ChartError(f"Couldn't find a place called '{query}'")
         return location.raw # type: ignore
     
     def __get_tz(self, lat: float, lon: float) -> str:
@@ -118,8 +298,9 @@ class ChartUser:
                                            "Tenth_House":       "10th (MC)",
                                            "Eleventh_House":    "11th",
                                            "Twelfth_House":     "12th"}
+    aspect_filter: list[str]            = ["conjunction", "opposition", "sextile", "square", "trine"]
 
-    def __init__(self, geo_api: str, name: str, location: str, birthday: str, time: str = "00:00") -> None:
+    def __init__(self, geo_api: str, name: str, location: str, birthday: str, time: str = "00:00", lookup: GeoLookup | None = None) -> None:
         """Object containing data and methods used to generate astrological charts.
 
         Args:
@@ -128,12 +309,14 @@ class ChartUser:
             location (str): Location of subject.
             birthday (str): Birthday of subject.
             time (_type_, optional): Birth time of subject in 24-hour format. Defaults to "00:00".
+            lookup (GeoLookup | None, optional): An existing lookup for location. Defaults to None, look it up.
         """
         # Set name of subject
         self.name: str              = name
         
         # Get data from Here, set location variables
-        lookup: GeoLookup           = GeoLookup(geo_api=geo_api, query=location)
+        if lookup is None:
+            lookup                  = GeoLookup(geo_api=geo_api, query=location)
         self.latitude: float        = lookup.latitude
         self.longitude: float       = lookup.longitude
         self.city: str              = lookup.city
@@ -148,22 +331,10 @@ class ChartUser:
         self.hour: int              = birthdate.hour
         self.minute: int            = birthdate.minute
         
-        # Build iterator for chart data
+        # Build iterator for chart data, tables are built when first asked for
         subject: AstrologicalSubject = self.__make_subject()
-        self.planets: dict[str, KerykeionPointModel]    = {"Sun":          subject.sun, #type: ignore
-                                                           "Moon":         subject.moon,
-                                                           "Mercury":      subject.mercury,
-                                                           "Venus":        subject.venus,
-                                                           "Mars":         subject.mars,
-                                                           "Jupiter":      subject.jupiter,
-                                                           "Saturn":       subject.saturn,
-                                                           "Uranus":       subject.uranus,
-                                                           "Neptune":      subject.neptune,
-                                                           "Pluto":        subject.pluto,
-                                                           "Mean_Node":    subject.mean_node,
-                                                           "True_Node":    subject.true_node,
-                                                           "Chiron":       subject.chiron,
-                                                           "Mean_Lilith":  subject.mean_lilith}
+        self.subject: AstrologicalSubject               = subject
+        self.planets: dict[str, KerykeionPointModel]    = ChartUser.get_planets(subject=subject)
         self.houses: dict[str, KerykeionPointModel]     =  {"First_House":       subject.first_house,
                                                             "Second_House":      subject.second_house,
                                                             "Third_House":       subject.third_house,
@@ -176,11 +347,86 @@ class ChartUser:
                                                             "Tenth_House":       subject.tenth_house,
                                                             "Eleventh_House":    subject.eleventh_house,
                                                             "Twelfth_House":     subject.twelfth_house}
-        self.build_data: dict[Table, pd.DataFrame]      = {Table.houses:    self.__build_house_data(subject=subject),
-                                                           Table.planets:   self.__build_planet_data(subject=subject),
-                                                           Table.elements:  self.__build_element_data(subject=subject),
-                                                           Table.modes:     self.__build_mode_data(subject=subject),
-                                                           Table.aspects:   self.__build_aspects_data(subject=subject)}
+        self.build_data: dict[Table, pd.DataFrame]      = {}
+        self.rendered: dict[Table, str]                 = {}
+
+    @staticmethod
+    def get_planets(subject: AstrologicalSubject) -> dict[str, KerykeionPointModel]:
+        """Gets the planets and points of a subject, keyed by Kerykeion name.
+
+        Args:
+            subject (AstrologicalSubject): Kerykeion object containing all calculations.
+
+        Returns:
+            dict[str, KerykeionPointModel]: Planet name to Kerykeion point.
+        """
+        return {"Sun":          subject.sun, #type: ignore
+                "Moon":         subject.moon,
+                "Mercury":      subject.mercury,
+                "Venus":        subject.venus,
+                "Mars":         subject.mars,
+                "Jupiter":      subject.jupiter,
+                "Saturn":       subject.saturn,
+                "Uranus":       subject.uranus,
+                "Neptune":      subject.neptune,
+                "Pluto":        subject.pluto,
+                "Mean_Node":    subject.mean_node,
+                "True_Node":    subject.true_node,
+                "Chiron":       subject.chiron,
+                "Mean_Lilith":  subject.mean_lilith}
+
+    @staticmethod
+    def point_name(name: str) -> str:
+        """Friendly name for a Kerykeion planet, point or house name.
+
+        Args:
+            name (str): Kerykeion name, e.g. "True_Node", "First_House"
+
+        Returns:
+            str: Name for presentation, e.g. "N Node", "1st (ASC)"
+        """
+        if name == "True_Node":
+            return "N Node"
+        elif name in ChartUser.housename:
+            return ChartUser.housename[name]
+        else:
+            return name
+
+    @staticmethod
+    def filter_aspects(all_aspects: list) -> list:
+        """Filter Kerykeion aspects down to the major aspects in aspect_filter.
+
+        Args:
+            all_aspects (list): Aspects from NatalAspects.all_aspects.
+
+        Returns:
+            list: Aspects whose type is in aspect_filter.
+        """
+        return [aspect for aspect in all_aspects if aspect["aspect"] in ChartUser.aspect_filter]
+
+    @staticmethod
+    def render_table(columns: list[str], df: pd.DataFrame) -> str:
+        """Render a DataFrame as a table.
+
+        Args:
+            columns (list[str]): Column names.
+            df (pd.DataFrame): A pandas DataFrame object with those columns.
+
+        Returns:
+            str: A multi-line string formatted by PrettyTable.
+        """
+        # Create table object
+        tbl: PrettyTable = PrettyTable()
+
+        # Set field names
+        tbl.field_names = columns
+
+        # Iterate through rows
+        for _, data in df.iterrows():
+            tbl.add_row(data)  # type: ignore
+        
+        # Return table as string
+        return tbl.get_string()
 
     def __make_subject(self) -> AstrologicalSubject:
         """Gets an AstrologicalSubject object based on data from ChartUser.
@@ -199,7 +445,8 @@ class ChartUser:
                                    tz_str=self.timezone,
                                    city=self.city,
                                    nation=self.country,
-                                   online=False)
+                                   online=False,
+                                   is_dst=False)  # Only used for times skipped or repeated by a clock change, read as standard time
     
     def __build_house_data(self, subject: AstrologicalSubject) -> pd.DataFrame:
         """Build DataFrame object for the houses table.
@@ -370,43 +617,15 @@ class ChartUser:
         asp: list = []
         p2: list = []
         
-        # Setup aspect filter list
-        aspects: list = ["conjunction", "opposition", "sextile", "square", "trine"]
-
         # Get aspects object
         nat = NatalAspects(user=subject)
 
-        # Iterate through all aspects
-        for aspect in nat.all_aspects:
-            # Only use aspect types in filter list
-            if aspect["aspect"] in aspects:
-                
-                # Filter and rename planet names for Planet 1
-                p1name: str = ""
-                if aspect["p1_name"] == "True_Node":
-                    p1name = "N Node"
-                elif aspect["p1_name"] in ChartUser.housename:
-                    p1name = ChartUser.housename[aspect["p1_name"]]
-                else:
-                    p1name = aspect["p1_name"]
-
-                # Filter and rename planet names for Planet 2
-                p2name: str = ""
-                if aspect["p2_name"] == "True_Node":
-                    p2name = "N Node"
-                elif aspect["p2_name"] in ChartUser.housename:
-                    p2name = ChartUser.housename[aspect["p2_name"]]
-                else:
-                    p2name = aspect["p2_name"]
-
-                # Assign data to row
-                p1.append(p1name)
-                asp.append(aspect["aspect"])
-                p2.append(p2name)
-
-            # Not in aspect filter list, skip
-            else:
-                continue
+        # Iterate through aspects in the filter list
+        for aspect in ChartUser.filter_aspects(all_aspects=nat.all_aspects):
+            # Assign data to row, renaming planets
+            p1.append(ChartUser.point_name(aspect["p1_name"]))
+            asp.append(aspect["aspect"])
+            p2.append(ChartUser.point_name(aspect["p2_name"]))
 
         # Create and return DataFrame
         df = pd.DataFrame({"Planet 1":p1,"Aspect":asp,"Planet 2":p2})
@@ -421,21 +640,7 @@ class ChartUser:
         Returns:
             str: A multi-line string formatted by PrettyTable.
         """
-        # Create table object
-        tbl: PrettyTable = PrettyTable()
-
-        # Set field names from Table object
-        tbl.field_names = table_type.columns
-
-        # Create DataFrame from build_data dictionary
-        df: pd.DataFrame = self.build_data[table_type]
-
-        # Iterate through rows
-        for _, data in df.iterrows():
-            tbl.add_row(data)  # type: ignore
-        
-        # Return table as string
-        return tbl.get_string()
+        return ChartUser.render_table(columns=table_type.columns, df=self.get_chart_data(table_type=table_type))
     
     def get_subject(self) -> AstrologicalSubject:
         """Gets an AstrologicalSubject object based on data from ChartUser.
@@ -446,7 +651,7 @@ class ChartUser:
         return self.__make_subject()
 
     def get_chart_data(self, table_type: Table) -> pd.DataFrame:
-        """Gets selected chart data.
+        """Gets selected chart data, built on first use and memoized.
 
         Args:
             table_type (Table): A table object under the TableType class, iterator at TableType.all
@@ -454,10 +659,17 @@ class ChartUser:
         Returns:
             pd.DataFrame: A pandas DataFrame object.
         """
+        if table_type not in self.build_data:
+            builders = {Table.houses:   self.__build_house_data,
+                        Table.planets:  self.__build_planet_data,
+                        Table.elements: self.__build_element_data,
+                        Table.modes:    self.__build_mode_data,
+                        Table.aspects:  self.__build_aspects_data}
+            self.build_data[table_type] = builders[table_type](subject=self.subject)
         return self.build_data[table_type]
     
     def get_chart_as_str(self, table_type: Table) -> str:
-        """Gets selected chart, a multi-line string formatted by PrettyTable.
+        """Gets selected chart, a multi-line string formatted by PrettyTable. Rendered on first use and memoized.
 
         Args:
             table_type (Table): A table object under the TableType class, iterator at TableType.all
@@ -465,7 +677,9 @@ class ChartUser:
         Returns:
             str: A multi-line string formatted by PrettyTable.
         """
-        return self.__build_table(table_type=table_type)
+        if table_type not in self.rendered:
+            self.rendered[table_type] = self.__build_table(table_type=table_type)
+        return self.rendered[table_type]
     
     def get_charts_as_str(self) -> dict[str, str]:
         """Get all charts as a string.
@@ -476,4 +690,237 @@ class ChartUser:
         tables: dict[str, str] = {}
         for table in Table:
             tables.update( {table.name.capitalize(): self.get_chart_as_str(table_type=table)} )
-        return tables
\ No newline at end of file
+        return tables
+
+class ChartPages:
+    """A chart's tables for paging, each computed and rendered the first time it's asked for.
+
+    Rendered tables are memoized here and in the cache, by location, birth date/time and table, so a page that nobody
+    opens is never computed.
+    """
+    def __init__(self, geo_api: str, name: str, lookup: GeoLookup, birthday: str, time: str = "00:00") -> None:
+        """A chart's tables for paging, each computed and rendered the first time it's asked for.
+
+        Args:
+            geo_api (str): API key for Geocoder, used by GeoLookup class.
+            name (str): Name of subject.
+            lookup (GeoLookup): Location of subject.
+            birthday (str): Birthday of subject.
+            time (str, optional): Birth time of subject in 24-hour format. Defaults to "00:00".
+        """
+        self.geo_api: str               = geo_api
+        self.name: str                  = name
+        self.lookup: GeoLookup          = lookup
+        self.birthday: str              = birthday
+        self.time: str                  = time
+        self.key: str                   = f"chart:{lookup.latitude:.4f}:{lookup.longitude:.4f}:{lookup.timezone}:{birthday}:{time}"
+        self.tables: dict[Table, str]   = {}
+        self.__user: ChartUser | None   = None
+
+    @staticmethod
+    async def fetch(geo_api: str, name: str, location: str, birthday: str, time: str = "00:00") -> "ChartPages":
+        """Look up the location, through the cache, and get the chart's pages ready. Nothing is computed yet.
+
+        Args:
+            geo_api (str): API key for Geocoder, used by GeoLookup class.
+            name (str): Name of subject.
+            location (str): Location of subject.
+            birthday (str): Birthday of subject.
+            time (str, optional): Birth time of subject in 24-hour format. Defaults to "00:00".
+
+        Raises:
+            ChartError: If the location isn't found.
+
+        Returns:
+            ChartPages: The chart's pages.
+        """
+        lookup: GeoLookup = await GeoLookup.fetch(geo_api=geo_api, query=location)
+        return ChartPages(geo_api=geo_api, name=name, lookup=lookup, birthday=birthday, time=time)
+
+    def __build(self, table: Table) -> str:
+        """Compute and render one table, building the chart the first time. Blocking, run off the event loop.
+
+        Args:
+            table (Table): Which table.
+
+        Returns:
+            str: A multi-line string formatted by PrettyTable.
+        """
+        if self.__user is None:
+            self.__user = ChartUser(geo_api=self.geo_api, name=self.name, location=self.lookup.city, birthday=self.birthday, time=self.time, lookup=self.lookup)
+        return self.__user.get_chart_as_str(table_type=table)
+
+    async def get(self, table: Table) -> str:
+        """Get one table, from memory, the cache, or computed on a miss. The chart is built off the event loop.
+
+        Args:
+            table (Table): Which table.
+
+        Returns:
+            str: A multi-line string formatted by PrettyTable.
+        """
+        if table in self.tables:
+            return self.tables[table]
+
+        key: str                = f"{self.key}:{table.name}"
+        found: str | None       = await Cache.backend.get(key=key)
+        if found is not None:
+            Logs.requests.info("Chart %s retrieved from cache", table.name)
+        else:
+            tic = timer.perf_counter()
+            found               = await asyncio.to_thread(self.__build, table)
+            toc = timer.perf_counter()
+            Logs.requests.info("Chart %s computed. %.3fs", table.name, toc - tic)
+            await Cache.backend.set(key=key, value=found)
+
+        self.tables[table]      = found
+        return found
+
+    async def get_all(self) -> dict[str, str]:
+        """Get every table.
+
+        Returns:
+            dict[str, str]: Table name to a multi-line string formatted by PrettyTable.
+        """
+        return {table.name.capitalize(): await self.get(table=table) for table in Table}
+
+class BigThree:
+    """Sun, Moon and rising sign only, without building a full natal chart.
+
+    The three longitudes come straight from the Swiss Ephemeris with the same calls kerykeion makes, so they match
+    /chart, but the other planets, houses, aspects and tables are never computed. Longitudes are cached by location
+    and birth date/time.
+    """
+    points: list[str]       = ["Sun", "Moon", "Rising"]
+    symbols: dict[str, str] = {"Sun":       "☉",
+                               "Moon":      "☽",
+                               "Rising":    "↑"}
+    signs: list[ZodiacSign] = list(ZodiacSign)
+    ephemeris_set: bool     = False     # Setting the path again reopens the ephemeris files, so only the first time
+
+    def __init__(self, name: str, lookup: GeoLookup, longitudes: dict[str, float]) -> None:
+        """Sun, Moon and rising sign only, without building a full natal chart.
+
+        Args:
+            name (str): Name of subject.
+            lookup (GeoLookup): Location of subject.
+            longitudes (dict[str, float]): Point name to ecliptic longitude, from compute().
+        """
+        self.name: str                                      = name
+        self.city: str                                      = lookup.city
+        self.placements: dict[str, tuple[ZodiacSign, float]] = {point: (BigThree.signs[int(longitudes[point] // 30) % 12], longitudes[point] % 30)
+                                                                for point in BigThree.points}
+
+    @staticmethod
+    def compute(lookup: GeoLookup, birthday: str, time: str = "00:00") -> dict[str, float]:
+        """Ecliptic longitudes of the Sun, Moon and Ascendant.
+
+        Args:
+            lookup (GeoLookup): Location of subject.
+            birthday (str): Birthday of subject.
+            time (str, optional): Birth time of subject in 24-hour format. Defaults to "00:00".
+
+        Returns:
+            dict[str, float]: Point name to longitude in degrees, 0-360.
+        """
+        # Same ephemeris files as kerykeion
+        if not BigThree.ephemeris_set:
+            swe.set_ephe_path(str(Path(kerykeion.__file__).parent / "sweph"))
+            BigThree.ephemeris_set = True
+
+        # Local time to a UT Julian day as kerykeion does, times skipped or repeated by a clock change read as standard time
+        local: datetime     = pytz.timezone(lookup.timezone).localize(datetime.strptime(f"{birthday} {time}", "%m/%d/%Y %H:%M"), is_dst=False)
+        utc: datetime       = local.astimezone(pytz.utc)
+        jd: float           = swe.julday(utc.year, utc.month, utc.day, utc.hour + utc.minute / 60)
+
+        # Placidus houses, with kerykeion's polar circle override
+        latitude: float     = min(max(lookup.latitude, -66.0), 66.0)
+        cusps, _            = swe.houses(jd, latitude, lookup.longitude, b"P")
+        flags: int          = swe.FLG_SWIEPH + swe.FLG_SPEED
+        return {"Sun":      swe.calc(jd, swe.SUN, flags)[0][0],
+                "Moon":     swe.calc(jd, swe.MOON, flags)[0][0],
+                "Rising":   cusps[0]}
+
+    @staticmethod
+    async def fetch(geo_api: str, name: str, location: str, birthday: str, time: str = "00:00") -> "BigThree":
+        """Look up the location, through the cache, and get the three placements from the cache or computed on a miss.
+
+        Args:
+            geo_api (str): API key for Geocoder, used by GeoLookup class.
+            name (str): Name of subject.
+            location (str): Location of subject.
+            birthday (str): Birthday of subject.
+            time (str, optional): Birth time of subject in 24-hour format. Defaults to "00:00".
+
+        Raises:
+            ChartError: If the location isn't found.
+
+        Returns:
+            BigThree: The placements.
+        """
+        lookup: GeoLookup                   = await GeoLookup.fetch(geo_api=geo_api, query=location)
+        key: str                            = f"bigthree:{lookup.latitude:.4f}:{lookup.longitude:.4f}:{lookup.timezone}:{birthday}:{time}"
+        longitudes: dict[str, float] | None = await Cache.backend.get(key=key)
+        if longitudes is not None:
+            Logs.requests.info("Big three retrieved from cache")
+        else:
+            tic = timer.perf_counter()
+            longitudes                      = BigThree.compute(lookup=lookup, birthday=birthday, time=time)
+            toc = timer.perf_counter()
+            Logs.requests.info("Big three computed. %.6fs", toc - tic)
+            await Cache.backend.set(key=key, value=longitudes)
+        return BigThree(name=name, lookup=lookup, longitudes=longitudes)
+
+    def get_formatted_string(self) -> str:
+        """Placements for presentation, one per line, e.g. "☉ Sun: ♌ Leo 12.34°".
+
+        Returns:
+            str: A multi-line string.
+        """
+        lines: list[str] = []
+        for point, (sign, degree) in self.placements.items():
+            lines.append(f"{BigThree.symbols[point]} {point}: {sign.symbol} {sign.full} {degree:.2f}°")
+        return "\n".join(lines)
+
+    @staticmethod
+    def benchmark(runs: int = 200) -> dict[str, float]:
+        """Compare computing the big three with building a full ChartUser and its tables, for the same births.
+
+        Neither path touches the cache or the Geocoder, births are spread over a century at a fixed location.
+
+        Args:
+            runs (int, optional): Births to compute. Defaults to 200.
+
+        Returns:
+            dict[str, float]: Mean seconds per birth for each path, the speedup, and placements that disagree with kerykeion.
+        """
+        lookup: GeoLookup   = GeoLookup(geo_api="none", query="Greenwich", cached={"raw":       {},
+                                                                                    "latitude":  51.4769,
+                                                                                    "longitude": 0.0,
+                                                                                    "city":      "Greenwich",
+                                                                                    "country":   "GB",
+                                                                                    "timezone":  "Europe/London"})
+        births: list[tuple[str, str]] = [((datetime(1930, 1, 1) + timedelta(days=i * 36524 // runs, minutes=i * 617)).strftime("%m/%d/%Y"),
+                                          (datetime(1930, 1, 1) + timedelta(minutes=i * 617)).strftime("%H:%M")) for i in range(runs)]
+
+        tic = timer.perf_counter()
+        fast: list[BigThree] = [BigThree(name="Bench", lookup=lookup, longitudes=BigThree.compute(lookup=lookup, birthday=day, time=time)) for day, time in births]
+        big_three: float = (timer.perf_counter() - tic) / runs
+
+        tic = timer.perf_counter()
+        full: list[ChartUser] = []
+        for day, time in births:
+            user: ChartUser = ChartUser(geo_api="none", name="Bench", location=lookup.city, birthday=day, time=time, lookup=lookup)
+            user.get_charts_as_str()
+            full.append(user)
+        chart_user: float = (timer.perf_counter() - tic) / runs
+
+        # Placements should match the full chart's to the hundredth of a degree shown
+        mismatches: int = 0
+        for three, user in zip(fast, full):
+            for point, kery in (("Sun", user.planets["Sun"]), ("Moon", user.planets["Moon"]), ("Rising", user.houses["First_House"])):
+                sign, degree = three.placements[point]
+                if sign != ChartUser.kery_signs[kery.sign] or abs(degree - kery.position) > 0.005:
+                    mismatches += 1
+
+        return {"big_three": big_three, "chart_user": chart_user, "speedup": chart_user / big_three if big_three else 0.0, "mismatches": mismatches}
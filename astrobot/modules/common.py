@@ -94,4 +94,16 @@ class Source(Enum):
         defaults: dict[Source, Style]           = {Source.horoscope_com:    Style.daily,
                                                    Source.astrology_com:    Style.daily,
                                                    Source.astrostyle:       Style.daily}
-        return defaults[self]
\ No newline at end of file
+        return defaults[self]
+    
+    @property
+    def timeout(self) -> float:
+        """Seconds to wait for the source to respond before giving up.
+
+        Returns:
+            float: Total request timeout in seconds.
+        """
+        timeouts: dict[Source, float]           = {Source.horoscope_com:    8.0,
+                                                   Source.astrology_com:    8.0,
+                                                   Source.astrostyle:       8.0}
+        return timeouts[self]
\ No newline at end of file
@@ -0,0 +1,84 @@
+# External
+import logging
+import time as timer
+# Internal
+from astrobot.core.cache import Cache
+from astrobot.core.astrology import ZodiacSign
+from astrobot.modules.common import Day, Source, Style
+
+
+class Demand:
+    """How often each horoscope (day, source, style, sign) is asked for, so warm-ups fetch the popular ones first.
+
+    Counts decay with a half-life, so they follow what's being asked for lately. Each process counts its own requests
+    and adds them to the totals in the cache when it saves, so the totals are shared by shard workers and, with the
+    sqlite and redis backends, kept over restarts.
+    """
+    key: str                    = "demand"          # Cache key for the totals
+    half_life: float            = 7 * 86400.0       # Seconds for a count to decay to half
+    floor: float                = 0.01              # Totals below this are dropped
+    totals: dict[str, float]    = {}                # As of the last save
+    pending: dict[str, int]     = {}                # Requests in this process since the last save
+
+    @staticmethod
+    def name(day: Day, source: Source, style: Style, sign: ZodiacSign) -> str:
+        """Name of a horoscope in the totals.
+
+        Args:
+            day (Day): Relative day.
+            source (Source): Source of horoscope.
+            style (Style): Style of horoscope.
+            sign (ZodiacSign): Zodiac sign.
+
+        Returns:
+            str: e.g. "today:astrology_com:daily:leo".
+        """
+        return f"{day.name}:{source.name}:{style.name}:{sign.name}"
+
+    @staticmethod
+    def record(day: Day, source: Source, style: Style, sign: ZodiacSign) -> None:
+        """Count a request for a horoscope.
+
+        Args:
+            day (Day): Relative day.
+            source (Source): Source of horoscope.
+            style (Style): Style of horoscope.
+            sign (ZodiacSign): Zodiac sign.
+        """
+        name: str           = Demand.name(day=day, source=source, style=style, sign=sign)
+        Demand.pending[name] = Demand.pending.get(name, 0) + 1
+
+    @staticmethod
+    def of(day: Day, source: Source, style: Style, sign: ZodiacSign) -> float:
+        """How much a horoscope is asked for.
+
+        Args:
+            day (Day): Relative day.
+            source (Source): Source of horoscope.
+            style (Style): Style of horoscope.
+            sign (ZodiacSign): Zodiac sign.
+
+        Returns:
+            float: Decayed request count, 0.0 if it's never been asked for.
+        """
+        name: str = Demand.name(day=day, source=source, style=style, sign=sign)
+        return Demand.totals.get(name, 0.0) + Demand.pending.get(name, 0)
+
+    @staticmethod
+    async def save() -> None:
+        """Add this process's requests to the totals in the cache, decayed to now, and read back everyone's.
+        """
+        pending: dict[str, int]     = Demand.pending
+        Demand.pending              = {}
+        now: float                  = timer.time()
+
+        stored: dict                = await Cache.backend.get(key=Demand.key) or {"saved": now, "counts": {}}
+        decay: float                = 0.5 ** (max(now - stored["saved"], 0.0) / Demand.half_life)
+        totals: dict[str, float]    = {name: count * decay for name, count in stored["counts"].items()}
+        for name, count in pending.items():
+            totals[name]            = totals.get(name, 0.0) + count
+        totals                      = {name: count for name, count in totals.items() if count >= Demand.floor}
+
+        await Cache.backend.set(key=Demand.key, value={"saved": now, "counts": totals})
+        Demand.totals               = totals
+        logging.debug("Saved demand: %d requests added, %d horoscopes asked for", sum(pending.values()), len(totals))
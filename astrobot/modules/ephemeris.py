@@ -0,0 +1,313 @@
+# External
+import logging, asyncio
+import time as timer
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import swisseph as swe
+import kerykeion
+from kerykeion import AstrologicalSubject
+# Internal
+from astrobot.core.cache import Cache
+from astrobot.core.astrology import ZodiacSign
+
+
+class Event:
+    """A sign ingress or retrograde station.
+    """
+    def __init__(self, time: datetime, planet: str, kind: str, sign: ZodiacSign) -> None:
+        """A sign ingress or retrograde station.
+
+        Args:
+            time (datetime): When the event happens, UTC.
+            planet (str): Planet name, e.g. "Mercury".
+            kind (str): "ingress", "station retrograde" or "station direct".
+            sign (ZodiacSign): Sign entered, or the sign the planet stations in.
+        """
+        self.time: datetime     = time
+        self.planet: str        = planet
+        self.kind: str          = kind
+        self.sign: ZodiacSign   = sign
+
+    def get_formatted_string(self) -> str:
+        """Event for presentation, e.g. "Mercury enters ♏ Scorpio".
+
+        Returns:
+            str: A short description of the event.
+        """
+        sign: str = self.sign.symbol + " " + self.sign.full
+        if self.kind == "ingress":
+            return f"{self.planet} enters {sign}"
+        elif self.kind == "station retrograde":
+            return f"{self.planet} stations retrograde in {sign}"
+        else:
+            return f"{self.planet} stations direct in {sign}"
+
+class EphemerisRange:
+    """Planet longitudes over a time series as NumPy arrays, with vectorized event detection.
+
+    Longitudes are sampled coarsely, a date at a time for every planet, since the Swiss Ephemeris keeps the Earth's
+    position for the last date and reuses it; speeds come from the samples with np.gradient. Sign boundary crossings
+    and speed sign changes are found across the whole array at once, and only the few intervals holding an event are
+    refined.
+    """
+    planet_ids: dict[str, int]  = {"Sun":      swe.SUN,
+                                   "Moon":     swe.MOON,
+                                   "Mercury":  swe.MERCURY,
+                                   "Venus":    swe.VENUS,
+                                   "Mars":     swe.MARS,
+                                   "Jupiter":  swe.JUPITER,
+                                   "Saturn":   swe.SATURN,
+                                   "Uranus":   swe.URANUS,
+                                   "Neptune":  swe.NEPTUNE,
+                                   "Pluto":    swe.PLUTO,
+                                   "Chiron":   swe.CHIRON}
+    signs: list[ZodiacSign]     = list(ZodiacSign)
+    flags: int                  = swe.FLG_SWIEPH
+    refine_steps: int           = 12    # Bisection steps per event, a day interval resolves to ~21 seconds
+
+    def __init__(self, start: datetime, end: datetime, step_hours: float = 24.0, planets: list[str] | None = None) -> None:
+        """Planet longitudes over a time series as NumPy arrays, with vectorized event detection.
+
+        Args:
+            start (datetime): Start of the range, UTC.
+            end (datetime): End of the range, UTC, exclusive.
+            step_hours (float, optional): Sample spacing in hours. Use 6 or less if the Moon is included. Defaults to 24.0.
+            planets (list[str] | None, optional): Planet names from planet_ids. Defaults to None, all but the Moon.
+        """
+        # Same ephemeris files as kerykeion
+        swe.set_ephe_path(str(Path(kerykeion.__file__).parent / "sweph"))
+
+        self.start: datetime                    = start
+        self.step: float                        = step_hours / 24.0
+        self.planets: list[str]                 = planets or [p for p in EphemerisRange.planet_ids if p != "Moon"]
+
+        # Julian days for the series, one sample either side so every interval in range is covered
+        jd_start: float                         = EphemerisRange.julian_day(start) - self.step
+        jd_end: float                           = EphemerisRange.julian_day(end) + self.step
+        self.jd: np.ndarray                     = np.arange(jd_start, jd_end + self.step, self.step)
+
+        # Sampled date by date, then one row per planet, speed in degrees per day from the unwrapped series
+        ids: list[int]                          = [EphemerisRange.planet_ids[planet] for planet in self.planets]
+        self.longitudes: np.ndarray             = np.array([[swe.calc_ut(jd, id, EphemerisRange.flags)[0][0] for id in ids] for jd in self.jd.tolist()]).T
+        self.speeds: np.ndarray                 = np.gradient(np.unwrap(self.longitudes, period=360.0, axis=1), self.jd, axis=1)
+
+    @staticmethod
+    def julian_day(date: datetime) -> float:
+        """Julian day for a UTC datetime.
+
+        Args:
+            date (datetime): Datetime, UTC.
+
+        Returns:
+            float: Julian day (UT).
+        """
+        return swe.julday(date.year, date.month, date.day, date.hour + date.minute / 60.0 + date.second / 3600.0)
+
+    @staticmethod
+    def from_julian_day(jd: float) -> datetime:
+        """UTC datetime for a Julian day.
+
+        Args:
+            jd (float): Julian day (UT).
+
+        Returns:
+            datetime: Datetime, UTC, to the minute.
+        """
+        year, month, day, hours = swe.revjul(jd)
+        date: datetime = datetime(year, month, day, tzinfo=timezone.utc) + timedelta(hours=hours)
+        return date.replace(second=0, microsecond=0)
+
+    def __longitude(self, jd: float, planet: str) -> float:
+        """Ecliptic longitude of a planet.
+
+        Args:
+            jd (float): Julian day (UT).
+            planet (str): Planet name from planet_ids.
+
+        Returns:
+            float: Longitude in degrees, 0-360.
+        """
+        return swe.calc_ut(jd, EphemerisRange.planet_ids[planet], EphemerisRange.flags)[0][0]
+
+    def __speed(self, jd: float, planet: str) -> float:
+        """Longitude speed of a planet.
+
+        Args:
+            jd (float): Julian day (UT).
+            planet (str): Planet name from planet_ids.
+
+        Returns:
+            float: Degrees per day, negative when retrograde.
+        """
+        return swe.calc_ut(jd, EphemerisRange.planet_ids[planet], EphemerisRange.flags + swe.FLG_SPEED)[0][3]
+
+    def __bisect(self, a: float, b: float, side) -> float:
+        """Narrow an interval down to where side() changes.
+
+        Args:
+            a (float): Julian day where side() is False.
+            b (float): Julian day where side() is True.
+            side (Callable[[float], bool]): Test for a Julian day.
+
+        Returns:
+            float: Julian day of the change.
+        """
+        for _ in range(EphemerisRange.refine_steps):
+            mid: float = (a + b) / 2.0
+            if side(mid):
+                b = mid
+            else:
+                a = mid
+        return (a + b) / 2.0
+
+    def ingresses(self) -> list[Event]:
+        """Find sign ingresses, by where floor(longitude / 30) changes between samples.
+
+        Returns:
+            list[Event]: Ingress events, unsorted.
+        """
+        events: list[Event]     = []
+        sign_idx: np.ndarray    = np.floor(self.longitudes / 30.0).astype(int) % 12
+
+        # Rows and columns of every sample followed by a sign change
+        rows, cols = np.nonzero(np.diff(sign_idx, axis=1))
+        for row, col in zip(rows, cols):
+            planet: str     = self.planets[row]
+            old: int        = sign_idx[row, col]
+            new: int        = sign_idx[row, col + 1]
+
+            # True once the planet has left the old sign
+            def left(jd: float, planet=planet, old=old) -> bool:
+                return int(self.__longitude(jd=jd, planet=planet) // 30.0) % 12 != old
+
+            jd: float = self.__bisect(a=self.jd[col], b=self.jd[col + 1], side=left)
+            events.append(Event(time=EphemerisRange.from_julian_day(jd), planet=planet, kind="ingress", sign=EphemerisRange.signs[new]))
+        return events
+
+    def stations(self) -> list[Event]:
+        """Find retrograde and direct stations, by where the longitude speed changes sign between samples.
+
+        Returns:
+            list[Event]: Station events, unsorted.
+        """
+        events: list[Event] = []
+        rows, cols = np.nonzero(np.diff(np.sign(self.speeds), axis=1))
+        for row, col in zip(rows, cols):
+            planet: str         = self.planets[row]
+            retrograde: bool    = self.speeds[row, col] > 0
+
+            # Gradient speeds can place the change one sample early or late, search around it
+            a: float            = self.jd[max(col - 1, 0)]
+            b: float            = self.jd[min(col + 2, len(self.jd) - 1)]
+            if (self.__speed(jd=a, planet=planet) > 0) != retrograde or (self.__speed(jd=b, planet=planet) > 0) == retrograde:
+                continue
+
+            # True once the planet has changed direction
+            def turned(jd: float, planet=planet, retrograde=retrograde) -> bool:
+                return (self.__speed(jd=jd, planet=planet) < 0) == retrograde
+
+            jd: float           = self.__bisect(a=a, b=b, side=turned)
+            kind: str           = "station retrograde" if retrograde else "station direct"
+            sign: int           = int(self.__longitude(jd=jd, planet=planet) // 30.0) % 12
+            events.append(Event(time=EphemerisRange.from_julian_day(jd), planet=planet, kind=kind, sign=EphemerisRange.signs[sign]))
+        return events
+
+    def events(self, after: datetime | None = None, before: datetime | None = None) -> list[Event]:
+        """All ingresses and stations, in time order.
+
+        Args:
+            after (datetime | None, optional): Drop events before this time. Defaults to None.
+            before (datetime | None, optional): Drop events at or after this time. Defaults to None.
+
+        Returns:
+            list[Event]: Events sorted by time.
+        """
+        events: list[Event] = sorted(self.ingresses() + self.stations(), key=lambda e: e.time)
+        return [e for e in events if (after is None or e.time >= after) and (before is None or e.time < before)]
+
+class Calendar:
+    """Monthly calendar of sign ingresses and retrograde stations, cached per month.
+    """
+    @staticmethod
+    def bounds(year: int, month: int) -> tuple[datetime, datetime]:
+        """Start and end of a month, UTC.
+
+        Args:
+            year (int): Year.
+            month (int): Month, 1-12.
+
+        Returns:
+            tuple[datetime, datetime]: First instant of the month and of the next month.
+        """
+        start: datetime = datetime(year, month, 1, tzinfo=timezone.utc)
+        end: datetime   = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+        return start, end
+
+    @staticmethod
+    def compute(year: int, month: int) -> list[Event]:
+        """Compute a month's events with the range engine.
+
+        Args:
+            year (int): Year.
+            month (int): Month, 1-12.
+
+        Returns:
+            list[Event]: Events sorted by time.
+        """
+        start, end = Calendar.bounds(year=year, month=month)
+        return EphemerisRange(start=start, end=end).events(after=start, before=end)
+
+    @staticmethod
+    async def month(year: int, month: int) -> list[Event]:
+        """Get a month's events, through the cache.
+
+        Args:
+            year (int): Year.
+            month (int): Month, 1-12.
+
+        Returns:
+            list[Event]: Events sorted by time.
+        """
+        key: str                    = f"calendar:{year:04d}-{month:02d}"
+        events: list[Event] | None  = await Cache.backend.get(key=key)
+        if events is not None:
+            return events
+
+        tic = timer.perf_counter()
+        events = await asyncio.to_thread(Calendar.compute, year=year, month=month)
+        toc = timer.perf_counter()
+        logging.info("Calendar computed for %04d-%02d, %d events. %0.3fs", year, month, len(events), toc - tic)
+
+        await Cache.backend.set(key=key, value=events)
+        return events
+
+    @staticmethod
+    def benchmark(year: int, month: int) -> dict[str, float]:
+        """Compare the range engine with a per-day kerykeion loop over the same month.
+
+        The loop only builds an AstrologicalSubject per day, without any event detection, and can only place events
+        to the day. The engine places them to the minute.
+
+        Args:
+            year (int): Year.
+            month (int): Month, 1-12.
+
+        Returns:
+            dict[str, float]: Seconds for each approach, and the speedup.
+        """
+        start, end = Calendar.bounds(year=year, month=month)
+
+        tic = timer.perf_counter()
+        Calendar.compute(year=year, month=month)
+        engine: float = timer.perf_counter() - tic
+
+        tic = timer.perf_counter()
+        day: datetime = start
+        while day < end:
+            AstrologicalSubject(name="Bench", year=day.year, month=day.month, day=day.day, hour=0, minute=0,
+                                lat=51.4769, lng=0.0, tz_str="UTC", city="Greenwich", nation="GB", online=False)
+            day += timedelta(days=1)
+        loop: float = timer.perf_counter() - tic
+
+        return {"engine": engine, "kerykeion_daily": loop, "speedup": loop / engine if engine else 0.0}
@@ -0,0 +1,82 @@
+# External
+import logging, asyncio, json, sys
+import time as timer
+from typing import TextIO
+# Internal
+from astrobot.core.cache import Cache
+from astrobot.core.astrology import ZodiacSign
+from astrobot.modules.common import Day, Source, Style
+from astrobot.modules.horoscope import Horo, HoroItem, FetchPlan
+
+
+class HoroExport:
+    """Fetch horoscopes without Discord, to warm the cache or measure the pipeline. Results are dumped as JSON.
+    """
+    def __init__(self,
+                 days: list[Day] | None         = None,
+                 sources: list[Source] | None   = None,
+                 styles: list[Style] | None     = None,
+                 signs: list[ZodiacSign] | None = None,
+                 output: TextIO                 = sys.stdout,
+                 warm_only: bool                = False
+                 ) -> None:
+        """Fetch horoscopes without Discord, to warm the cache or measure the pipeline. Results are dumped as JSON.
+
+        Args:
+            days (list[Day] | None, optional): Days to fetch. Defaults to None, all.
+            sources (list[Source] | None, optional): Sources to fetch. Defaults to None, all.
+            styles (list[Style] | None, optional): Styles to fetch. Defaults to None, all.
+            signs (list[ZodiacSign] | None, optional): Signs to fetch. Defaults to None, all.
+            output (TextIO, optional): Where to write the JSON results. Defaults to sys.stdout.
+            warm_only (bool, optional): Only fill the cache, like precache, without parsing or output. Defaults to False.
+        """
+        self.items: list[HoroItem]  = HoroItem.list_all(days=days, sources=sources, styles=styles, signs=signs)
+        self.output: TextIO         = output
+        self.warm_only: bool        = warm_only
+
+    @staticmethod
+    def to_dict(hor: Horo) -> dict:
+        """Horoscope as a dictionary, for JSON.
+
+        Args:
+            hor (Horo): A horoscope.
+
+        Returns:
+            dict: Sign, source, style, date, text, URL and cache status.
+        """
+        return {"sign":     hor.sign.name,
+                "source":   hor.source.name,
+                "style":    hor.style.name,
+                "date":     hor.date,
+                "text":     hor.text,
+                "url":      hor.url,
+                "cached":   hor.cache.is_cached}
+
+    async def run(self) -> dict[str, float]:
+        """Warm the cache for the selected items, then read and parse them once per unique page.
+
+        Returns:
+            dict[str, float]: Seconds per stage: fetch (wall), cache_read and parse (summed per call) and total (wall).
+        """
+        tic = timer.perf_counter()
+        plan: FetchPlan = FetchPlan(items=self.items)
+        await plan.precache()
+        logging.info("Fetched %d URLs for %d horoscopes (%0.2fx dedup), %d failed", len(plan.urls), len(plan.items), plan.ratio, plan.failed)
+
+        if not self.warm_only:
+            horos: list[Horo] = await plan.fetch()
+            json.dump([HoroExport.to_dict(hor=hor) for hor in horos], self.output, ensure_ascii=False, indent=2)
+            self.output.write("\n")
+            self.output.flush()
+            logging.info("Exported %d horoscopes, %d failed", len(horos), plan.failed)
+
+        await Cache.backend.close()
+        return plan.timings | {"total": timer.perf_counter() - tic}
+
+    def start(self) -> None:
+        """Run and print per-stage timings on stderr.
+        """
+        timings: dict[str, float] = asyncio.run(self.run())
+        print(f"{len(self.items)} horoscopes", file=sys.stderr)
+        for stage, seconds in timings.items():
+            print(f"  {stage + ':':<12} {seconds * 1000:10.1f} ms", file=sys.stderr)
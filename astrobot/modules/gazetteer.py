@@ -0,0 +1,278 @@
+# External
+import logging, io, unicodedata, zipfile
+import time as timer
+from bisect import bisect_left, bisect_right, insort
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+import numpy as np
+import pycountry
+
+
+class Gazetteer:
+    """Offline geocoder backed by a GeoNames cities dump (e.g. cities15000.txt, or the .zip it ships in).
+
+    Places are kept in parallel arrays, one row per city. Names are looked up in a sorted array of normalized keys,
+    both the local and ASCII name of each city, ordered so that the most populous city comes first for each key.
+    """
+    index: "Gazetteer | None"   = None  # Process-wide gazetteer, set by configure
+    feature_class: str          = "P"   # GeoNames feature class for cities, towns and villages
+
+    def __init__(self, path: str) -> None:
+        """Offline geocoder backed by a GeoNames cities dump.
+
+        Args:
+            path (str): GeoNames tab-separated file, or a .zip containing one.
+        """
+        tic = timer.perf_counter()
+        ids: list[int]              = []
+        names: list[str]            = []
+        countries: list[str]        = []
+        admin1: list[str]           = []
+        latitude: list[float]       = []
+        longitude: list[float]      = []
+        population: list[int]       = []
+        zones: list[int]            = []
+        zone_ids: dict[str, int]    = {}
+
+        entries: list[tuple[str, int, int]] = []
+        for fields in Gazetteer.__rows(path=path):
+            if len(fields) < 18 or fields[6] != Gazetteer.feature_class or not fields[17]:
+                continue
+            row: int = len(ids)
+            ids.append(int(fields[0]))
+            names.append(fields[1])
+            countries.append(fields[8])
+            admin1.append(fields[10])
+            latitude.append(float(fields[4]))
+            longitude.append(float(fields[5]))
+            population.append(int(fields[14] or 0))
+            zones.append(zone_ids.setdefault(fields[17], len(zone_ids)))
+            for key in {Gazetteer.normalize(fields[1]), Gazetteer.normalize(fields[2])}:
+                if key:
+                    entries.append((key, -population[row], row))
+
+        # Place arrays
+        self.ids: np.ndarray        = np.array(ids, dtype=np.int64)
+        self.names: list[str]       = names
+        self.countries: np.ndarray  = np.array(countries, dtype="U2")
+        self.admin1: list[str]      = admin1
+        self.latitude: np.ndarray   = np.array(latitude, dtype=np.float64)
+        self.longitude: np.ndarray  = np.array(longitude, dtype=np.float64)
+        self.population: np.ndarray = np.array(population, dtype=np.int64)
+        self.zones: np.ndarray      = np.array(zones, dtype=np.uint16)
+        self.timezones: list[str]   = list(zone_ids)
+
+        # Name index, sorted by key then largest population first
+        entries.sort()
+        self.keys: list[str]        = [key for key, _, _ in entries]
+        self.rows: np.ndarray       = np.array([row for _, _, row in entries], dtype=np.int32)
+
+        # Largest places, suggested before anything is typed
+        self.largest: np.ndarray    = np.argsort(-self.population, kind="stable")[:PlaceIndex.limit]
+
+        toc = timer.perf_counter()
+        logging.info("Loaded gazetteer: %d places, %d names from %s in %0.2fs", len(self.names), len(self.keys), path, toc - tic)
+
+    @staticmethod
+    def configure(path: str) -> "Gazetteer | None":
+        """Set the process-wide gazetteer.
+
+        Args:
+            path (str): GeoNames file, or "" to geocode with the Geocoder only.
+
+        Returns:
+            Gazetteer | None: The loaded gazetteer, None if disabled.
+        """
+        Gazetteer.index = Gazetteer(path=path) if path else None
+        return Gazetteer.index
+
+    @staticmethod
+    def __rows(path: str) -> Iterator[list[str]]:
+        """Read the fields of each line in a GeoNames dump.
+
+        Args:
+            path (str): GeoNames tab-separated file, or a .zip containing one.
+
+        Yields:
+            Iterator[list[str]]: Fields of each line.
+        """
+        if Path(path).suffix.lower() == ".zip":
+            with zipfile.ZipFile(path) as archive:
+                name: str = next(n for n in archive.namelist() if n.endswith(".txt") and not n.lower().startswith("readme"))
+                with io.TextIOWrapper(archive.open(name), encoding="utf-8") as file:
+                    for line in file:
+                        yield line.rstrip("\n").split("\t")
+        else:
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    yield line.rstrip("\n").split("\t")
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize a name for lookups: accents removed, case folded and whitespace collapsed.
+
+        Args:
+            text (str): A place name, e.g. "São Paulo".
+
+        Returns:
+            str: Normalized name, e.g. "sao paulo".
+        """
+        decomposed: str = unicodedata.normalize("NFKD", text)
+        return " ".join("".join(c for c in decomposed if not unicodedata.combining(c)).casefold().split())
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def country_codes(qualifier: str) -> frozenset[str]:
+        """Countries a query qualifier could mean, e.g. "France", "FR" or "FRA".
+
+        Args:
+            qualifier (str): Part of a query after a comma.
+
+        Returns:
+            frozenset[str]: Alpha-2 country codes, empty if it isn't a country.
+        """
+        try:
+            return frozenset([pycountry.countries.lookup(qualifier).alpha_2])
+        except LookupError:
+            return frozenset()
+
+    def matches(self, key: str) -> range:
+        """Index positions of a normalized name, most populous place first.
+
+        Args:
+            key (str): Normalized name.
+
+        Returns:
+            range: Positions in keys and rows.
+        """
+        return range(bisect_left(self.keys, key), bisect_right(self.keys, key))
+
+    def complete(self, prefix: str, limit: int = 25) -> list[int]:
+        """Places with a name starting with a prefix, most populous first.
+
+        Args:
+            prefix (str): Normalized prefix.
+            limit (int, optional): Maximum places. Defaults to 25.
+
+        Returns:
+            list[int]: Place rows.
+        """
+        if not prefix:
+            return [int(row) for row in self.largest[:limit]]
+        lo: int             = bisect_left(self.keys, prefix)
+        hi: int             = bisect_left(self.keys, prefix + "\U0010ffff", lo=lo)
+        rows: np.ndarray    = np.unique(self.rows[lo:hi])
+        if len(rows) > limit:
+            rows            = rows[np.argpartition(-self.population[rows], limit)[:limit]]
+        return [int(row) for row in rows[np.argsort(-self.population[rows], kind="stable")]]
+
+    def label(self, row: int) -> str:
+        """A place as a query that find() resolves back to it, e.g. "Paris, FR" or "Paris, TX, US".
+
+        Args:
+            row (int): Place row.
+
+        Returns:
+            str: Name, region code if it's a letter code (US states, etc.) and country code.
+        """
+        region: str = self.admin1[row]
+        return f"{self.names[row]}, {region}, {self.countries[row]}" if region.isalpha() else f"{self.names[row]}, {self.countries[row]}"
+
+    def find(self, query: str) -> dict | None:
+        """Look up a place, e.g. "Paris", "Paris, France" or "Springfield, IL". Each part after the first comma narrows
+        it down by country (name or code) or first-level region code. The most populous match wins.
+
+        Args:
+            query (str): A lookup string.
+
+        Returns:
+            dict | None: Location fields in the GeoLookup.to_dict format, None if not found.
+        """
+        city, *qualifiers = [part.strip() for part in query.split(",")]
+        for position in self.matches(key=Gazetteer.normalize(city)):
+            row: int = int(self.rows[position])
+            if all(self.countries[row] in Gazetteer.country_codes(q) or self.admin1[row] == q.upper() for q in qualifiers if q):
+                return self.to_dict(row=row)
+        return None
+
+    def to_dict(self, row: int) -> dict:
+        """A place as a dictionary, in the GeoLookup.to_dict format.
+
+        Args:
+            row (int): Place row.
+
+        Returns:
+            dict: Raw place data and resolved location fields.
+        """
+        return {"raw":          {"geonameid": int(self.ids[row]), "name": self.names[row], "admin1": self.admin1[row], "population": int(self.population[row])},
+                "latitude":     float(self.latitude[row]),
+                "longitude":    float(self.longitude[row]),
+                "city":         self.names[row],
+                "country":      str(self.countries[row]),
+                "timezone":     self.timezones[self.zones[row]]}
+
+class PlaceIndex:
+    """Location suggestions for autocomplete, from places resolved before and then gazetteer cities by population.
+
+    Everything is in memory, so suggestions never wait on the Geocoder or the cache. Resolved places are kept in a
+    sorted array of normalized queries, searched by prefix with bisect; the oldest are dropped past capacity.
+    """
+    capacity: int               = 5000  # Resolved places kept
+    limit: int                  = 25    # Discord's maximum number of choices
+    max_length: int             = 100   # Discord's maximum length of a choice
+    __keys: list[str]           = []
+    __queries: dict[str, str]   = {}    # Normalized to query as typed, oldest first
+
+    @staticmethod
+    def remember(query: str) -> None:
+        """Add a query that resolved to a place.
+
+        Args:
+            query (str): A lookup string, as typed.
+        """
+        key: str = Gazetteer.normalize(query)
+        if not key or key in PlaceIndex.__queries or len(query) > PlaceIndex.max_length:
+            return
+        PlaceIndex.__queries[key] = query
+        insort(PlaceIndex.__keys, key)
+
+        if len(PlaceIndex.__queries) > PlaceIndex.capacity:
+            oldest: str = next(iter(PlaceIndex.__queries))
+            del PlaceIndex.__queries[oldest]
+            PlaceIndex.__keys.pop(bisect_left(PlaceIndex.__keys, oldest))
+
+    @staticmethod
+    def recent() -> list[str]:
+        """Queries that resolved to a place, oldest first, e.g. to remember() again after a restart.
+
+        Returns:
+            list[str]: Queries as typed.
+        """
+        return list(PlaceIndex.__queries.values())
+
+    @staticmethod
+    def suggest(text: str, limit: int = 25) -> list[str]:
+        """Suggestions for what's been typed so far.
+
+        Args:
+            text (str): Partial location.
+            limit (int, optional): Maximum suggestions. Defaults to 25.
+
+        Returns:
+            list[str]: Queries, resolved places first.
+        """
+        prefix: str                 = Gazetteer.normalize(text)
+        lo: int                     = bisect_left(PlaceIndex.__keys, prefix)
+        hi: int                     = bisect_left(PlaceIndex.__keys, prefix + "\U0010ffff", lo=lo)
+        found: dict[str, None]      = dict.fromkeys(PlaceIndex.__queries[key] for key in PlaceIndex.__keys[lo:min(hi, lo + limit)])
+
+        # Gazetteer names don't have commas, search by the city and check the rest against each label
+        if Gazetteer.index is not None and len(found) < limit:
+            city: str               = Gazetteer.normalize(text.split(",")[0])
+            wider: int              = limit if city == prefix else limit * 4
+            for row in Gazetteer.index.complete(prefix=city, limit=wider):
+                label: str          = Gazetteer.index.label(row=row)
+                if len(label) <= PlaceIndex.max_length and Gazetteer.normalize(label).startswith(prefix):
+                    found[label]    = None
+        return list(found)[:limit]
@@ -1,22 +1,123 @@
 # External
-import logging, asyncio
+import logging, asyncio, codecs
+import attrs
 import time as timer
 from abc import ABC
+from collections import deque
+from contextlib import nullcontext
+from html.parser import HTMLParser
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta, time
-from aiohttp_client_cache import CachedSession, SQLiteBackend # type: ignore
+from aiohttp import ClientSession, ClientTimeout, hdrs
+from aiohttp_client_cache import CachedSession # type: ignore
+from aiohttp_client_cache.cache_control import get_expiration_datetime
 from aiohttp_client_cache.response import CachedResponse
 # Internal
 from astrobot.core.common import Misc
+from astrobot.core.cache import Cache
+from astrobot.core.shards import FetchLock
+from astrobot.core.profiling import Profiler
 from astrobot.core.astrology import ZodiacSign
 from astrobot.modules.common import Day, Source, Style
+from astrobot.modules.archive import HoroArchive
+from astrobot.modules.search import HoroSearch
+from astrobot.modules.demand import Demand
 
 
+class HoroError(Exception):
+    """Raised when a horoscope can't be fetched or parsed.
+    """
+
+class Breaker:
+    """Circuit breaker for a source. Opens after repeated failures and stops calls to the source for a cool-down period,
+    then lets a single trial request through and stays open for everyone else until it succeeds or fails.
+    """
+    threshold: int                      = 3     # Consecutive failures before opening
+    cooldown: float                     = 120.0 # Seconds to stay open before letting a trial request through
+    sources: dict[Source, "Breaker"]    = {}
+
+    def __init__(self, source: Source) -> None:
+        """Circuit breaker for a source. Opens after repeated failures and stops calls to the source for a cool-down period.
+
+        Args:
+            source (Source): Source guarded by this breaker.
+        """
+        self.source: Source         = source
+        self.failures: int          = 0
+        self.opened_at: float       = 0.0
+        self.trial_at: float        = 0.0   # When the trial request went through, 0.0 if none is out
+
+    @staticmethod
+    def of(source: Source) -> "Breaker":
+        """Get the breaker for a source.
+
+        Args:
+            source (Source): Source of horoscope.
+
+        Returns:
+            Breaker: The process-wide breaker for the source.
+        """
+        if source not in Breaker.sources:
+            Breaker.sources[source] = Breaker(source=source)
+        return Breaker.sources[source]
+
+    def allow(self) -> bool:
+        """Whether a call to the source can go ahead. Once the cool-down passes, the first caller is let through as the
+        trial, and everyone else is blocked until it's recorded, or has outlasted the source's timeout.
+
+        Returns:
+            bool: True if the call can go ahead, False while the breaker is open.
+        """
+        if self.failures < Breaker.threshold:
+            return True
+        now: float = timer.monotonic()
+        if now - self.opened_at < Breaker.cooldown or now - self.trial_at < self.source.timeout:
+            return False
+        self.trial_at = now
+        return True
+
+    def success(self) -> None:
+        """Record a good response from the source, closing the breaker.
+        """
+        if self.failures >= Breaker.threshold:
+            logging.info("Circuit closed for %s", self.source.full)
+        self.failures = 0
+        self.trial_at = 0.0
+
+    def release(self) -> None:
+        """Give back a trial that never reached the source, e.g. one answered from the cache.
+        """
+        self.trial_at = 0.0
+
+    def failure(self) -> None:
+        """Record a failed response from the source, opening the breaker at the threshold.
+        """
+        self.failures += 1
+        self.trial_at = 0.0
+        if self.failures >= Breaker.threshold:
+            self.opened_at = timer.monotonic()
+            logging.warning("Circuit open for %s after %d failures, cooling down %0.0fs", self.source.full, self.failures, Breaker.cooldown)
+
 class CacheStatus:
     def __init__(self, cached: bool, expires: datetime) -> None:
         self.is_cached: bool    = cached
         self.expires: datetime  = expires
 
+    @staticmethod
+    def from_response(response: CachedResponse) -> "CacheStatus":
+        """Get cache status from a response.
+
+        Args:
+            response (CachedResponse): Response from Get.get().
+
+        Returns:
+            CacheStatus: Cached with its expiration, or not cached.
+        """
+        if response.expires != None:
+            return CacheStatus(cached=True, expires=response.expires) # type: ignore
+        else:
+            return CacheStatus(cached=False, expires=datetime.now())
+
 class Horo:
     """Container class for individual horoscopes.
     """
@@ -27,7 +128,9 @@ class Horo:
                  text: str              = "",
                  url: str               = "",
                  source: Source         = Source.astrology_com, 
-                 style: Style           = Style.daily
+                 style: Style           = Style.daily,
+                 note: str              = "",
+                 archived: bool         = False
                  ) -> None:
         """Container class for individual horoscopes. Served by Horoscope object with get_horoscope().
 
@@ -37,6 +140,8 @@ class Horo:
             text (str, optional): Horoscope text. Defaults to "".
             source (Source, optional): Source of horoscope. Defaults to Source.astrology_com.
             style (Style, optional): Style of horoscope. Defaults to Style.daily.
+            note (str, optional): Note shown under the horoscope, e.g. when served from a fallback source. Defaults to "".
+            archived (bool, optional): Whether it's a past date from the archive, shown without a relative day. Defaults to False.
         """
         self.cache: CacheStatus     = cache
         self.sign: ZodiacSign       = sign
@@ -44,6 +149,8 @@ class Horo:
         self.text: str              = text
         self.url: str               = url
         self.source: Source         = source
+        self.note: str              = note
+        self.archived: bool         = archived
         
         if style not in source.styles:
             self.style = source.default_style
@@ -52,20 +159,106 @@ class Horo:
 
     def get_formatted_string(self) -> str:
         # Format data into a list
+        # Archived dates can be any day, only live horoscopes get a relative day symbol
         day_of_week: str        = Misc.get_day_of_week_from_string(string=self.date).capitalize() + ","
-        _day: Day               = Misc.get_day(date=self.date)
+        _day: list[str]         = [] if self.archived else [Misc.get_day(date=self.date).symbol]
         header: list[str]       = ["### ", 
                                    self.sign.symbol, self.sign.full, 
                                    self.style.symbol, self.style.full, 
-                                   "for", _day.symbol, 
+                                   "for", *_day, 
                                    day_of_week, self.date,
                                    "from", f"[{self.source.full}](<{self.url}>)"]
         body: str               = self.text
 
         # Put data into single string, send
+        if self.note:
+            body += "\n-# " + self.note
         return " ".join(header) + "\n" + body
 
+class PageSection(HTMLParser):
+    """Copies the sections of a source's page that parse_response() reads, from HTML fed in chunks.
+
+    Markup is copied as it streams past, and done is set once every section has been closed, so the rest of the page
+    doesn't have to be downloaded. End tags close any elements left open inside them, the way browsers read them.
+    """
+    sections: dict[Source, list[tuple[str, str]]]   = {Source.astrology_com:   [("id", "content-date"), ("id", "content")],
+                                                       Source.astrostyle:      [("class", "horoscope-content")],
+                                                       Source.horoscope_com:   [("class", "main-horoscope")]}
+    void: frozenset[str]                            = frozenset("area base br col embed hr img input link meta source track wbr".split())
+    step: int                                       = 8192  # Characters parsed at a time, so little past the last section is read
+
+    def __init__(self, source: Source) -> None:
+        """Copies the sections of a source's page that parse_response() reads.
+
+        Args:
+            source (Source): Source of the page.
+        """
+        super().__init__(convert_charrefs=False)
+        self.wanted: list[tuple[str, str]]  = list(PageSection.sections[source])
+        self.parts: list[str]               = []
+        self.open: list[str]                = []    # Elements open inside the section being copied
+        self.done: bool                     = False
+
+    def feed(self, data: str) -> None:
+        """Parse more of the page, a slice at a time, stopping once every section has been closed.
+
+        Args:
+            data (str): Next part of the page.
+        """
+        for i in range(0, len(data), PageSection.step):
+            if self.done:
+                return
+            super().feed(data[i:i + PageSection.step])
+
+    @property
+    def fragment(self) -> str:
+        """The sections copied so far.
+
+        Returns:
+            str: HTML of each section, in page order.
+        """
+        return "".join(self.parts)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if not self.open:
+            found = next(((name, value) for name, value in self.wanted for key, given in attrs if key == name and given and value in given.split()), None)
+            if found is None:
+                return
+            self.wanted.remove(found)
+        self.parts.append(self.get_starttag_text() or "")
+        if tag not in PageSection.void:
+            self.open.append(tag)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.open:
+            self.parts.append(self.get_starttag_text() or "")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag not in self.open:
+            return
+        while self.open:
+            closed: str = self.open.pop()
+            self.parts.append(f"</{closed}>")
+            if closed == tag:
+                break
+        self.done = not self.open and not self.wanted
+
+    def handle_data(self, data: str) -> None:
+        if self.open:
+            self.parts.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        if self.open:
+            self.parts.append(f"&{name};")
+
+    def handle_charref(self, name: str) -> None:
+        if self.open:
+            self.parts.append(f"&#{name};")
+
 class Get(ABC):
+    shared_lock: FetchLock | None   = None  # Set when running as a shard worker, one process fetches each URL
+    streaming: bool                 = True  # Read pages in chunks, stop after the parsed sections and cache only those
+
     async def get(self, url: str = "") -> CachedResponse:
         fetch: str = ""
 
@@ -74,24 +267,123 @@ class Get(ABC):
         else:
             fetch = url
 
+        # Fail fast while the source's breaker is open
+        source: Source      = self.source # type: ignore
+        breaker: Breaker    = Breaker.of(source=source)
+        if not breaker.allow():
+            raise HoroError(f"{source.full} is unavailable right now")
+        trial: bool         = breaker.failures >= Breaker.threshold
+
         try: 
-            logging.debug(f"Querying URL: {fetch}")
+            logging.debug("Querying URL: %s", fetch)
+
+            # Shard workers read the shared cache without the lock, only a miss takes its stripe. Both paths below
+            # check the cache again under it, in case another process fetched the page in the meantime.
+            cached: CachedResponse | None   = await self.get_cached(url=fetch) if Get.shared_lock else None
+            async with Get.shared_lock.hold(key=fetch) if Get.shared_lock and cached is None else nullcontext():
+                if cached is not None:
+                    response, origin        = cached, False
+                elif Get.streaming:
+                    response, origin        = await self.__stream(url=fetch, source=source)
+                else:
+                    async with CachedSession(cache=Cache.backend.responses) as session:
+                        raw = await session.get(url=fetch, expire_after=self.urls_expire_after.get(fetch), timeout=ClientTimeout(total=source.timeout)) # type: ignore
+                        raw.raise_for_status()
+                        response: CachedResponse = await CachedResponse.from_client_response(raw)
+                        origin              = not isinstance(raw, CachedResponse)
 
-            async with CachedSession(cache=SQLiteBackend(cache_name='astrobot_cache', urls_expire_after=self.urls_expire_after)) as session: # type: ignore
-                response: CachedResponse = await CachedResponse.from_client_response(await session.get(url=fetch))
+        except Exception as e: 
+            logging.error("*** Query error: %s", str(e) or type(e).__name__)
+            breaker.failure()
+            raise HoroError(f"{source.full} didn't respond") from e
 
-            return response
+        # Only origin responses say anything about the source's health
+        if origin:
+            breaker.success()
+        elif trial:
+            breaker.release()
+        return response
 
-        except Exception as e: 
-            logging.error(f"*** Query error: {str(e)}")
-            return response # type: ignore
+    async def __stream(self, url: str, source: Source) -> tuple[CachedResponse, bool]:
+        """Get a page from the cache, or read it from the source only up to the end of the sections parse_response()
+        needs, and cache those. aiohttp asks for a compressed body and inflates the chunks as they arrive.
+
+        Args:
+            url (str): URL to get.
+            source (Source): Source of the page.
+
+        Returns:
+            tuple[CachedResponse, bool]: The page, and whether it came from the source rather than the cache.
+        """
+        key: str                            = Cache.backend.responses.create_key(method="GET", url=url)
+        cached: CachedResponse | None       = await Cache.backend.responses.get_response(key=key)
+        if cached is not None:
+            return cached, False
+
+        async with ClientSession(timeout=ClientTimeout(total=source.timeout)) as session:
+            async with session.get(url) as raw:
+                raw.raise_for_status()
+                section: PageSection        = PageSection(source=source)
+                decoder                     = codecs.getincrementaldecoder(raw.charset or "utf-8")(errors="replace")
+                received: int               = 0
+                async for chunk in raw.content.iter_any():
+                    received                += len(chunk)
+                    section.feed(decoder.decode(chunk))
+                    if section.done:
+                        break
+                else:
+                    section.feed(decoder.decode(b"", final=True))
+                    section.close()
+                logging.debug("Read %d bytes of %s, kept %d", received, url, len(section.fragment))
+
+                # The fragment is stored as UTF-8 whatever the source's charset, so its Content-Type is rewritten to match
+                headers                     = tuple((k, v) for k, v in raw.raw_headers if k.decode("latin-1").title() not in (hdrs.CONTENT_ENCODING, hdrs.CONTENT_LENGTH, hdrs.TRANSFER_ENCODING, hdrs.CONTENT_TYPE))
+                headers                     += ((hdrs.CONTENT_TYPE.encode("latin-1"), b"text/html; charset=utf-8"),)
+                response: CachedResponse    = CachedResponse(method="GET",
+                                                             reason=raw.reason or "",
+                                                             status=raw.status,
+                                                             url=raw.url,
+                                                             version=raw.version, # type: ignore
+                                                             body=section.fragment.encode("utf-8"),
+                                                             encoding="utf-8",
+                                                             expires=get_expiration_datetime(self.urls_expire_after.get(url)), # type: ignore
+                                                             raw_headers=headers,
+                                                             real_url=raw.real_url)
+
+        # Like CachedSession, a response from the source has no expiry, only the cached copy does
+        await Cache.backend.responses.responses.write(key, response)
+        return attrs.evolve(response, expires=None), True
+
+    async def get_cached(self, url: str) -> CachedResponse | None:
+        """Get a response only if it's in the cache and not expired. Never calls the source.
+
+        Args:
+            url (str): URL to look up.
+
+        Returns:
+            CachedResponse | None: The cached response, or None.
+        """
+        key: str = Cache.backend.responses.create_key(method="GET", url=url)
+        return await Cache.backend.responses.get_response(key=key)
 
 class UrlBuilder(ABC):
-    def build_url(self, day: Day, source: Source, style: Style, sign: ZodiacSign) -> str:
-        baseurl: dict[Source, str]              = {Source.astrology_com: "https://www.astrology.com/",
+    baseurl: dict[Source, str]                  = {Source.astrology_com: "https://www.astrology.com/",
                                                    Source.astrostyle: "https://astrostyle.com/",
                                                    Source.horoscope_com: "https://www.horoscope.com/us/horoscopes/"}
-        url_return: list[str]                   = [baseurl[source]]
+
+    @staticmethod
+    def override_base(base: str) -> None:
+        """Point every source at another server, e.g. local fixtures. Each source's pages go under a folder named after it.
+
+        Args:
+            base (str): Base URL, e.g. "http://localhost:8000". Source paths are added as "{base}/{source.name}/...".
+        """
+        for source in Source:
+            UrlBuilder.baseurl[source] = f"{base.rstrip('/')}/{source.name}/"
+        logging.info("Horoscope sources overridden to %s", base)
+
+    def build_url(self, day: Day, source: Source, style: Style, sign: ZodiacSign) -> str:
+        url_return: list[str]                   = [UrlBuilder.baseurl[source]]
 
         if source == Source.astrology_com:
             style_text: dict[Style, str]        = {Style.daily:       "horoscope/daily/",
@@ -197,14 +489,33 @@ class HoroParser(ABC):
         else:
             return "", ""
 
+    def parse_key(self, source: Source, day: Day) -> tuple[Source, str]:
+        """Key for parse_response() results on the same page. Only AstroStyle reads the day, to pick a date on weekends.
+
+        Args:
+            source (Source): Source of the page.
+            day (Day): Relative day requested.
+
+        Returns:
+            tuple[Source, str]: Items with the same URL and key share a parse.
+        """
+        if source == Source.astrostyle:
+            return source, Misc.get_day_of_week_from_day(day=day)
+        return source, ""
+
 class HoroItem(Get, UrlBuilder, HoroParser):
+    fallback: bool          = True  # Serve another source's cached horoscope when the requested source fails
+    parse_fail_ttl: float   = 600.0 # Seconds to remember a page that failed to parse
+    warm_cold: bool         = True  # Warm horoscopes nobody has asked for too, otherwise they're fetched on first request
+
     def __init__(self, day: Day, source: Source, style: Style, sign: ZodiacSign) -> None:
         self.day: Day                   = day
         self.source: Source             = source
-        self.style: Style               = style
+        self.style: Style               = style if style in source.styles else source.default_style
         self.sign: ZodiacSign           = sign
         self.date: str                  = ""
         self.text: str                  = ""
+        self.cache: CacheStatus         = CacheStatus(cached=False, expires=datetime.now())
         self.url: str                   = self.build_url(day=self.day, 
                                                          source=self.source, 
                                                          style=self.style, 
@@ -220,61 +531,374 @@ class HoroItem(Get, UrlBuilder, HoroParser):
         else:
             return today
 
-    async def fetch(self) -> Horo:
-        response: CachedResponse    = await self.get(url=self.url)
+    @property
+    def fail_key(self) -> str:
+        """Cache key marking that this item's page recently failed to parse.
 
-        if response.expires != None:
-            cache = CacheStatus(cached=True, expires=response.expires) # type: ignore
-        else:
-            cache = CacheStatus(cached=False, expires=datetime.now())
+        Returns:
+            str: A cache key.
+        """
+        return f"parsefail:{self.url}:{self.parse_key(source=self.source, day=self.day)[1]}"
+
+    async def parse(self, text: str) -> None:
+        """Parse page text into date and text. Failures are negatively cached and count against the source's breaker.
+
+        Args:
+            text (str): Page text.
+        """
+        try:
+            self.date, self.text    = self.parse_response(source=self.source, day=self.day, text=text)
+        except (AttributeError, IndexError, ValueError) as e:
+            logging.error("*** Parse error for %s: %s", self.url, e)
+            Breaker.of(source=self.source).failure()
+            await Cache.backend.set(key=self.fail_key, value=True, expires=datetime.now() + timedelta(seconds=HoroItem.parse_fail_ttl))
+            await Cache.backend.responses.delete_url(url=self.url)
+            raise HoroError(f"{self.source.full} page couldn't be read") from e
+
+    async def fetch_source(self) -> Horo:
+        """Fetch and parse the horoscope from this item's source only.
+
+        Returns:
+            Horo: The horoscope.
+        """
+        if await Cache.backend.get(key=self.fail_key) is not None:
+            raise HoroError(f"{self.source.full} page couldn't be read recently")
+
+        # Don't wait behind a warm-up in progress
+        if FetchPlan.active is not None:
+            await FetchPlan.active.claim(url=self.url)
+
+        response: CachedResponse    = await self.get(url=self.url)
+        cache: CacheStatus          = CacheStatus.from_response(response=response)
 
         text = await response.text()
-        self.date, self.text        = self.parse_response(source=self.source, day=self.day, text=text)
+        await self.parse(text=text)
         
+        hor: Horo                   = self.to_horo(cache=cache)
+        await HoroItem.record(horos=[hor])
+        return hor
+
+    @staticmethod
+    async def record(horos: list) -> None:
+        """Keep freshly parsed horoscopes in the archive and the search index, where they're turned on.
+
+        Args:
+            horos (list): Horo objects.
+        """
+        if HoroArchive.active is not None:
+            await HoroArchive.active.add(horos=horos)
+        if HoroSearch.active is not None:
+            await HoroSearch.active.add(horos=horos)
+
+    async def fetch_archived(self, date: datetime) -> Horo:
+        """Get this item's sign, source and style for a past date from the archive. Never calls the source.
+
+        Args:
+            date (datetime): Date of the horoscope.
+
+        Raises:
+            HoroError: If archiving is off or the date isn't archived.
+
+        Returns:
+            Horo: The horoscope.
+        """
+        found: dict | None = None
+        if HoroArchive.active is not None:
+            found = HoroArchive.active.get(date=date, source=self.source, style=self.style, sign=self.sign)
+        if found is None:
+            raise HoroError(f"there's no archived {self.source.full} horoscope for {Misc.get_date_string(date=date)}")
+        return Horo(cache=CacheStatus(cached=True, expires=datetime.now()), sign=self.sign, date=found["date"], text=found["text"], url=found["url"], source=self.source, style=self.style, archived=True)
+
+    async def fetch(self) -> Horo:
+        try:
+            return await self.fetch_source()
+        except HoroError as e:
+            if not HoroItem.fallback:
+                raise
+            hor: Horo | None = await self.__fallback()
+            if hor is None:
+                raise
+            hor.note = f"{str(e)}, showing {hor.source.full} instead."
+            return hor
+
+    async def __fallback(self) -> Horo | None:
+        """Serve the same sign and day from another source, only if it's already in the cache. Read only: a page that
+        doesn't parse is skipped, without touching that source's breaker or cache entries.
+
+        Returns:
+            Horo | None: The other source's horoscope, or None if none are cached.
+        """
+        for source in Source:
+            if source == self.source:
+                continue
+
+            item: HoroItem = HoroItem(day=self.day, source=source, style=self.style, sign=self.sign)
+            if await Cache.backend.get(key=item.fail_key) is not None:
+                continue
+
+            response: CachedResponse | None = await self.get_cached(url=item.url)
+            if response is None:
+                continue
+
+            try:
+                item.date, item.text = item.parse_response(source=source, day=item.day, text=await response.text())
+            except (AttributeError, IndexError, ValueError):
+                continue
+
+            logging.info("Serving fallback from %s for %s", source.full, self.source.full)
+            return item.to_horo(cache=CacheStatus.from_response(response=response))
+
+        return None
+
+    @property
+    def demand(self) -> float:
+        """How much this horoscope is asked for.
+
+        Returns:
+            float: Decayed request count from Demand.
+        """
+        return Demand.of(day=self.day, source=self.source, style=self.style, sign=self.sign)
+
+    def to_horo(self, cache: CacheStatus) -> Horo:
+        """Build a Horo from this item's parsed date and text.
+
+        Args:
+            cache (CacheStatus): Cache status of the response.
+
+        Returns:
+            Horo: The horoscope.
+        """
         return Horo(cache=cache, sign=self.sign, date=self.date, text=self.text, url=self.url, source=self.source, style=self.style)
     
     @staticmethod
-    async def __list_all() -> list:
+    def list_all(days: list[Day] | None         = None,
+                 sources: list[Source] | None   = None,
+                 styles: list[Style] | None     = None,
+                 signs: list[ZodiacSign] | None = None
+                 ) -> list:
+        """List every horoscope item, or a subset of them.
+
+        Args:
+            days (list[Day] | None, optional): Days to include. Defaults to None, all.
+            sources (list[Source] | None, optional): Sources to include. Defaults to None, all.
+            styles (list[Style] | None, optional): Styles to include, where the source has them. Defaults to None, all.
+            signs (list[ZodiacSign] | None, optional): Signs to include. Defaults to None, all.
+
+        Returns:
+            list: A list of HoroItem objects.
+        """
         horoscopes: list[HoroItem] = []
 
-        for day in Day:
-            for source in Source:
+        for day in days or Day:
+            for source in sources or Source:
                 for style in source.styles:
-                    for sign in ZodiacSign:
+                    if styles and style not in styles:
+                        continue
+                    for sign in signs or ZodiacSign:
                         horo = HoroItem(day=day, source=source, style=style, sign=sign)
                         horoscopes.append(horo)
 
         return horoscopes
     
     @staticmethod
-    async def precache() -> None:
+    async def precache(items: list | None = None) -> None:
+        await HoroItem.__precache(items=items)
+
+    @staticmethod
+    @Profiler.profiled("precache")
+    async def __precache(items: list | None = None) -> tuple[int, list[Horo] | None]:
+        """Warm the cache, and parse the fresh pages into the archive and search index where they're turned on.
+
+        Args:
+            items (list | None, optional): HoroItem objects. Defaults to None, all.
+
+        Returns:
+            tuple[int, list[Horo] | None]: Items warmed, and their horoscopes if they were parsed, else None.
+        """
         logging.info("Precaching all possible horoscopes...")
         tic = timer.perf_counter()
 
-        responses = []
-        horoscopes: list[HoroItem] = await HoroItem.__list_all()
-        for horo in horoscopes:
-            responses.append(horo.get())
-        await asyncio.gather(*responses)
+        # Most asked for first, leaving out the ones nobody asks for if set to
+        await Demand.save()
+        items = items if items is not None else HoroItem.list_all()
+        if not HoroItem.warm_cold:
+            items = [item for item in items if item.demand > 0] or items
+
+        plan: FetchPlan = FetchPlan(items=items)
+        await plan.precache()
+
+        # Parse the fresh pages into the archive and search index, from the cache
+        horos: list[Horo] | None = None
+        if HoroArchive.active is not None or HoroSearch.active is not None:
+            horos = await plan.fetch()
+        if HoroSearch.active is not None:
+            await HoroSearch.active.merge()
 
         toc = timer.perf_counter()
-        logging.info(f"Precaching completed! {toc - tic:0.3f}s")
+        logging.info("Precaching completed! %d horoscopes from %d URLs (%0.2fx dedup), %d failed, %d taken by requests. %0.3fs", len(plan.items), len(plan.urls), plan.ratio, plan.failed, plan.claimed, toc - tic)
+        return len(plan.items), horos
 
     @staticmethod
-    async def get_all() -> list:
-        await HoroItem.precache()
+    async def get_all(items: list | None = None) -> list:
+        items = items if items is not None else HoroItem.list_all()
+        warmed, horos = await HoroItem.__precache(items=items)
+
+        # Pages already parsed while warming aren't parsed again, unless cold items were left out
+        if horos is not None and warmed == len(items):
+            return horos
 
         logging.info("Processing all horoscope responses...")
         tic = timer.perf_counter()
 
-        tasks = []
-        horocopes: list[HoroItem] = await HoroItem.__list_all()
-
-        for horo in horocopes:
-            tasks.append(horo.fetch())
-        horos: list[Horo] = await asyncio.gather(*tasks)
+        plan: FetchPlan = FetchPlan(items=items)
+        horos = await plan.fetch()
 
         toc = timer.perf_counter()
-        logging.info(f"Processing completed! {toc - tic:0.3f}s")
+        logging.info("Processing completed! %d horoscopes from %d URLs (%0.2fx dedup), %d failed. %0.3fs", len(plan.items), len(plan.urls), plan.ratio, plan.failed, toc - tic)
+
+        return horos
+
+class FetchPlan:
+    """Collapses horoscope items to unique URLs, so each page is fetched and parsed once and fanned out to every item.
+    """
+    active: "FetchPlan | None"  = None  # Warm-up in progress, requests can claim its pages
+    concurrency: int            = 16    # Pages fetched at once while warming
+
+    def __init__(self, items: list[HoroItem]) -> None:
+        """Collapses horoscope items to unique URLs, so each page is fetched and parsed once and fanned out to every item.
+
+        Args:
+            items (list[HoroItem]): Items to fetch, duplicates allowed.
+        """
+        self.items: list[HoroItem]              = items
+        self.urls: dict[str, list[HoroItem]]    = {}
+        self.failed: int                        = 0
+        self.claimed: int                       = 0
+        self.queue: deque[str]                  = deque()
+        self.inflight: dict[str, asyncio.Task]  = {}
+        self.timings: dict[str, float]          = {"fetch": 0.0, "cache_read": 0.0, "parse": 0.0}
+
+        for item in items:
+            self.urls.setdefault(item.url, []).append(item)
+
+    @property
+    def ratio(self) -> float:
+        """Dedup ratio, logical items per unique URL.
+
+        Returns:
+            float: Items divided by URLs, 1.0 means no duplicates.
+        """
+        if not self.urls:
+            return 1.0
+        return len(self.items) / len(self.urls)
+
+    def demand(self, url: str) -> float:
+        """How much the items on a page are asked for.
 
-        return horos
\ No newline at end of file
+        Args:
+            url (str): One of the plan's URLs.
+
+        Returns:
+            float: Sum of the items' demand.
+        """
+        return sum(item.demand for item in self.urls[url])
+
+    async def precache(self) -> None:
+        """Fetch each unique URL once into the cache, without parsing, most asked for first. Failures are logged and
+        skipped. A few pages are fetched at a time, and requests can claim() pages still in the queue.
+
+        Wall time is added to timings["fetch"].
+        """
+        tic = timer.perf_counter()
+        self.failed         = 0
+        self.claimed        = 0
+        self.queue          = deque(sorted(self.urls, key=self.demand, reverse=True))
+        FetchPlan.active    = self
+        try:
+            await asyncio.gather(*[self.__warm() for _ in range(min(FetchPlan.concurrency, len(self.queue)))])
+        finally:
+            FetchPlan.active = None
+        self.timings["fetch"] += timer.perf_counter() - tic
+
+    async def __warm(self) -> None:
+        """Fetch pages from the front of the queue until it's empty.
+        """
+        while self.queue:
+            url: str            = self.queue.popleft()
+            group: list         = self.urls[url]
+            self.inflight[url]  = asyncio.ensure_future(group[0].get())
+            try:
+                await self.inflight[url]
+            except Exception:
+                self.failed     += len(group)
+            finally:
+                del self.inflight[url]
+
+    async def claim(self, url: str) -> None:
+        """Let a request go ahead of the warm-up. A page still in the queue is taken out, for the request to fetch now,
+        and a page being fetched is waited for, so it isn't fetched twice.
+
+        Args:
+            url (str): URL the request needs.
+        """
+        if url in self.inflight:
+            await asyncio.wait([self.inflight[url]])
+        elif url in self.queue:
+            self.queue.remove(url)
+            self.claimed        += 1
+
+    async def __fetch_url(self, group: list[HoroItem]) -> list[Horo]:
+        """Fetch one URL and parse it once per parse key, filling in every item in the group.
+
+        Args:
+            group (list[HoroItem]): Items sharing the URL.
+
+        Returns:
+            list[Horo]: Horoscopes for the items that could be fetched and parsed.
+        """
+        tic = timer.perf_counter()
+        try:
+            if await Cache.backend.get(key=group[0].fail_key) is not None:
+                raise HoroError(f"{group[0].source.full} page couldn't be read recently")
+            response: CachedResponse    = await group[0].get()
+            text: str                   = await response.text()
+        except HoroError:
+            self.failed += len(group)
+            return []
+        finally:
+            self.timings["cache_read"] += timer.perf_counter() - tic
+
+        horos: list[Horo]   = []
+        parsed: dict        = {}
+        for item in group:
+            key = item.parse_key(source=item.source, day=item.day)
+            tic = timer.perf_counter()
+            try:
+                if key not in parsed:
+                    await item.parse(text=text)
+                    parsed[key] = (item.date, item.text)
+            except HoroError:
+                parsed[key] = None
+            self.timings["parse"] += timer.perf_counter() - tic
+            if parsed[key] is None:
+                self.failed += 1
+                continue
+            item.date, item.text = parsed[key]
+            horos.append(item.to_horo(cache=CacheStatus.from_response(response=response)))
+
+        return horos
+
+    async def fetch(self) -> list[Horo]:
+        """Fetch and parse every item, one request and parse per unique page. Items that fail are logged and left out.
+
+        Time per request is added to timings["cache_read"] and time per parse to timings["parse"]. Requests overlap,
+        so cache_read is the sum of their latencies, not wall time.
+
+        Returns:
+            list[Horo]: Horoscopes for items that succeeded, grouped by URL.
+        """
+        self.failed = 0
+        results: list[list[Horo]] = await asyncio.gather(*[self.__fetch_url(group=group) for group in self.urls.values()])
+        horos: list[Horo] = [hor for horos in results for hor in horos]
+        await HoroItem.record(horos=horos)
+        return horos
@@ -0,0 +1,347 @@
+# External
+import logging, asyncio, fcntl, os, re, threading
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from pathlib import Path
+import numpy as np
+# Internal
+from astrobot.core.common import Misc
+from astrobot.core.astrology import ZodiacSign
+from astrobot.modules.common import Source, Style
+from astrobot.modules.archive import HoroArchive
+
+
+class SearchHit:
+    """One horoscope that matched a search.
+    """
+    sources: tuple[Source, ...]     = tuple(Source)
+    styles: tuple[Style, ...]       = tuple(Style)
+    signs: tuple[ZodiacSign, ...]   = tuple(ZodiacSign)
+
+    def __init__(self, doc: int) -> None:
+        """One horoscope that matched a search.
+
+        Args:
+            doc (int): Document ID, from HoroSearch.doc_id().
+        """
+        self.date: datetime         = datetime.fromordinal(doc >> 8)
+        self.source: Source         = SearchHit.sources[doc >> 6 & 0b11]
+        self.style: Style           = SearchHit.styles[doc >> 4 & 0b11]
+        self.sign: ZodiacSign       = SearchHit.signs[doc & 0b1111]
+
+class HoroSearch:
+    """Inverted index over horoscope text, from each word to the horoscopes (date, source, style, sign) that use it.
+
+    The bulk of the index is an immutable generation on disk: a sorted vocabulary, and term offsets and postings as
+    flat arrays that are memory-mapped, not read. New horoscopes are indexed in memory and appended to a delta log, and
+    merge() folds the log into a new generation. Both take a file lock, so shard workers can share one index.
+    """
+    active: "HoroSearch | None"     = None  # Process-wide index, set by configure
+    word: re.Pattern                = re.compile(r"[a-z][a-z']+")
+    min_length: int                 = 3     # Shorter words aren't indexed
+    merge_every: int                = 1000  # Horoscopes in the delta log that trigger a merge
+    stopwords: frozenset[str]       = frozenset("the and you your for are with that this will but not can may have has from".split()
+                                                + "its it's into about what when who all any more than they them their our out".split()
+                                                + "just some get been being was were too very also now how one".split())
+
+    def __init__(self, path: str) -> None:
+        """Inverted index over horoscope text.
+
+        Args:
+            path (str): Folder for index files, created if missing.
+        """
+        self.folder: Path                   = Path(path)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.current: Path                  = self.folder / "CURRENT"
+        self.log: Path                      = self.folder / "delta.log"
+        self.lock: Path                     = self.folder / "lock"
+        self.generation: int                = -1
+        self.vocab: list[str]               = []
+        self.offsets: np.ndarray            = np.zeros(1, dtype=np.uint64)
+        self.postings: np.ndarray           = np.zeros(0, dtype=np.uint32)
+        self.base_docs: np.ndarray          = np.zeros(0, dtype=np.uint32)
+        self.docs: set[int]                 = set()     # Documents in the delta log
+        self.delta: dict[str, set[int]]     = {}
+        self.__log_read_to: int             = 0
+        self.__lock: threading.Lock         = threading.Lock()  # Index state, used from the loop and writer threads
+
+        self.__refresh()
+        logging.info("Horoscope search index at %s: generation %d, %d words, %d horoscopes", self.folder, self.generation, len(self.vocab), len(self.base_docs) + len(self.docs))
+
+    @staticmethod
+    def configure(path: str) -> "HoroSearch | None":
+        """Set the process-wide index.
+
+        Args:
+            path (str): Index folder, or "" to disable search.
+
+        Returns:
+            HoroSearch | None: The index, None if disabled.
+        """
+        HoroSearch.active = HoroSearch(path=path) if path else None
+        return HoroSearch.active
+
+    @staticmethod
+    def tokenize(text: str) -> set[str]:
+        """Words worth indexing in a text.
+
+        Args:
+            text (str): Horoscope text.
+
+        Returns:
+            set[str]: Lowercase words, without short words and stopwords.
+        """
+        return {w for w in HoroSearch.word.findall(text.lower()) if len(w) >= HoroSearch.min_length and w not in HoroSearch.stopwords}
+
+    @staticmethod
+    def doc_id(date: datetime, source: Source, style: Style, sign: ZodiacSign) -> int:
+        """Document ID for a horoscope, the date ordinal and enum positions packed into 32 bits.
+
+        Args:
+            date (datetime): Date of the horoscope.
+            source (Source): Source of the horoscope.
+            style (Style): Style of the horoscope.
+            sign (ZodiacSign): Zodiac sign.
+
+        Returns:
+            int: Document ID.
+        """
+        day, src, sty, sgn = HoroArchive.key(date=date, source=source, style=style, sign=sign)
+        return day << 8 | src << 6 | sty << 4 | sgn
+
+    def __load(self, generation: int) -> None:
+        """Map a generation's files.
+
+        Args:
+            generation (int): Generation number, -1 for an empty index.
+        """
+        self.generation     = generation
+        self.delta          = {}
+        self.docs           = set()
+        self.__log_read_to  = 0
+        if generation < 0:
+            return
+
+        base: Path          = self.folder / f"base-{generation}"
+        self.vocab          = (base / "vocab.txt").read_text(encoding="utf-8").split("\n") if (base / "vocab.txt").stat().st_size else []
+        self.offsets        = np.memmap(base / "offsets.bin", dtype=np.uint64, mode="r")
+        self.postings       = np.memmap(base / "postings.bin", dtype=np.uint32, mode="r") if self.offsets[-1] else np.zeros(0, dtype=np.uint32)
+        self.base_docs      = np.memmap(base / "docs.bin", dtype=np.uint32, mode="r") if (base / "docs.bin").stat().st_size else np.zeros(0, dtype=np.uint32)
+
+    def __refresh(self) -> None:
+        """Pick up a new generation and log entries written by this or another process.
+        """
+        generation: int = int(self.current.read_text()) if self.current.exists() else -1
+        if generation == self.generation and (not self.log.exists() or self.log.stat().st_size == self.__log_read_to):
+            return
+        with self.__lock, open(self.lock, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_SH)
+            try:
+                if generation != self.generation:
+                    self.__load(generation=generation)
+                if self.log.exists():
+                    with open(self.log, "rb") as log:
+                        log.seek(self.__log_read_to)
+                        self.__log_read_to += self.__replay(data=log.read())
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def __replay(self, data: bytes) -> int:
+        """Add delta log lines to the in-memory delta.
+
+        Args:
+            data (bytes): Log contents, possibly ending in a partly written line.
+
+        Returns:
+            int: Bytes of whole lines read.
+        """
+        whole: int = data.rfind(b"\n") + 1
+        for line in data[:whole].decode("utf-8").splitlines():
+            doc, _, words = line.partition("\t")
+            self.docs.add(int(doc))
+            for w in words.split(" "):
+                if w:
+                    self.delta.setdefault(w, set()).add(int(doc))
+        return whole
+
+    def __append(self, entries: list[tuple[int, set[str]]]) -> None:
+        """Append documents to the delta log under the lock, then read them back with anything else that's new.
+
+        Args:
+            entries (list[tuple[int, set[str]]]): Document ID and its words.
+        """
+        with open(self.lock, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                with open(self.log, "a", encoding="utf-8") as log:
+                    log.write("".join(f"{doc}\t{' '.join(sorted(words))}\n" for doc, words in entries))
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+        self.__refresh()
+
+    async def add(self, horos: list) -> None:
+        """Index horoscopes that aren't indexed yet. Writes happen off the event loop.
+
+        Args:
+            horos (list): Horo objects.
+        """
+        entries: list[tuple[int, set[str]]] = []
+        for hor in horos:
+            try:
+                date: datetime = Misc.get_date_from_string(string=hor.date)
+            except ValueError:
+                continue
+            doc: int = HoroSearch.doc_id(date=date, source=hor.source, style=hor.style, sign=hor.sign)
+            if not self.indexed(doc=doc):
+                self.docs.add(doc)
+                entries.append((doc, HoroSearch.tokenize(text=hor.text)))
+
+        if entries:
+            await asyncio.to_thread(self.__append, entries)
+            if len(self.docs) >= HoroSearch.merge_every:
+                await self.merge()
+
+    def indexed(self, doc: int) -> bool:
+        """Whether a document is in the index.
+
+        Args:
+            doc (int): Document ID.
+
+        Returns:
+            bool: True if it's in the mapped generation or the delta log.
+        """
+        i: int = int(np.searchsorted(self.base_docs, doc))
+        return doc in self.docs or (i < len(self.base_docs) and int(self.base_docs[i]) == doc)
+
+    def __merge(self) -> None:
+        """Fold the delta log into a new generation, under the lock.
+        """
+        with self.__lock, open(self.lock, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                # Read everything under this lock, another process may have merged already
+                self.__load(generation=int(self.current.read_text()) if self.current.exists() else -1)
+                if self.log.exists():
+                    self.__log_read_to = self.__replay(data=self.log.read_bytes())
+                if not self.delta:
+                    return
+
+                # Terms from both, in order, with postings sorted
+                terms: list[str]            = sorted(set(self.vocab) | set(self.delta))
+                lists: list[np.ndarray]     = []
+                for term in terms:
+                    postings: np.ndarray    = self.__base(term=term)
+                    if term in self.delta:
+                        postings            = np.union1d(postings, np.fromiter(self.delta[term], dtype=np.uint32))
+                    lists.append(postings.astype(np.uint32))
+
+                generation: int             = self.generation + 1
+                base: Path                  = self.folder / f"base-{generation}"
+                base.mkdir(exist_ok=True)
+                (base / "vocab.txt").write_text("\n".join(terms), encoding="utf-8")
+                np.concatenate([[0], np.cumsum([len(p) for p in lists])]).astype(np.uint64).tofile(base / "offsets.bin")
+                (np.concatenate(lists) if lists else np.zeros(0, dtype=np.uint32)).tofile(base / "postings.bin")
+                np.union1d(self.base_docs, np.fromiter(self.docs, dtype=np.uint32)).astype(np.uint32).tofile(base / "docs.bin")
+
+                # Switch over, then drop the log and the old generation
+                tmp: Path                   = self.folder / "CURRENT.tmp"
+                tmp.write_text(str(generation))
+                os.replace(tmp, self.current)
+                self.log.unlink(missing_ok=True)
+                old: Path                   = self.folder / f"base-{self.generation}"
+                for file in old.glob("*"):
+                    file.unlink()
+                if old.exists():
+                    old.rmdir()
+                self.__load(generation=generation)
+                logging.info("Search index merged: generation %d, %d words, %d postings", generation, len(terms), len(self.postings))
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    async def merge(self) -> None:
+        """Fold new horoscopes into a new on-disk generation, off the event loop.
+        """
+        await asyncio.to_thread(self.__merge)
+
+    def __base(self, term: str) -> np.ndarray:
+        """Postings for a term in the mapped generation.
+
+        Args:
+            term (str): Exact term.
+
+        Returns:
+            np.ndarray: Sorted document IDs.
+        """
+        i: int = bisect_left(self.vocab, term)
+        if i < len(self.vocab) and self.vocab[i] == term:
+            return self.postings[int(self.offsets[i]):int(self.offsets[i + 1])]
+        return np.zeros(0, dtype=np.uint32)
+
+    def __matching(self, prefix: str, since: int) -> np.ndarray:
+        """Documents with any word starting with a prefix, so "travel" also finds "travels" and "traveling". IDs start
+        with the date, so each sorted postings list is cut to the date range with a binary search before they're joined.
+
+        Args:
+            prefix (str): Lowercase prefix.
+            since (int): Lowest document ID to return.
+
+        Returns:
+            np.ndarray: Sorted document IDs.
+        """
+        lo: int                 = bisect_left(self.vocab, prefix)
+        hi: int                 = bisect_left(self.vocab, prefix + "\U0010ffff", lo=lo)
+        parts: list[np.ndarray] = []
+        for i in range(lo, hi):
+            postings: np.ndarray = self.postings[int(self.offsets[i]):int(self.offsets[i + 1])]
+            parts.append(postings[int(np.searchsorted(postings, since)):])
+        parts.append(np.array([doc for term, docs in self.delta.items() if term.startswith(prefix) for doc in docs if doc >= since], dtype=np.uint32))
+        # Delta postings are unordered and a document can match several terms
+        return np.unique(np.concatenate(parts))
+
+    async def search(self, text: str, days: int = 7, sign: ZodiacSign | None = None, source: Source | None = None) -> list[SearchHit]:
+        """Find horoscopes that use every word in a query, newest first. Runs off the event loop, as it may wait for a
+        merge to finish.
+
+        Args:
+            text (str): Words to look for.
+            days (int, optional): Only the last number of days, up to tomorrow. Defaults to 7.
+            sign (ZodiacSign | None, optional): Only this sign. Defaults to None, all.
+            source (Source | None, optional): Only this source. Defaults to None, all.
+
+        Returns:
+            list[SearchHit]: Matching horoscopes.
+        """
+        return await asyncio.to_thread(self.__search, text, days, sign, source)
+
+    def __search(self, text: str, days: int, sign: ZodiacSign | None, source: Source | None) -> list[SearchHit]:
+        """Find horoscopes that use every word in a query, newest first, reading the index under its lock.
+
+        Args:
+            text (str): Words to look for.
+            days (int): Only the last number of days, up to tomorrow.
+            sign (ZodiacSign | None): Only this sign, or None for all.
+            source (Source | None): Only this source, or None for all.
+
+        Returns:
+            list[SearchHit]: Matching horoscopes.
+        """
+        words: set[str]         = HoroSearch.tokenize(text=text)
+        if not words:
+            return []
+
+        self.__refresh()
+        since: int              = (datetime.today() - timedelta(days=days)).toordinal() << 8
+        found: np.ndarray | None = None
+        with self.__lock:
+            for w in words:
+                docs: np.ndarray = self.__matching(prefix=w, since=since)
+                found            = docs if found is None else np.intersect1d(found, docs, assume_unique=True)
+                if not len(found):
+                    return []
+
+        # Filters on the packed IDs
+        if sign is not None:
+            found               = found[(found & 0b1111) == list(ZodiacSign).index(sign)]
+        if source is not None:
+            found               = found[(found >> 6 & 0b11) == list(Source).index(source)]
+        return [SearchHit(doc=int(doc)) for doc in found[::-1]]
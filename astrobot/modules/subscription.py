@@ -0,0 +1,213 @@
+# External
+import logging, asyncio
+import time as timer
+import aiosqlite
+from typing import Awaitable, Callable
+# Internal
+from astrobot.core.astrology import ZodiacSign
+from astrobot.modules.common import Day, Source, Style
+from astrobot.modules.horoscope import Horo, HoroItem
+
+
+class Subscription:
+    """A channel's subscription to a daily horoscope.
+    """
+    def __init__(self,
+                 guild_id: int,
+                 channel_id: int,
+                 sign: ZodiacSign,
+                 source: Source         = Source.astrology_com,
+                 style: Style           = Style.daily
+                 ) -> None:
+        """A channel's subscription to a daily horoscope.
+
+        Args:
+            guild_id (int): Discord ID of the guild the channel belongs to.
+            channel_id (int): Discord ID of the channel to post in.
+            sign (ZodiacSign): Zodiac sign.
+            source (Source, optional): Source of horoscope. Defaults to Source.astrology_com.
+            style (Style, optional): Style of horoscope. Defaults to Style.daily.
+        """
+        self.guild_id: int          = guild_id
+        self.channel_id: int        = channel_id
+        self.sign: ZodiacSign       = sign
+        self.source: Source         = source
+
+        if style not in source.styles:
+            self.style = source.default_style
+        else:
+            self.style = style
+
+    @property
+    def key(self) -> tuple[Source, Style, ZodiacSign]:
+        """The fetch combination for this subscription. Subscriptions sharing a key share a single fetch.
+
+        Returns:
+            tuple[Source, Style, ZodiacSign]: Source, style and sign of the subscription.
+        """
+        return self.source, self.style, self.sign
+
+class SubscriptionStore:
+    """Local SQLite store for horoscope subscriptions.
+    """
+    def __init__(self, path: str = "astrobot_subscriptions.sqlite") -> None:
+        """Local SQLite store for horoscope subscriptions.
+
+        Args:
+            path (str, optional): Path of the database file. Defaults to "astrobot_subscriptions.sqlite".
+        """
+        self.path: str      = path
+        self.__ready: bool  = False
+
+    async def __connect(self) -> aiosqlite.Connection:
+        """Open a connection to the database, creating the table on first use.
+
+        Returns:
+            aiosqlite.Connection: An open connection, close it when done.
+        """
+        db: aiosqlite.Connection = await aiosqlite.connect(self.path)
+
+        if not self.__ready:
+            await db.execute("""CREATE TABLE IF NOT EXISTS subscriptions (
+                                    guild_id    INTEGER NOT NULL,
+                                    channel_id  INTEGER NOT NULL,
+                                    sign        TEXT NOT NULL,
+                                    source      TEXT NOT NULL,
+                                    style       TEXT NOT NULL,
+                                    PRIMARY KEY (channel_id, sign, source, style))""")
+            await db.commit()
+            self.__ready = True
+
+        return db
+
+    async def add(self, sub: Subscription) -> bool:
+        """Add a subscription.
+
+        Args:
+            sub (Subscription): The subscription to add.
+
+        Returns:
+            bool: True if added, False if the channel already had this subscription.
+        """
+        db: aiosqlite.Connection = await self.__connect()
+        try:
+            cursor = await db.execute("INSERT OR IGNORE INTO subscriptions VALUES (?, ?, ?, ?, ?)",
+                                      (sub.guild_id, sub.channel_id, sub.sign.name, sub.source.name, sub.style.name))
+            await db.commit()
+            return cursor.rowcount > 0
+        finally:
+            await db.close()
+
+    async def remove(self, channel_id: int, sign: ZodiacSign | None = None) -> int:
+        """Remove subscriptions from a channel.
+
+        Args:
+            channel_id (int): Discord ID of the channel.
+            sign (ZodiacSign | None, optional): Only remove subscriptions for this sign. Defaults to None, remove all.
+
+        Returns:
+            int: Number of subscriptions removed.
+        """
+        db: aiosqlite.Connection = await self.__connect()
+        try:
+            if sign is None:
+                cursor = await db.execute("DELETE FROM subscriptions WHERE channel_id = ?", (channel_id,))
+            else:
+                cursor = await db.execute("DELETE FROM subscriptions WHERE channel_id = ? AND sign = ?", (channel_id, sign.name))
+            await db.commit()
+            return cursor.rowcount
+        finally:
+            await db.close()
+
+    async def list_all(self, guild_id: int | None = None) -> list[Subscription]:
+        """List stored subscriptions.
+
+        Args:
+            guild_id (int | None, optional): Only list subscriptions for this guild. Defaults to None, list all.
+
+        Returns:
+            list[Subscription]: A list of subscriptions.
+        """
+        db: aiosqlite.Connection = await self.__connect()
+        try:
+            if guild_id is None:
+                cursor = await db.execute("SELECT guild_id, channel_id, sign, source, style FROM subscriptions")
+            else:
+                cursor = await db.execute("SELECT guild_id, channel_id, sign, source, style FROM subscriptions WHERE guild_id = ?", (guild_id,))
+            rows = await cursor.fetchall()
+        finally:
+            await db.close()
+
+        return [Subscription(guild_id=row[0], channel_id=row[1], sign=ZodiacSign[row[2]], source=Source[row[3]], style=Style[row[4]]) for row in rows]
+
+class Broadcast:
+    """Posts today's horoscope to every subscribed channel. Each unique source/style/sign is fetched once.
+    """
+    fetch_limit: int        = 8     # Concurrent horoscope fetches
+    batch_size: int         = 25    # Messages sent per batch
+    batch_interval: float   = 1.0   # Seconds between batches, keeps us well under the global 50/s limit
+
+    def __init__(self, store: SubscriptionStore) -> None:
+        """Posts today's horoscope to every subscribed channel. Each unique source/style/sign is fetched once.
+
+        Args:
+            store (SubscriptionStore): Store holding the subscriptions.
+        """
+        self.store: SubscriptionStore   = store
+
+    async def __fetch(self, key: tuple[Source, Style, ZodiacSign], limit: asyncio.Semaphore) -> Horo | None:
+        """Fetch a single horoscope for a subscription key.
+
+        Args:
+            key (tuple[Source, Style, ZodiacSign]): Source, style and sign to fetch.
+            limit (asyncio.Semaphore): Semaphore bounding concurrent fetches.
+
+        Returns:
+            Horo | None: The horoscope, or None if it couldn't be fetched.
+        """
+        source, style, sign = key
+        async with limit:
+            try:
+                return await HoroItem(day=Day.today, source=source, style=style, sign=sign).fetch()
+            except Exception as e:
+                logging.error("*** Broadcast fetch error for %s/%s/%s: %s", source.name, style.name, sign.name, str(e))
+                return None
+
+    async def run(self, send: Callable[[int, str], Awaitable[bool]]) -> None:
+        """Run the broadcast.
+
+        Args:
+            send (Callable[[int, str], Awaitable[bool]]): Coroutine sending a message to a channel ID, returns True on success.
+        """
+        logging.info("Broadcasting daily horoscopes...")
+        tic = timer.perf_counter()
+
+        # Group subscribers by fetch combination
+        groups: dict[tuple[Source, Style, ZodiacSign], list[Subscription]] = {}
+        for sub in await self.store.list_all():
+            groups.setdefault(sub.key, []).append(sub)
+
+        # Fetch each combination once
+        limit: asyncio.Semaphore    = asyncio.Semaphore(Broadcast.fetch_limit)
+        keys: list                  = list(groups.keys())
+        horos: list[Horo | None]    = await asyncio.gather(*[self.__fetch(key=key, limit=limit) for key in keys])
+
+        # Fan out to subscribers
+        messages: list[tuple[int, str]] = []
+        for key, hor in zip(keys, horos):
+            if hor is None:
+                continue
+            content: str = hor.get_formatted_string()
+            messages += [(sub.channel_id, content) for sub in groups[key]]
+
+        # Send in rate-limited batches
+        sent: int = 0
+        for i in range(0, len(messages), Broadcast.batch_size):
+            if i > 0:
+                await asyncio.sleep(Broadcast.batch_interval)
+            batch   = messages[i:i + Broadcast.batch_size]
+            results = await asyncio.gather(*[send(channel_id, content) for channel_id, content in batch], return_exceptions=True)
+            sent    += sum(1 for r in results if r is True)
+
+        toc = timer.perf_counter()
+        logging.info("Broadcast completed! %d fetches, %d/%d messages sent. %0.3fs", len(keys), sent, len(messages), toc - tic)
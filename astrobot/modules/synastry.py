@@ -0,0 +1,166 @@
+# External
+import logging, asyncio
+import time as timer
+import numpy as np
+import pandas as pd
+from kerykeion import KerykeionPointModel
+from kerykeion.settings.kerykeion_settings import get_settings
+# Internal
+from astrobot.core.cache import Cache
+from astrobot.core.logs import Logs
+from astrobot.modules.chart import ChartUser, GeoLookup
+
+
+class Synastry:
+    """Aspects between two natal charts, for compatibility.
+
+    Every point of one chart is compared with every point of the other at once, as an N×M matrix of angular distances.
+    Aspect orbs are tested against the whole matrix, one aspect type at a time.
+    """
+    columns: dict[str, list[str]]   = {"Aspects":   ["Planet 1", "Aspect", "Planet 2"],
+                                       "Summary":   ["Aspect", "Count"]}
+    settings                        = get_settings()
+    points: list[str]               = [p["name"] for p in settings.celestial_points if p["is_active"]]
+    aspects: list[dict]             = [{"name": a["name"], "degree": a["degree"], "orb": a["orb"]} for a in settings.aspects]
+    page_rows: int                  = 50    # Table rows per embed, keeps each page under Discord's description limit
+
+    def __init__(self, first: ChartUser, second: ChartUser) -> None:
+        """Aspects between two natal charts, for compatibility.
+
+        Args:
+            first (ChartUser): First person's chart, "Planet 1".
+            second (ChartUser): Second person's chart, "Planet 2".
+        """
+        self.first: ChartUser                   = first
+        self.second: ChartUser                  = second
+
+        # Absolute positions of the same active points kerykeion uses for aspects
+        self.first_pos: np.ndarray              = Synastry.positions(user=first)
+        self.second_pos: np.ndarray             = Synastry.positions(user=second)
+
+        # Aspect index for every pair, -1 for none
+        self.matrix: np.ndarray                 = Synastry.aspect_matrix(a=self.first_pos, b=self.second_pos)
+        self.build_data: dict[str, pd.DataFrame] = {"Aspects":  self.__build_aspects_data(),
+                                                    "Summary":  self.__build_summary_data()}
+
+    @staticmethod
+    def positions(user: ChartUser) -> np.ndarray:
+        """Absolute positions of a chart's active points.
+
+        Args:
+            user (ChartUser): A chart.
+
+        Returns:
+            np.ndarray: Degrees 0-360, in the order of points.
+        """
+        found: dict[str, KerykeionPointModel] = user.planets | user.houses
+        return np.array([found[name].abs_pos for name in Synastry.points], dtype=float)
+
+    @staticmethod
+    def aspect_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Find the aspect between every pair of points, matching kerykeion's rules.
+
+        Kerykeion takes the first aspect in its settings whose orb holds the whole degrees of the angular distance.
+        Only aspects in ChartUser.aspect_filter are kept.
+
+        Args:
+            a (np.ndarray): N positions, in degrees.
+            b (np.ndarray): M positions, in degrees.
+
+        Returns:
+            np.ndarray: N×M aspect indexes into Synastry.aspects, -1 where there's no aspect.
+        """
+        # Angular distance, 0-180, truncated like kerykeion
+        diff: np.ndarray        = np.abs(a[:, None] - b[None, :]) % 360.0
+        distance: np.ndarray    = np.floor(np.minimum(diff, 360.0 - diff))
+
+        # First matching aspect wins, as in kerykeion
+        matrix: np.ndarray      = np.full(distance.shape, -1, dtype=int)
+        for aid, aspect in enumerate(Synastry.aspects):
+            hit: np.ndarray     = (matrix == -1) & (np.abs(distance - aspect["degree"]) <= aspect["orb"])
+            matrix[hit]         = aid
+
+        # Drop minor aspects after matching, so they still shadow major ones
+        keep: np.ndarray        = np.array([a["name"] in ChartUser.aspect_filter for a in Synastry.aspects])
+        matrix[(matrix >= 0) & ~keep[np.maximum(matrix, 0)]] = -1
+        return matrix
+
+    def __build_aspects_data(self) -> pd.DataFrame:
+        """Build DataFrame object for the aspects table.
+
+        Returns:
+            pd.DataFrame: A pandas DataFrame object.
+        """
+        rows, cols = np.nonzero(self.matrix >= 0)
+        df = pd.DataFrame({"Planet 1":  [ChartUser.point_name(Synastry.points[r]) for r in rows],
+                           "Aspect":    [Synastry.aspects[self.matrix[r, c]]["name"] for r, c in zip(rows, cols)],
+                           "Planet 2":  [ChartUser.point_name(Synastry.points[c]) for c in cols]})
+        return df
+
+    def __build_summary_data(self) -> pd.DataFrame:
+        """Build DataFrame object for the summary table, a count per aspect type.
+
+        Returns:
+            pd.DataFrame: A pandas DataFrame object.
+        """
+        counts: np.ndarray  = np.bincount(self.matrix[self.matrix >= 0], minlength=len(Synastry.aspects))
+        names: list[str]    = [a["name"] for a in Synastry.aspects]
+        df = pd.DataFrame({"Aspect":    ChartUser.aspect_filter,
+                           "Count":     [str(counts[names.index(a)]) for a in ChartUser.aspect_filter]})
+        return df
+
+    def get_tables_as_str(self) -> dict[str, str]:
+        """Get all tables as a string.
+
+        Returns:
+            dict[str, str]: Table name to a multi-line string formatted by PrettyTable.
+        """
+        return {name: ChartUser.render_table(columns=Synastry.columns[name], df=df) for name, df in self.build_data.items()}
+
+    @staticmethod
+    def paginate(table: str) -> list[str]:
+        """Split a table into pages of page_rows rows, each with the header and bottom border.
+
+        Args:
+            table (str): Multi-line string formatted by PrettyTable.
+
+        Returns:
+            list[str]: One or more tables.
+        """
+        lines: list[str]    = table.split("\n")
+        head, body, foot    = lines[:3], lines[3:-1], lines[-1:]
+        return ["\n".join(head + body[i:i + Synastry.page_rows] + foot) for i in range(0, max(len(body), 1), Synastry.page_rows)]
+
+    @staticmethod
+    async def get_cached_tables(geo_api: str, first: dict[str, str], second: dict[str, str]) -> dict[str, str]:
+        """Get all tables as a string, memoized in the cache by both people's locations and birth dates/times.
+
+        Args:
+            geo_api (str): API key for Geocoder, used by GeoLookup class.
+            first (dict[str, str]): First person, keys "name", "location", "birthday" and "time".
+            second (dict[str, str]): Second person, same keys.
+
+        Returns:
+            dict[str, str]: Table name to a multi-line string formatted by PrettyTable.
+        """
+        lookups: list[GeoLookup]        = list(await asyncio.gather(GeoLookup.fetch(geo_api=geo_api, query=first["location"]),
+                                                                    GeoLookup.fetch(geo_api=geo_api, query=second["location"])))
+        key: str                        = "synastry:" + ":".join(f"{l.latitude:.4f}:{l.longitude:.4f}:{l.timezone}:{p['birthday']}:{p['time']}"
+                                                                 for l, p in zip(lookups, (first, second)))
+        tables: dict[str, str] | None   = await Cache.backend.get(key=key)
+        if tables is not None:
+            Logs.requests.info("Synastry retrieved from cache")
+            return tables
+
+        # Build both charts off the event loop
+        def build() -> dict[str, str]:
+            users: list[ChartUser]      = [ChartUser(geo_api=geo_api, lookup=l, **p) for l, p in zip(lookups, (first, second))]
+            return Synastry(first=users[0], second=users[1]).get_tables_as_str()
+
+        tic = timer.perf_counter()
+        tables                          = await asyncio.to_thread(build)
+        toc = timer.perf_counter()
+        logging.info("Synastry computed. %0.3fs", toc - tic)
+
+        await Cache.backend.set(key=key, value=tables)
+        return tables
@@ -0,0 +1,128 @@
+# External
+import logging, asyncio
+import time as timer
+from datetime import datetime, timezone
+from kerykeion import AstrologicalSubject, NatalAspects, KerykeionPointModel
+import pandas as pd
+# Internal
+from astrobot.core.astrology import ZodiacSign
+from astrobot.modules.chart import ChartUser
+
+
+class Transits:
+    """Where the planets are on a given day, for everyone. Today's snapshot is computed once and served from memory.
+    """
+    columns: dict[str, list[str]]   = {"Planets":   ["Planet", "Sign", "Position"],
+                                       "Aspects":   ["Planet 1", "Aspect", "Planet 2"]}
+    __snapshot: "Transits | None"   = None
+    __lock: asyncio.Lock | None     = None
+
+    def __init__(self, date: datetime) -> None:
+        """Where the planets are on a given day, for everyone.
+
+        Args:
+            date (datetime): Day to compute, positions are taken at 12:00 UTC.
+        """
+        self.date: datetime                             = datetime(date.year, date.month, date.day, 12, 0)
+
+        # Positions don't depend on place, only houses do, so use Greenwich and leave houses out
+        subject: AstrologicalSubject                    = AstrologicalSubject(name="Transits",
+                                                                              year=self.date.year,
+                                                                              month=self.date.month,
+                                                                              day=self.date.day,
+                                                                              hour=self.date.hour,
+                                                                              minute=self.date.minute,
+                                                                              lat=51.4769,
+                                                                              lng=0.0,
+                                                                              tz_str="UTC",
+                                                                              city="Greenwich",
+                                                                              nation="GB",
+                                                                              online=False)
+        self.planets: dict[str, KerykeionPointModel]    = ChartUser.get_planets(subject=subject)
+        self.build_data: dict[str, pd.DataFrame]        = {"Planets":   self.__build_planet_data(),
+                                                           "Aspects":   self.__build_aspects_data(subject=subject)}
+        self.tables: dict[str, str]                     = {name: ChartUser.render_table(columns=Transits.columns[name], df=df)
+                                                           for name, df in self.build_data.items()}
+
+    def __build_planet_data(self) -> pd.DataFrame:
+        """Build DataFrame object for the planets table.
+
+        Returns:
+            pd.DataFrame: A pandas DataFrame object.
+        """
+        # Setup column lists
+        planets: list   = []
+        signs: list     = []
+        positions: list = []
+
+        for name, planet in self.planets.items():
+            # Skip unwanted planets
+            if name == "Mean_Node":
+                continue
+
+            # Set retrograde
+            ret: str = ""
+            if planet.retrograde:
+                ret = " R"
+
+            # Prepare strings and assign data to row
+            sign: ZodiacSign    = ChartUser.kery_signs[planet.sign]
+            planets.append(ChartUser.point_name(name))
+            signs.append(sign.symbol + " " + sign.full)
+            positions.append(str("{:.2f}".format(planet.position)) + "°" + ret)
+
+        # Create and return DataFrame
+        df = pd.DataFrame({"Planet": planets, "Sign": signs, "Position": positions})
+        return df
+
+    def __build_aspects_data(self, subject: AstrologicalSubject) -> pd.DataFrame:
+        """Build DataFrame object for the aspects table. Aspects to houses depend on place, so they're left out.
+
+        Args:
+            subject (AstrologicalSubject): Kerykeion object containing all calculations.
+
+        Returns:
+            pd.DataFrame: A pandas DataFrame object.
+        """
+        # Setup column lists
+        p1: list = []
+        asp: list = []
+        p2: list = []
+
+        # Iterate through aspects in the filter list, planets only
+        for aspect in ChartUser.filter_aspects(all_aspects=NatalAspects(user=subject).all_aspects):
+            if aspect["p1_name"] in ChartUser.housename or aspect["p2_name"] in ChartUser.housename:
+                continue
+            p1.append(ChartUser.point_name(aspect["p1_name"]))
+            asp.append(aspect["aspect"])
+            p2.append(ChartUser.point_name(aspect["p2_name"]))
+
+        # Create and return DataFrame
+        df = pd.DataFrame({"Planet 1": p1, "Aspect": asp, "Planet 2": p2})
+        return df
+
+    @staticmethod
+    async def today() -> "Transits":
+        """Get today's snapshot (UTC), computing it once per day.
+
+        Returns:
+            Transits: Today's transits.
+        """
+        now: datetime = datetime.now(timezone.utc)
+        snapshot: Transits | None = Transits.__snapshot
+        if snapshot is not None and snapshot.date.date() == now.date():
+            return snapshot
+
+        # One build per day, concurrent callers wait for it
+        if Transits.__lock is None:
+            Transits.__lock = asyncio.Lock()
+        async with Transits.__lock:
+            snapshot = Transits.__snapshot
+            if snapshot is None or snapshot.date.date() != now.date():
+                tic = timer.perf_counter()
+                snapshot = await asyncio.to_thread(Transits, date=now)
+                Transits.__snapshot = snapshot
+                toc = timer.perf_counter()
+                logging.info("Transits computed for %s. %0.3fs", now.date(), toc - tic)
+
+        return snapshot
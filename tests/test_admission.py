@@ -0,0 +1,177 @@
+# External
+import asyncio
+from collections import deque
+import pytest
+# Internal
+from astrobot.bot.loadtest import FakeClient, FakeContext, FakeUser
+from astrobot.core import admission
+from astrobot.core.admission import Admission, TokenBucket
+
+
+class Clock:
+    """Stands in for time.monotonic(), moved by hand.
+    """
+    def __init__(self) -> None:
+        self.now: float = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock: Clock = Clock()
+    monkeypatch.setattr(admission.timer, "monotonic", clock.monotonic)
+    return clock
+
+@pytest.fixture(autouse=True)
+def limits():
+    """Fresh limits and an empty line for each test, restored afterwards.
+    """
+    saved: tuple = (Admission.concurrency, Admission.queue_size, Admission.user_limit, Admission.guild_limit)
+    Admission.running   = 0
+    Admission.waiting   = deque()
+    Admission.configure(concurrency=4, queue_size=32, user_limit="3/60", guild_limit="30/60")
+    yield
+    Admission.running   = 0
+    Admission.waiting   = deque()
+    Admission.configure(concurrency=saved[0], queue_size=saved[1], user_limit=f"{saved[2][0]}/{saved[2][1]}",
+                        guild_limit=f"{saved[3][0]}/{saved[3][1]}")
+
+def context(user: int) -> FakeContext:
+    return FakeContext(user=FakeUser(id=user), client=FakeClient())
+
+class Handler:
+    """A command handler behind the limits, that runs until released.
+    """
+    def __init__(self) -> None:
+        self.gate: asyncio.Event    = asyncio.Event()
+        self.started: int           = 0
+
+    @Admission.limited(command="chart")
+    async def chart(self, ctx) -> None:
+        self.started += 1
+        await self.gate.wait()
+        await ctx.send("chart")
+
+def test_bucket_refill(clock):
+    bucket: TokenBucket = TokenBucket(capacity=3, period=60.0)
+    for _ in range(3):
+        assert bucket.wait() == 0.0
+        bucket.take()
+    assert bucket.wait() == pytest.approx(20.0)
+    assert not bucket.full
+
+    # Refills evenly, one request every 20 seconds, up to capacity
+    clock.now += 10.0
+    assert bucket.wait() == pytest.approx(10.0)
+    assert bucket.wait(cost=0.5) == 0.0
+    clock.now += 10.0
+    assert bucket.wait() == 0.0
+    clock.now += 3600.0
+    assert bucket.full and bucket.tokens == 3
+
+    bucket.take()
+    bucket.give()
+    bucket.give()
+    assert bucket.tokens == 3
+
+def test_rate_limit(clock):
+    async def test() -> None:
+        handler: Handler    = Handler()
+        handler.gate.set()
+        contexts: list      = [context(user=1) for _ in range(4)]
+        for ctx in contexts:
+            await handler.chart(ctx)
+        assert handler.started == 3
+        assert "Slow down" in contexts[3].sent[0]["content"] and contexts[3].sent[0]["ephemeral"]
+
+        # Another user has a bucket of their own, and the first gets one more after it refills a little
+        await handler.chart(context(user=2))
+        clock.now += 20.0
+        await handler.chart(context(user=1))
+        assert handler.started == 5
+    asyncio.run(test())
+
+def test_queue():
+    Admission.configure(concurrency=1, queue_size=1, user_limit="10/60", guild_limit="30/60")
+
+    async def test() -> None:
+        handler: Handler    = Handler()
+        contexts: list      = [context(user=user) for user in range(3)]
+        tasks: list         = [asyncio.create_task(handler.chart(ctx)) for ctx in contexts[:2]]
+        await asyncio.sleep(0)
+
+        # The first runs, the second is told its place in line, and with the line full the third is turned away
+        assert handler.started == 1 and Admission.running == 1 and len(Admission.waiting) == 1
+        assert contexts[0].deferred and contexts[1].deferred
+        assert "number 1 in line" in contexts[1].sent[0]["content"]
+        await handler.chart(contexts[2])
+        assert "busy" in contexts[2].sent[0]["content"] and contexts[2].sent[0]["ephemeral"]
+
+        handler.gate.set()
+        await asyncio.gather(*tasks)
+        assert handler.started == 2 and Admission.running == 0 and not Admission.waiting
+        assert contexts[1].sent[-2:] == [{"content": "chart"}, {"deleted": "@original"}]
+    asyncio.run(test())
+
+def test_queue_cancel():
+    Admission.configure(concurrency=1, queue_size=4, user_limit="10/60", guild_limit="30/60")
+
+    async def test() -> None:
+        handler: Handler    = Handler()
+        tasks: list         = [asyncio.create_task(handler.chart(context(user=user))) for user in range(3)]
+        await asyncio.sleep(0)
+        assert len(Admission.waiting) == 2
+
+        # A request that gives up leaves the line, the others still get their turn
+        tasks[1].cancel()
+        await asyncio.sleep(0)
+        assert len(Admission.waiting) == 1
+        handler.gate.set()
+        await asyncio.gather(tasks[0], tasks[2])
+        assert handler.started == 2 and Admission.running == 0 and not Admission.waiting
+    asyncio.run(test())
+
+def test_send_private():
+    async def test() -> None:
+        ctx: FakeContext = context(user=1)
+        await Admission.send_private(ctx=ctx, content="first")
+        assert ctx.sent == [{"content": "first", "ephemeral": True}]
+
+        # After a public defer, the placeholder goes and the reply is private
+        ctx = context(user=1)
+        await ctx.defer()
+        await Admission.send_private(ctx=ctx, content="bad date")
+        assert ctx.sent == [{"deleted": "@original"}, {"content": "bad date", "ephemeral": True}]
+    asyncio.run(test())
+
+def test_slot():
+    Admission.configure(concurrency=1, queue_size=4, user_limit="10/60", guild_limit="30/60")
+
+    async def test() -> None:
+        inside: list[int] = []
+
+        # Inside an admitted request, its own slot is used
+        @Admission.limited(command="chart")
+        async def chart(self, ctx) -> None:
+            async with Admission.slot():
+                inside.append(Admission.running)
+        await chart(None, context(user=1))
+        assert inside == [1] and Admission.running == 0
+
+        # Otherwise it waits for a free slot, quietly
+        handler: Handler        = Handler()
+        ctx: FakeContext        = context(user=2)
+        running: asyncio.Task   = asyncio.create_task(handler.chart(ctx))
+        await asyncio.sleep(0)
+
+        async def flip() -> None:
+            async with Admission.slot():
+                inside.append(Admission.running)
+        page: asyncio.Task = asyncio.create_task(flip())
+        await asyncio.sleep(0)
+        assert inside == [1] and len(Admission.waiting) == 1 and ctx.sent == []
+        handler.gate.set()
+        await asyncio.gather(running, page)
+        assert inside == [1, 1] and Admission.running == 0 and not Admission.waiting
+    asyncio.run(test())
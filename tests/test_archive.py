@@ -0,0 +1,52 @@
+# External
+import asyncio
+from datetime import datetime
+# Internal
+from astrobot.core.astrology import ZodiacSign
+from astrobot.core.common import Misc
+from astrobot.modules.archive import HoroArchive
+from astrobot.modules.common import Source, Style
+from astrobot.modules.horoscope import CacheStatus, Horo
+
+
+def horo(date: str, source: Source, style: Style, sign: ZodiacSign, text: str) -> Horo:
+    return Horo(cache=CacheStatus(cached=False, expires=datetime.now()), sign=sign, date=date, text=text,
+                url=f"https://example.com/{source.name}/{style.name}/{sign.name}/{date}", source=source, style=style)
+
+def test_round_trip(tmp_path):
+    dates: list[datetime]   = [datetime(2026, 9, 30), datetime(2026, 10, 1), datetime(2026, 10, 19)]
+    horos: list[Horo]       = [horo(date=Misc.get_date_string(date=date), source=source, style=style, sign=sign,
+                                    text=f"{sign.name} {style.name} — déjà vu on {date:%d %B}, " * 20)
+                               for date in dates for source in Source for style in source.styles for sign in ZodiacSign]
+    archive: HoroArchive    = HoroArchive(path=str(tmp_path / "archive"))
+    asyncio.run(archive.add(horos=horos))
+
+    # Every horoscope reads back as written, from a segment per month
+    for hor in horos:
+        date: datetime = Misc.get_date_from_string(string=hor.date)
+        assert archive.get(date=date, source=hor.source, style=hor.style, sign=hor.sign) == \
+            {"date": hor.date, "text": hor.text, "url": hor.url}
+    assert sorted(path.name for path in (tmp_path / "archive").glob("*.z")) == ["2026-09.z", "2026-10.z"]
+    assert archive.get(date=datetime(2026, 10, 2), source=Source.astrostyle, style=Style.daily, sign=ZodiacSign.leo) is None
+
+    # Archived once, and reopened from the index
+    size: int = (tmp_path / "archive" / "index.bin").stat().st_size
+    asyncio.run(archive.add(horos=horos[:10]))
+    assert (tmp_path / "archive" / "index.bin").stat().st_size == size == len(horos) * HoroArchive.record.size
+    reopened: HoroArchive = HoroArchive(path=str(tmp_path / "archive"))
+    assert reopened.entries == archive.entries
+    assert reopened.get(date=dates[2], source=horos[-1].source, style=horos[-1].style, sign=horos[-1].sign)["text"] == horos[-1].text
+
+def test_unreadable_date(tmp_path):
+    archive: HoroArchive = HoroArchive(path=str(tmp_path / "archive"))
+    asyncio.run(archive.add(horos=[horo(date="Today", source=Source.astrostyle, style=Style.daily, sign=ZodiacSign.leo, text="Skipped")]))
+    assert archive.entries == {}
+
+def test_other_writer(tmp_path):
+    # Another process's appends are found on a miss
+    first: HoroArchive      = HoroArchive(path=str(tmp_path / "archive"))
+    second: HoroArchive     = HoroArchive(path=str(tmp_path / "archive"))
+    hor: Horo               = horo(date="October 19, 2026", source=Source.horoscope_com, style=Style.daily_love,
+                                   sign=ZodiacSign.aries, text="Written by the other worker.")
+    asyncio.run(second.add(horos=[hor]))
+    assert first.get(date=datetime(2026, 10, 19), source=hor.source, style=hor.style, sign=hor.sign)["text"] == hor.text
@@ -0,0 +1,108 @@
+# External
+import asyncio, os, uuid
+from datetime import datetime, timedelta
+import pytest
+# Internal
+from astrobot.core.cache import CacheBackend, MemoryCache, SQLiteCache, RedisCache
+
+
+# Point at another server with TEST_REDIS_URL, a database of its own keeps tests away from the bot's keys
+REDIS_URL: str = os.getenv("TEST_REDIS_URL", default="redis://localhost:6379/15")
+
+def redis_reachable() -> bool:
+    """Whether a Redis server answers at REDIS_URL.
+
+    Returns:
+        bool: True if it answered a ping.
+    """
+    try:
+        from redis import from_url
+        client = from_url(REDIS_URL, socket_connect_timeout=0.5)
+        try:
+            return bool(client.ping())
+        finally:
+            client.close()
+    except Exception:
+        return False
+
+def drop_namespace(namespace: str) -> None:
+    """Delete a test's keys from the Redis server.
+
+    Args:
+        namespace (str): Key prefix used by the test.
+    """
+    from redis import from_url
+    client = from_url(REDIS_URL)
+    try:
+        keys: list = list(client.scan_iter(match=f"{namespace}*"))
+        if keys:
+            client.delete(*keys)
+    finally:
+        client.close()
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def make_backend(request, tmp_path):
+    """Factory for a backend of each kind. SQLite and Redis instances from one factory share their storage, like
+    processes sharing a cache.
+    """
+    if request.param == "redis" and not redis_reachable():
+        pytest.skip(f"No Redis server at {REDIS_URL}")
+    namespace: str = f"astrobot-test-{uuid.uuid4().hex}"
+    if request.param == "redis":
+        request.addfinalizer(lambda: drop_namespace(namespace=namespace))
+    factories = {"memory":  MemoryCache,
+                 "sqlite":  lambda: SQLiteCache(path=str(tmp_path / "cache")),
+                 "redis":   lambda: RedisCache(url=REDIS_URL, namespace=namespace)}
+    return factories[request.param]
+
+def run(backend: CacheBackend, test) -> None:
+    """Run a test coroutine against a backend, closing it afterwards.
+    """
+    async def main() -> None:
+        try:
+            await test(backend)
+        finally:
+            await backend.close()
+    asyncio.run(main())
+
+def test_get_missing(make_backend):
+    async def test(cache: CacheBackend) -> None:
+        assert await cache.get(key="missing") is None
+    run(make_backend(), test)
+
+def test_set_get_delete(make_backend):
+    async def test(cache: CacheBackend) -> None:
+        value: dict = {"sign": "leo", "degrees": [1.5, 2.25], "when": datetime(2024, 7, 4, 14, 30)}
+        await cache.set(key="chart:leo", value=value)
+        assert await cache.get(key="chart:leo") == value
+
+        await cache.set(key="chart:leo", value="replaced")
+        assert await cache.get(key="chart:leo") == "replaced"
+
+        await cache.delete(key="chart:leo")
+        assert await cache.get(key="chart:leo") is None
+    run(make_backend(), test)
+
+def test_expiry(make_backend):
+    async def test(cache: CacheBackend) -> None:
+        await cache.set(key="expired", value=1, expires=datetime.now() - timedelta(seconds=5))
+        await cache.set(key="fresh", value=2, expires=datetime.now() + timedelta(hours=1))
+        await cache.set(key="forever", value=3)
+        assert await cache.get(key="expired") is None
+        assert await cache.get(key="fresh") == 2
+        assert await cache.get(key="forever") == 3
+    run(make_backend(), test)
+
+def test_close(make_backend):
+    async def write(cache: CacheBackend) -> None:
+        await cache.set(key="geo:paris", value={"city": "Paris"})
+
+    async def read(cache: CacheBackend) -> None:
+        assert await cache.get(key="geo:paris") == {"city": "Paris"}
+
+    # Shared backends keep values for the next instance, closing twice is harmless
+    first: CacheBackend = make_backend()
+    run(first, write)
+    asyncio.run(first.close())
+    if not isinstance(first, MemoryCache):
+        run(make_backend(), read)
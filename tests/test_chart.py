@@ -0,0 +1,46 @@
+# External
+import pytest
+# Internal
+from astrobot.modules.chart import BirthInput, ChartError
+
+
+@pytest.mark.parametrize("birthday, birthtime, expected", [
+    ("07/04/1976",          "14:30",    ("07/04/1976", "14:30")),
+    (" 7/4/1976 ",          " 9:05 ",   ("07/04/1976", "09:05")),
+    ("07/04/1976",          "",         ("07/04/1976", "00:00")),
+    ("July 4, 1976",        "2:30 pm",  ("07/04/1976", "14:30")),
+    ("25/12/1990",          "11pm",     ("12/25/1990", "23:00")),
+    ("1976-07-04",          "9h15",     ("07/04/1976", "09:15")),
+])
+def test_parse(birthday, birthtime, expected):
+    assert BirthInput.parse(location="Paris", birthday=birthday, birthtime=birthtime) == ("Paris", *expected)
+
+def test_parse_location():
+    assert BirthInput.parse(location="  New   York ", birthday="07/04/1976")[0] == "New York"
+    with pytest.raises(ChartError, match="empty"):
+        BirthInput.parse(location="   ", birthday="07/04/1976")
+    with pytest.raises(ChartError, match="too long"):
+        BirthInput.parse(location="x" * (BirthInput.max_location + 1), birthday="07/04/1976")
+
+@pytest.mark.parametrize("birthday, message", [
+    ("02/30/1990",  "Couldn't read"),       # Not a real day, and no fuzzy reading of it either
+    ("tomorrow",    "Couldn't read"),
+    ("July 1976",   "month, day and year"),  # The parser would make up the day
+    ("07/04",       "month, day and year"),  # ... or the year
+    ("07/04/1799",  "between"),
+    ("07/04/2400",  "between"),
+])
+def test_parse_bad_date(birthday, message):
+    with pytest.raises(ChartError, match=message):
+        BirthInput.parse(location="Paris", birthday=birthday)
+
+@pytest.mark.parametrize("birthtime, message", [
+    ("25:00",   "out of range"),
+    ("12:60",   "out of range"),
+    ("noon",    "Couldn't find a time"),
+    ("14",      "Couldn't find a time"),    # A lone number would be read as a day
+    ("14.30",   "Couldn't find a time"),
+])
+def test_parse_bad_time(birthtime, message):
+    with pytest.raises(ChartError, match=message):
+        BirthInput.parse(location="Paris", birthday="07/04/1976", birthtime=birthtime)
@@ -0,0 +1,75 @@
+# External
+from pathlib import Path
+import pytest
+# Internal
+from astrobot.modules.gazetteer import Gazetteer, PlaceIndex
+
+
+# A few GeoNames rows: namesakes, an accented name, a mountain and a town without a timezone that are left out
+CITIES: Path = Path(__file__).parent / "fixtures" / "cities.txt"
+
+@pytest.fixture(scope="module")
+def gazetteer() -> Gazetteer:
+    return Gazetteer(path=str(CITIES))
+
+@pytest.fixture
+def places(monkeypatch, gazetteer):
+    """The gazetteer as the process-wide one, and no remembered places, for PlaceIndex.
+    """
+    monkeypatch.setattr(Gazetteer, "index", gazetteer)
+    monkeypatch.setattr(PlaceIndex, "_PlaceIndex__keys", [])
+    monkeypatch.setattr(PlaceIndex, "_PlaceIndex__queries", {})
+
+def place(found: dict | None) -> tuple[str, str, str] | None:
+    return None if found is None else (found["city"], found["raw"]["admin1"], found["country"])
+
+def test_load(gazetteer):
+    assert len(gazetteer.names) == 9
+    assert "Paris Mountain" not in gazetteer.names and "Parisville" not in gazetteer.names
+    assert gazetteer.find(query="Parisville") is None
+
+@pytest.mark.parametrize("query, expected", [
+    ("Paris",                   ("Paris", "11", "FR")),     # Most populous first
+    ("  paris ,  france ",      ("Paris", "11", "FR")),
+    ("Paris, TX",               ("Paris", "TX", "US")),
+    ("Paris, US",               ("Paris", "TX", "US")),
+    ("Paris, TN, United States", ("Paris", "TN", "US")),
+    ("Springfield",             ("Springfield", "MO", "US")),
+    ("Springfield, IL",         ("Springfield", "IL", "US")),
+    ("springfield, ma, usa",    ("Springfield", "MA", "US")),
+    ("SAO PAULO",               ("São Paulo", "27", "BR")),
+    ("São Paulo, Brazil",       ("São Paulo", "27", "BR")),
+    ("Lyons",                   None),                      # Alternate names aren't indexed
+    ("Paris, IT",               None),
+    ("Springfield, TX",         None),
+    ("Atlantis",                None),
+])
+def test_find(gazetteer, query, expected):
+    assert place(gazetteer.find(query=query)) == expected
+
+def test_find_fields(gazetteer):
+    assert gazetteer.find(query="Lyon") == {"raw":          {"geonameid": 2996944, "name": "Lyon", "admin1": "84", "population": 522969},
+                                            "latitude":     45.74846,
+                                            "longitude":    4.84671,
+                                            "city":         "Lyon",
+                                            "country":      "FR",
+                                            "timezone":     "Europe/Paris"}
+
+def test_complete(gazetteer):
+    labels: list[str] = [gazetteer.label(row=row) for row in gazetteer.complete(prefix="par")]
+    assert labels == ["Paris, FR", "Parma, IT", "Paris, TX, US", "Paris, TN, US"]
+    assert [gazetteer.label(row=row) for row in gazetteer.complete(prefix="par", limit=2)] == labels[:2]
+    assert [gazetteer.names[row] for row in gazetteer.complete(prefix="")][:2] == ["São Paulo", "Paris"]
+    assert gazetteer.complete(prefix="zz") == []
+
+def test_label(gazetteer):
+    # Each label finds its own place again
+    for row in range(len(gazetteer.names)):
+        assert gazetteer.find(query=gazetteer.label(row=row))["raw"]["geonameid"] == int(gazetteer.ids[row])
+
+def test_suggest(places):
+    PlaceIndex.remember(query="Paris, Texas")
+    assert PlaceIndex.suggest(text="Par") == ["Paris, Texas", "Paris, FR", "Parma, IT", "Paris, TX, US", "Paris, TN, US"]
+    assert PlaceIndex.suggest(text="paris, t") == ["Paris, Texas", "Paris, TX, US", "Paris, TN, US"]
+    assert PlaceIndex.suggest(text="Par", limit=2) == ["Paris, Texas", "Paris, FR"]
+    assert PlaceIndex.recent() == ["Paris, Texas"]
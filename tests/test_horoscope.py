@@ -0,0 +1,143 @@
+# External
+import asyncio
+from collections import deque
+from pathlib import Path
+import pytest
+# Internal
+from astrobot.core.astrology import ZodiacSign
+from astrobot.modules.common import Day, Source, Style
+from astrobot.modules.horoscope import FetchPlan, HoroItem, PageSection
+
+
+# Pages saved in each source's layout: the parsed sections, then a long tail that streaming shouldn't read
+PAGES: Path = Path(__file__).parent / "fixtures" / "pages"
+
+class FakeResponse:
+    """Stands in for a CachedResponse from Get.get().
+    """
+    def __init__(self, text: str) -> None:
+        self.body: str      = text
+        self.expires        = None
+
+    async def text(self) -> str:
+        return self.body
+
+def load_page(source: Source) -> str:
+    return (PAGES / f"{source.name}.html").read_text(encoding="utf-8")
+
+def stream(source: Source, page: str, chunk: int) -> tuple[PageSection, int]:
+    """Feed a page to a PageSection in chunks, like Get streams it, until its sections have closed.
+
+    Returns:
+        tuple[PageSection, int]: The parser, and characters fed before it was done.
+    """
+    section: PageSection    = PageSection(source=source)
+    fed: int                = 0
+    while fed < len(page) and not section.done:
+        section.feed(page[fed:fed + chunk])
+        fed += chunk
+    return section, min(fed, len(page))
+
+def parse(source: Source, text: str) -> tuple[str, str]:
+    item: HoroItem = HoroItem(day=Day.today, source=source, style=Style.daily, sign=ZodiacSign.leo)
+    return item.parse_response(source=source, day=Day.today, text=text)
+
+@pytest.mark.parametrize("chunk", [1, 100, 8192])
+@pytest.mark.parametrize("source", list(Source))
+def test_page_section(source, chunk):
+    page: str       = load_page(source=source)
+    section, fed    = stream(source=source, page=page, chunk=chunk)
+
+    # Stops early, with only the sections, closed, and parses the same as the whole page
+    assert section.done
+    assert fed < page.index('<section id="related">') + chunk
+    assert "Related reading" not in section.fragment and "FOOTER-MARKER" not in section.fragment
+    assert section.fragment.count("<p") == section.fragment.count("</p>")
+    assert parse(source=source, text=section.fragment) == parse(source=source, text=page)
+
+def test_page_section_text():
+    section, _ = stream(source=Source.astrology_com, page=load_page(source=Source.astrology_com), chunk=100)
+    assert parse(source=Source.astrology_com, text=section.fragment) == \
+        ("Oct 19, 2026", "Plans you’ve put off come together today, Leo. Say yes to the invitation — it leads somewhere good.")
+
+    section, _ = stream(source=Source.horoscope_com, page=load_page(source=Source.horoscope_com), chunk=100)
+    assert parse(source=Source.horoscope_com, text=section.fragment) == \
+        ("October 19, 2026", "A well-timed word settles an old disagreement. Listen first - then speak & act.")
+
+def astrostyle_items() -> list[HoroItem]:
+    # AstroStyle has one style, so both styles of a sign share a page
+    return [HoroItem(day=Day.today, source=Source.astrostyle, style=style, sign=sign) for sign in ZodiacSign for style in Style]
+
+def test_fetch_plan_urls():
+    items: list[HoroItem]   = astrostyle_items()
+    plan: FetchPlan         = FetchPlan(items=items)
+    assert len(plan.urls) == len(ZodiacSign)
+    assert plan.ratio == 2.0
+    assert all(len(group) == 2 and group[0].url == group[1].url == url for url, group in plan.urls.items())
+    assert FetchPlan(items=[]).ratio == 1.0
+
+def test_fetch_plan_fetch(monkeypatch):
+    page: str               = load_page(source=Source.astrostyle)
+    fetched: list[str]      = []
+    parsed: list[str]       = []
+    parse_response          = HoroItem.parse_response
+
+    async def get(self, url: str = "") -> FakeResponse:
+        fetched.append(self.url)
+        return FakeResponse(text=page)
+
+    def counted(self, source: Source, day: Day, text: str) -> tuple[str, str]:
+        parsed.append(self.url)
+        return parse_response(self, source=source, day=day, text=text)
+
+    monkeypatch.setattr(HoroItem, "get", get)
+    monkeypatch.setattr(HoroItem, "parse_response", counted)
+    plan: FetchPlan = FetchPlan(items=astrostyle_items())
+    horos: list     = asyncio.run(plan.fetch())
+
+    # One fetch and one parse per page, fanned out to both items
+    assert sorted(fetched) == sorted(parsed) == sorted(plan.urls)
+    assert len(horos) == len(plan.items) and plan.failed == 0
+    assert {hor.style for hor in horos} == {Style.daily}
+
+def test_fetch_plan_claim_queued():
+    plan: FetchPlan     = FetchPlan(items=astrostyle_items())
+    urls: list[str]     = list(plan.urls)
+    plan.queue          = deque(urls[:3])
+
+    async def test() -> None:
+        await plan.claim(url=urls[1])
+        await plan.claim(url=urls[5])   # Not queued, nothing to take
+    asyncio.run(test())
+    assert list(plan.queue) == [urls[0], urls[2]]
+    assert plan.claimed == 1
+
+def test_fetch_plan_claim_in_flight(monkeypatch):
+    fetched: list[str] = []
+
+    async def test() -> None:
+        gate: asyncio.Event = asyncio.Event()
+
+        async def get(self, url: str = "") -> FakeResponse:
+            fetched.append(self.url)
+            await gate.wait()
+            return FakeResponse(text="")
+
+        monkeypatch.setattr(HoroItem, "get", get)
+        monkeypatch.setattr(FetchPlan, "concurrency", 1)
+        plan: FetchPlan     = FetchPlan(items=astrostyle_items()[:6])
+        warm: asyncio.Task  = asyncio.create_task(plan.precache())
+        while not plan.inflight:
+            await asyncio.sleep(0)
+        assert FetchPlan.active is plan and len(plan.inflight) == 1
+
+        # A request for the page being fetched waits for it instead of fetching it again
+        claim: asyncio.Task = asyncio.create_task(plan.claim(url=next(iter(plan.inflight))))
+        await asyncio.sleep(0.01)
+        assert not claim.done()
+        gate.set()
+        await claim
+        await warm
+        assert sorted(fetched) == sorted(plan.urls) and plan.claimed == 0
+        assert FetchPlan.active is None
+    asyncio.run(test())
@@ -0,0 +1,70 @@
+# External
+import asyncio
+from datetime import datetime, timedelta
+# Internal
+from astrobot.core.astrology import ZodiacSign
+from astrobot.core.common import Misc
+from astrobot.modules.common import Source, Style
+from astrobot.modules.horoscope import CacheStatus, Horo
+from astrobot.modules.search import HoroSearch, SearchHit
+
+
+def horo(days_ago: int, source: Source, sign: ZodiacSign, text: str) -> Horo:
+    date: str = Misc.get_date_string(date=datetime.today() - timedelta(days=days_ago))
+    return Horo(cache=CacheStatus(cached=False, expires=datetime.now()), sign=sign, date=date, text=text, source=source, style=Style.daily)
+
+# Three horoscopes mention travel, one of them a week and a half ago
+HOROS: list[Horo] = [horo(days_ago=0, source=Source.astrology_com, sign=ZodiacSign.leo, text="Travel plans come together, and money follows."),
+                     horo(days_ago=1, source=Source.horoscope_com, sign=ZodiacSign.leo, text="A traveler brings news about money."),
+                     horo(days_ago=2, source=Source.astrostyle, sign=ZodiacSign.aries, text="Rest, and let the travelling wait."),
+                     horo(days_ago=10, source=Source.astrology_com, sign=ZodiacSign.leo, text="Old travel stories resurface."),
+                     horo(days_ago=0, source=Source.astrostyle, sign=ZodiacSign.virgo, text="Your home is calm and quiet today.")]
+
+def found(hits: list[SearchHit]) -> list[tuple[str, Source, ZodiacSign]]:
+    return [(Misc.get_date_string(date=hit.date), hit.source, hit.sign) for hit in hits]
+
+def expected(*indexes: int) -> list[tuple[str, Source, ZodiacSign]]:
+    return [(HOROS[i].date, HOROS[i].source, HOROS[i].sign) for i in indexes]
+
+def check(index: HoroSearch) -> None:
+    """Searches that should give the same results from the delta log, a merged generation or a reopened index.
+    """
+    async def test() -> None:
+        # Prefix matches, newest first, each horoscope once
+        assert found(await index.search(text="trav")) == expected(0, 1, 2)
+        assert found(await index.search(text="trav", days=14)) == expected(0, 1, 2, 3)
+        assert found(await index.search(text="travel money")) == expected(0, 1)
+        assert found(await index.search(text="trav", sign=ZodiacSign.leo)) == expected(0, 1)
+        assert found(await index.search(text="trav", source=Source.astrostyle)) == expected(2)
+        assert found(await index.search(text="quiet")) == expected(4)
+
+        # Unknown words, and only stopwords or short words
+        assert await index.search(text="travel submarine") == []
+        assert await index.search(text="the and of") == []
+    asyncio.run(test())
+
+def test_tokenize():
+    assert HoroSearch.tokenize(text="You'll FIND that the Moon's light, at last, is yours.") == {"you'll", "find", "moon's", "light", "last", "yours"}
+
+def test_round_trip(tmp_path):
+    index: HoroSearch = HoroSearch(path=str(tmp_path / "search"))
+    asyncio.run(index.add(horos=HOROS))
+    check(index=index)
+    assert index.generation == -1 and len(index.docs) == len(HOROS)
+
+    # Indexed once
+    asyncio.run(index.add(horos=HOROS[:2]))
+    assert len(index.docs) == len(HOROS)
+
+    # Read back from the delta log, then from a merged generation
+    check(index=HoroSearch(path=str(tmp_path / "search")))
+    asyncio.run(index.merge())
+    assert index.generation >= 0 and not index.docs and len(index.base_docs) == len(HOROS)
+    check(index=index)
+    check(index=HoroSearch(path=str(tmp_path / "search")))
+
+    # New horoscopes go to the delta log on top of the generation, and same-day hits keep their source order
+    light: Horo = horo(days_ago=0, source=Source.horoscope_com, sign=ZodiacSign.virgo, text="Travel light.")
+    asyncio.run(index.add(horos=[light]))
+    assert found(asyncio.run(index.search(text="travel", days=1))) == \
+        expected(0) + [(light.date, light.source, light.sign)] + expected(1)
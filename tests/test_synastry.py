@@ -0,0 +1,54 @@
+# External
+import numpy as np
+import pytest
+from kerykeion import AstrologicalSubject, SynastryAspects
+from kerykeion.aspects.aspects_utils import get_active_points_list, get_aspect_from_two_points
+# Internal
+from astrobot.modules.chart import ChartUser
+from astrobot.modules.synastry import Synastry
+
+
+def expected(a: list[float], b: list[float]) -> np.ndarray:
+    """Kerykeion's aspect for each pair of points, one pair at a time, as aspect indexes like Synastry.aspect_matrix.
+    """
+    matrix: np.ndarray = np.full((len(a), len(b)), -1, dtype=int)
+    for row, first in enumerate(a):
+        for col, second in enumerate(b):
+            aspect: dict = get_aspect_from_two_points(Synastry.settings.aspects, first, second)
+            if aspect["verdict"] and aspect["name"] in ChartUser.aspect_filter:
+                matrix[row, col] = aspect["aid"]
+    return matrix
+
+def test_matrix_random():
+    rng: np.random.Generator    = np.random.default_rng(seed=2026)
+    a: np.ndarray               = rng.uniform(0.0, 360.0, size=len(Synastry.points))
+    b: np.ndarray               = rng.uniform(0.0, 360.0, size=200)
+    assert np.array_equal(Synastry.aspect_matrix(a=a, b=b), expected(a=list(a), b=list(b)))
+
+def test_matrix_edges():
+    # Exact aspects, both sides of each orb, across 0°, and fractions that kerykeion truncates
+    base: list[float]   = [0.0, 359.9, 0.5, 180.0, 90.25]
+    offsets: list       = sorted({aspect["degree"] + side * (aspect["orb"] + extra)
+                                  for aspect in Synastry.aspects for side in (-1, 1) for extra in (0.0, 0.4, 0.99, 1.0)})
+    b: list[float]      = [(first + offset) % 360.0 for first in base for offset in offsets] + base
+    assert np.array_equal(Synastry.aspect_matrix(a=np.array(base), b=np.array(b)), expected(a=base, b=b))
+
+@pytest.mark.parametrize("first, second", [
+    (("A", 1990, 5, 17, 8, 15, 2.3522, 48.8566, "Europe/Paris", "Paris", "FR"),
+     ("B", 1985, 11, 2, 22, 40, -74.006, 40.7128, "America/New_York", "New York", "US")),
+    (("C", 2001, 1, 1, 0, 0, 139.6917, 35.6895, "Asia/Tokyo", "Tokyo", "JP"),
+     ("D", 1970, 7, 20, 12, 30, -46.6333, -23.5505, "America/Sao_Paulo", "Sao Paulo", "BR")),
+])
+def test_matrix_charts(first, second):
+    subjects: list = [AstrologicalSubject(*person[:6], lng=person[6], lat=person[7], tz_str=person[8], city=person[9],
+                                          nation=person[10], online=False) for person in (first, second)]
+    points: list = [get_active_points_list(subject, Synastry.settings) for subject in subjects]
+    assert [point.name for point in points[0]] == Synastry.points
+
+    # Same aspects between the same points as kerykeion's synastry
+    matrix: np.ndarray  = Synastry.aspect_matrix(a=np.array([p.abs_pos for p in points[0]]), b=np.array([p.abs_pos for p in points[1]]))
+    found: set          = {(Synastry.points[row], Synastry.aspects[matrix[row, col]]["name"], Synastry.points[col])
+                           for row, col in zip(*np.nonzero(matrix >= 0))}
+    wanted: set         = {(aspect.p1_name, aspect.aspect, aspect.p2_name) for aspect in SynastryAspects(*subjects).all_aspects
+                           if aspect.aspect in ChartUser.aspect_filter}
+    assert found == wanted and found